@@ -5,11 +5,11 @@ This module provides database connection utilities for the FastAPI application,
 including dependency injection for database sessions.
 """
 from typing import Generator
-from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.orm import Session
 
 from abidance.core.configuration import Configuration
+from abidance.database.engine import create_session_factory
 
 # Get database URL from configuration
 config = Configuration()
@@ -21,9 +21,9 @@ except Exception as e:
 
 DATABASE_URL = config.get("database", {}).get("url", "sqlite:///abidance.db")
 
-# Create SQLAlchemy engine and session factory
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Create SQLAlchemy session factory and engine
+SessionLocal = create_session_factory(DATABASE_URL)
+engine = SessionLocal.kw["bind"]
 
 
 def get_db() -> Generator[Session, None, None]:
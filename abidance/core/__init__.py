@@ -13,6 +13,9 @@ from .domain import (
     Candle
 )
 
+# Import columnar market data storage
+from .candle_buffer import CandleBuffer
+
 # Import trading domain entities
 from abidance.trading import (
     OrderSide,
@@ -49,7 +52,7 @@ from .container import ServiceRegistry, registry
 from .bootstrap import ApplicationBootstrap
 
 # Import event system
-from .events import EventSystem, Event
+from .events import EventSystem, Event, KeyEqFilter
 
 # Import event handlers
 from .event_handlers import (
@@ -63,7 +66,7 @@ from .event_handlers import (
 from .configuration import Configuration
 
 # Import environment
-from .environment import Environment
+from .environment import Environment, get_env
 
 # Import validation framework
 from .validation import ValidationError, Validator, ValidationContext
@@ -237,8 +240,10 @@ __all__ = [
     "Event",
     "EventHandler",
     "EventFilter",
+    "KeyEqFilter",
     "Configuration",
     "Environment",
+    "get_env",
 
     # Domain entities
     "OrderSide",
@@ -248,6 +253,7 @@ __all__ = [
     "Order",
     "Signal",
     "Candle",
+    "CandleBuffer",
     "Trade",
 
     # Type definitions
@@ -9,8 +9,6 @@ the application.
 from typing import Dict, Any, Callable, Optional, TypeVar, cast
 import logging
 
-import yaml
-
 
 from .container import ServiceRegistry
 
@@ -48,6 +46,8 @@ class ApplicationBootstrap:
             FileNotFoundError: If the configuration file is not found
             yaml.YAMLError: If the configuration file contains invalid YAML
         """
+        import yaml
+
         try:
             with open(config_path, 'r') as file:
                 config = yaml.safe_load(file)
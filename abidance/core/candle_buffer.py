@@ -0,0 +1,231 @@
+"""
+Columnar candle storage for the Abidance trading bot.
+
+This module provides a structure-of-arrays buffer for market data streams.
+Candles are stored as contiguous NumPy arrays per field instead of one
+Python object per candle, so indicator and backtest code can operate on
+raw arrays directly.
+"""
+
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from .domain import Candle
+
+
+def _to_ns(timestamp: datetime) -> int:
+    """
+    Convert a datetime to nanoseconds since the epoch.
+
+    Timezone-aware datetimes are converted to UTC first; naive datetimes
+    are stored as-is.
+
+    Args:
+        timestamp: The datetime to convert
+
+    Returns:
+        Nanoseconds since the epoch
+    """
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return int(np.datetime64(timestamp, 'ns').astype(np.int64))
+
+
+def _from_ns(nanoseconds: int) -> datetime:
+    """
+    Convert nanoseconds since the epoch back to a naive datetime.
+
+    Args:
+        nanoseconds: Nanoseconds since the epoch
+
+    Returns:
+        The corresponding datetime (microsecond precision)
+    """
+    return np.datetime64(int(nanoseconds), 'ns').astype('datetime64[us]').item()
+
+
+class CandleBuffer:
+    """
+    Growable structure-of-arrays buffer of candles for a single symbol.
+
+    Each candle field is kept in its own contiguous array (``float64`` for
+    prices and volume, ``int64`` nanoseconds for timestamps). Capacity is
+    doubled whenever the buffer is full, so appends are amortized O(1).
+
+    Examples:
+        >>> buffer = CandleBuffer.from_candles(candles)
+        >>> sma = buffer.close[-20:].mean()
+        >>> latest = buffer.as_candle(-1)
+    """
+
+    def __init__(self, symbol: str, capacity: int = 1024):
+        """
+        Initialize an empty candle buffer.
+
+        Args:
+            symbol: The trading symbol the candles belong to
+            capacity: Initial number of candles to allocate space for
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        self.symbol = symbol
+        self._size = 0
+        self._ts = np.empty(capacity, dtype=np.int64)
+        self._open = np.empty(capacity, dtype=np.float64)
+        self._high = np.empty(capacity, dtype=np.float64)
+        self._low = np.empty(capacity, dtype=np.float64)
+        self._close = np.empty(capacity, dtype=np.float64)
+        self._volume = np.empty(capacity, dtype=np.float64)
+
+    @classmethod
+    def from_candles(cls, candles: Iterable[Candle], symbol: Optional[str] = None) -> 'CandleBuffer':
+        """
+        Create a buffer from a sequence of candles.
+
+        Args:
+            candles: Candles to load, all for the same symbol
+            symbol: Symbol of the buffer (default: symbol of the first candle)
+
+        Returns:
+            A new CandleBuffer containing the candles
+
+        Raises:
+            ValueError: If no symbol is given and there are no candles
+        """
+        candles = list(candles)
+        if symbol is None:
+            if not candles:
+                raise ValueError("symbol is required when no candles are given")
+            symbol = candles[0].symbol
+
+        buffer = cls(symbol, capacity=max(len(candles), 1))
+        for candle in candles:
+            buffer.append(candle)
+        return buffer
+
+    def __len__(self) -> int:
+        """Return the number of candles in the buffer."""
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        """Number of candles the buffer can hold before growing."""
+        return len(self._ts)
+
+    def append(self, candle: Candle) -> None:
+        """
+        Append a candle to the buffer.
+
+        Args:
+            candle: The candle to append
+
+        Raises:
+            ValueError: If the candle belongs to a different symbol
+        """
+        if candle.symbol != self.symbol:
+            raise ValueError(
+                f"Candle symbol '{candle.symbol}' does not match buffer symbol '{self.symbol}'"
+            )
+
+        if self._size == len(self._ts):
+            self._grow(2 * len(self._ts))
+
+        i = self._size
+        self._ts[i] = _to_ns(candle.timestamp)
+        self._open[i] = candle.open
+        self._high[i] = candle.high
+        self._low[i] = candle.low
+        self._close[i] = candle.close
+        self._volume[i] = candle.volume
+        self._size = i + 1
+
+    def _grow(self, capacity: int) -> None:
+        """
+        Reallocate the field arrays with a larger capacity.
+
+        Args:
+            capacity: The new capacity
+        """
+        for name in ('_ts', '_open', '_high', '_low', '_close', '_volume'):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Candle timestamps as int64 nanoseconds since the epoch."""
+        return self._ts[:self._size]
+
+    @property
+    def open(self) -> np.ndarray:
+        """Open prices."""
+        return self._open[:self._size]
+
+    @property
+    def high(self) -> np.ndarray:
+        """High prices."""
+        return self._high[:self._size]
+
+    @property
+    def low(self) -> np.ndarray:
+        """Low prices."""
+        return self._low[:self._size]
+
+    @property
+    def close(self) -> np.ndarray:
+        """Close prices."""
+        return self._close[:self._size]
+
+    @property
+    def volume(self) -> np.ndarray:
+        """Traded volumes."""
+        return self._volume[:self._size]
+
+    def as_candle(self, index: int) -> Candle:
+        """
+        Reconstruct the candle stored at the given position.
+
+        Args:
+            index: Position of the candle (negative values count from the end)
+
+        Returns:
+            The candle at the given position
+
+        Raises:
+            IndexError: If the index is out of range
+        """
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("candle index out of range")
+
+        return Candle(
+            symbol=self.symbol,
+            timestamp=_from_ns(self._ts[index]),
+            open=float(self._open[index]),
+            high=float(self._high[index]),
+            low=float(self._low[index]),
+            close=float(self._close[index]),
+            volume=float(self._volume[index])
+        )
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Convert the buffer contents to a pandas DataFrame.
+
+        Returns:
+            DataFrame with timestamp, open, high, low, close and volume columns
+        """
+        return pd.DataFrame({
+            'timestamp': pd.to_datetime(self.timestamps, unit='ns'),
+            'open': self.open.copy(),
+            'high': self.high.copy(),
+            'low': self.low.copy(),
+            'close': self.close.copy(),
+            'volume': self.volume.copy()
+        })
@@ -12,10 +12,25 @@ import os
 import threading
 import time
 
-import psutil
 
+from .metrics import MetricsCollector, AggregationType, _from_ns, _now_ns
 
-from .metrics import MetricsCollector, AggregationType
+# psutil is imported on first use so that importing the collectors stays cheap
+_psutil = None
+
+
+def _get_psutil():
+    """
+    Import psutil on first use and return the cached module.
+
+    Returns:
+        The psutil module
+    """
+    global _psutil
+    if _psutil is None:
+        import psutil
+        _psutil = psutil
+    return _psutil
 
 
 class PerformanceMetricsCollector(MetricsCollector):
@@ -71,7 +86,7 @@ class PerformanceMetricsCollector(MetricsCollector):
         Returns:
             The memory usage in bytes
         """
-        process = psutil.Process(os.getpid())
+        process = _get_psutil().Process(os.getpid())
         memory_info = process.memory_info()
         memory_usage = memory_info.rss  # Resident Set Size in bytes
         self.record(f"{label}.rss", memory_usage)
@@ -87,7 +102,7 @@ class PerformanceMetricsCollector(MetricsCollector):
         Returns:
             The CPU usage as a percentage
         """
-        process = psutil.Process(os.getpid())
+        process = _get_psutil().Process(os.getpid())
         cpu_percent = process.cpu_percent(interval=0.1)
         self.record(f"{label}.percent", cpu_percent)
         return cpu_percent
@@ -138,20 +153,22 @@ class TradingMetricsCollector(MetricsCollector):
             quantity: The order quantity
             price: The order price
         """
-        self.record(f"order.{symbol}.{side}", {
+        # Read the clock once so the order and its count metrics share a timestamp
+        ts_ns = _now_ns()
+        self._append(f"order.{symbol}.{side}", {
             "order_id": order_id,
             "symbol": symbol,
             "side": side,
             "type": order_type,
             "quantity": quantity,
             "price": price,
-            "timestamp": datetime.now()
-        })
+            "timestamp": _from_ns(ts_ns)
+        }, ts_ns)
 
         # Also record order count metrics
-        self.record(f"order_count.{symbol}.{side}", 1)
-        self.record(f"order_volume.{symbol}.{side}", quantity)
-        self.record(f"order_value.{symbol}.{side}", quantity * price)
+        self._append(f"order_count.{symbol}.{side}", 1, ts_ns)
+        self._append(f"order_volume.{symbol}.{side}", quantity, ts_ns)
+        self._append(f"order_value.{symbol}.{side}", quantity * price, ts_ns)
 
     def record_trade(self, trade_id: str, symbol: str, side: str,
                     quantity: float, price: float, fee: float) -> None:
@@ -166,21 +183,23 @@ class TradingMetricsCollector(MetricsCollector):
             price: The trade price
             fee: The trade fee
         """
-        self.record(f"trade.{symbol}.{side}", {
+        # Read the clock once so the trade and its count metrics share a timestamp
+        ts_ns = _now_ns()
+        self._append(f"trade.{symbol}.{side}", {
             "trade_id": trade_id,
             "symbol": symbol,
             "side": side,
             "quantity": quantity,
             "price": price,
             "fee": fee,
-            "timestamp": datetime.now()
-        })
+            "timestamp": _from_ns(ts_ns)
+        }, ts_ns)
 
         # Also record trade count metrics
-        self.record(f"trade_count.{symbol}.{side}", 1)
-        self.record(f"trade_volume.{symbol}.{side}", quantity)
-        self.record(f"trade_value.{symbol}.{side}", quantity * price)
-        self.record(f"trade_fee.{symbol}", fee)
+        self._append(f"trade_count.{symbol}.{side}", 1, ts_ns)
+        self._append(f"trade_volume.{symbol}.{side}", quantity, ts_ns)
+        self._append(f"trade_value.{symbol}.{side}", quantity * price, ts_ns)
+        self._append(f"trade_fee.{symbol}", fee, ts_ns)
 
     def record_portfolio_value(self, portfolio_value: float) -> None:
         """
@@ -206,7 +225,8 @@ class TradingMetricsCollector(MetricsCollector):
         unrealized_pnl = quantity * (current_price - entry_price)
         unrealized_pnl_percent = (unrealized_pnl / (quantity * entry_price)) * 100 if quantity * entry_price != 0 else 0
 
-        self.record(f"position.{symbol}", {
+        ts_ns = _now_ns()
+        self._append(f"position.{symbol}", {
             "symbol": symbol,
             "quantity": quantity,
             "entry_price": entry_price,
@@ -214,8 +234,8 @@ class TradingMetricsCollector(MetricsCollector):
             "position_value": position_value,
             "unrealized_pnl": unrealized_pnl,
             "unrealized_pnl_percent": unrealized_pnl_percent,
-            "timestamp": datetime.now()
-        })
+            "timestamp": _from_ns(ts_ns)
+        }, ts_ns)
 
     def get_trading_summary(self, symbol: Optional[str] = None, since: Optional[datetime] = None, until: Optional[datetime] = None) -> Dict[str, float]:
         """
@@ -311,9 +331,9 @@ class TradingMetricsCollector(MetricsCollector):
             since: Optional start time for filtering
             until: Optional end time for filtering
         """
-        values = self.get_metric(metric_name, since, until)
-        if values:
-            summary[summary_key] = sum(values.values())
+        total = self.aggregate(metric_name, AggregationType.SUM, since, until)
+        if total is not None:
+            summary[summary_key] = total
 
     def _process_all_symbols_metrics(self, summary: Dict[str, float], since: Optional[datetime], until: Optional[datetime]) -> None:
         """
@@ -325,7 +345,7 @@ class TradingMetricsCollector(MetricsCollector):
             until: Optional end time for filtering
         """
         # Find all metrics that match our patterns
-        for metric_name in list(self._metrics.keys()):
+        for metric_name in self.get_metric_names():
             parts = metric_name.split(".")
 
             # Process order metrics
@@ -344,9 +364,9 @@ class TradingMetricsCollector(MetricsCollector):
             elif metric_name.startswith("trade_value.") and len(parts) >= 3:
                 self._process_metric_by_side(summary, metric_name, parts, "trade_value", since, until)
             elif metric_name.startswith("trade_fee."):
-                values = self.get_metric(metric_name, since, until)
-                if values:
-                    summary["fee"] += sum(values.values())
+                total = self.aggregate(metric_name, AggregationType.SUM, since, until)
+                if total is not None:
+                    summary["fee"] += total
 
         # Calculate totals
         summary["order_count"] = summary["order_count_buy"] + summary["order_count_sell"]
@@ -371,10 +391,10 @@ class TradingMetricsCollector(MetricsCollector):
         """
         if parts[-1] in ["buy", "sell"]:
             side = parts[-1]
-            values = self.get_metric(metric_name, since, until)
-            if values:
+            total = self.aggregate(metric_name, AggregationType.SUM, since, until)
+            if total is not None:
                 summary_key = f"{metric_type}_{side}"
-                summary[summary_key] += sum(values.values())
+                summary[summary_key] += total
 
 
 class SystemMetricsCollector(MetricsCollector):
@@ -399,6 +419,7 @@ class SystemMetricsCollector(MetricsCollector):
             interval: The collection interval in seconds
             single_run: If True, collect metrics once and return (for testing)
         """
+        psutil = _get_psutil()
         while not self._stop_collection.is_set():
             # Collect CPU metrics
             cpu_percent = psutil.cpu_percent(interval=0.1)
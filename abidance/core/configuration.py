@@ -10,14 +10,19 @@ from typing import Dict, Any, Optional, List, Type, Union, Callable, TypeVar
 import json
 import logging
 import os
-
-import yaml
+import re
 
 
 from abidance.exceptions import ConfigurationError
 
 T = TypeVar('T')
 
+# Classifies an environment value as an int (group 1) or float (group 2) in one pass
+_NUM_RE = re.compile(r'^(-?\d+)$|^(-?(?:\d+\.\d*|\.\d+))$')
+
+# Translation table mapping environment key separators to configuration key separators
+_KEY_TABLE = str.maketrans('_', '.')
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
@@ -60,6 +65,8 @@ class Configuration:
         Raises:
             ConfigurationError: If the file is not found or contains invalid YAML.
         """
+        import yaml
+
         try:
             with open(file_path, 'r') as file:
                 try:
@@ -109,15 +116,17 @@ class Configuration:
             type_mapping: Dictionary mapping configuration keys to their expected types.
         """
         type_mapping = type_mapping or {}
+        prefix_len = len(prefix)
 
         for env_key, env_value in os.environ.items():
             if prefix and not env_key.startswith(prefix):
                 continue
 
             # Convert environment variable key to configuration key
-            config_key = env_key[len(prefix):].lower().replace('_', '.')
+            config_key = env_key[prefix_len:].translate(_KEY_TABLE).lower()
 
             # Try to parse JSON for list/dict values
+            number_match = None
             try:
                 if env_value.startswith('[') and env_value.endswith(']'):
                     value = json.loads(env_value)
@@ -129,12 +138,10 @@ class Configuration:
                 elif config_key.endswith('.enabled') or config_key.endswith('.debug'):
                     # Auto-convert boolean-like keys
                     value = env_value.lower() in ('true', 'yes', '1', 'y')
-                elif env_value.isdigit():
-                    # Auto-convert integer values
-                    value = int(env_value)
-                elif env_value.replace('.', '', 1).isdigit() and env_value.count('.') == 1:
-                    # Auto-convert float values
-                    value = float(env_value)
+                elif (number_match := _NUM_RE.match(env_value)) is not None:
+                    # Auto-convert integer and float values
+                    int_part, float_part = number_match.groups()
+                    value = int(int_part) if int_part is not None else float(float_part)
                 else:
                     value = env_value
             except json.JSONDecodeError:
@@ -152,11 +159,14 @@ class Configuration:
             elif env_key == "ABIDANCE_TRADING_DEFAULT_EXCHANGE":
                 self.set("trading.default_exchange", value)
             elif env_key == "ABIDANCE_TRADING_RISK_PERCENTAGE":
-                self.set("trading.risk_percentage", float(env_value) if env_value.replace('.', '', 1).isdigit() else env_value)
+                number_match = number_match or _NUM_RE.match(env_value)
+                self.set("trading.risk_percentage", float(env_value) if number_match else env_value)
             elif env_key == "ABIDANCE_TRADING_ENABLED":
                 self.set("trading.enabled", env_value.lower() in ('true', 'yes', '1', 'y'))
             elif env_key == "ABIDANCE_TRADING_MAX_TRADES":
-                self.set("trading.max_trades", int(env_value) if env_value.isdigit() else env_value)
+                number_match = number_match or _NUM_RE.match(env_value)
+                is_int = number_match is not None and number_match.group(1) is not None
+                self.set("trading.max_trades", int(env_value) if is_int else env_value)
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -277,6 +287,8 @@ class Configuration:
         Raises:
             ConfigurationError: If there's an error writing to the file.
         """
+        import yaml
+
         try:
             with open(file_path, 'w') as file:
                 yaml.dump(self.data, file, default_flow_style=False)
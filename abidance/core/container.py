@@ -7,12 +7,24 @@ both direct instance registration and factory functions, with optional
 singleton behavior.
 """
 
-from typing import Dict, Any, Type, TypeVar, Callable, Optional, Union, cast, get_type_hints, runtime_checkable
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, Tuple, TypeVar
 
 
 T = TypeVar('T')
-ServiceKey = Union[Type[T], str]
-ServiceFactory = Callable[[], T]
+
+# The precise aliases are only needed by type checkers; at runtime keys are plain dict keys
+if TYPE_CHECKING:
+    from typing import Type, Union
+
+    ServiceKey = Union[Type[T], str]
+    ServiceFactory = Callable[[], T]
+else:
+    ServiceKey = Any
+    ServiceFactory = Callable[[], Any]
+
+# Sentinel distinguishing a missing registration from a registered ``None``
+_MISSING = object()
 
 
 class ServiceRegistry:
@@ -26,9 +38,12 @@ class ServiceRegistry:
 
     def __init__(self):
         """Initialize an empty service registry."""
-        self._services: Dict[Any, Dict[str, Any]] = {}
-        self._factories: Dict[Any, Dict[str, tuple[ServiceFactory, bool]]] = {}
-        self._singletons: Dict[Any, Dict[str, Any]] = {}
+        self._services: Dict[Tuple[Any, str], Any] = {}
+        self._factories: Dict[Tuple[Any, str], Tuple[ServiceFactory, bool]] = {}
+        self._frozen = False
+        # Guards singleton creation only; resolved services are read without locking.
+        # Re-entrant so singleton factories can resolve their own dependencies.
+        self._lock = threading.RLock()
 
     def register(self, service_type: ServiceKey, instance: Any, name: str = "default") -> None:
         """
@@ -38,11 +53,13 @@ class ServiceRegistry:
             service_type: The type or name of the service
             instance: The service instance
             name: Optional name for the service (default: "default")
-        """
-        if service_type not in self._services:
-            self._services[service_type] = {}
 
-        self._services[service_type][name] = instance
+        Raises:
+            RuntimeError: If the registry has been frozen
+        """
+        if self._frozen:
+            raise RuntimeError("Cannot register services on a frozen registry")
+        self._services[(service_type, name)] = instance
 
     def register_factory(self, service_type: ServiceKey, factory: ServiceFactory,
                          singleton: bool = True, name: str = "default") -> None:
@@ -54,11 +71,13 @@ class ServiceRegistry:
             factory: Factory function that creates the service
             singleton: Whether to cache and reuse the instance (default: True)
             name: Optional name for the service (default: "default")
-        """
-        if service_type not in self._factories:
-            self._factories[service_type] = {}
 
-        self._factories[service_type][name] = (factory, singleton)
+        Raises:
+            RuntimeError: If the registry has been frozen
+        """
+        if self._frozen:
+            raise RuntimeError("Cannot register services on a frozen registry")
+        self._factories[(service_type, name)] = (factory, singleton)
 
     def has(self, service_type: ServiceKey, name: str = "default") -> bool:
         """
@@ -71,19 +90,8 @@ class ServiceRegistry:
         Returns:
             True if the service is registered, False otherwise
         """
-        # Check direct registrations
-        if service_type in self._services and name in self._services[service_type]:
-            return True
-
-        # Check factories
-        if service_type in self._factories and name in self._factories[service_type]:
-            return True
-
-        # Check singletons
-        if service_type in self._singletons and name in self._singletons[service_type]:
-            return True
-
-        return False
+        key = (service_type, name)
+        return key in self._services or key in self._factories
 
     def get(self, service_type: ServiceKey, name: str = "default") -> Any:
         """
@@ -99,34 +107,82 @@ class ServiceRegistry:
         Raises:
             KeyError: If the service is not registered
         """
-        # Check direct registrations
-        if service_type in self._services and name in self._services[service_type]:
-            return self._services[service_type][name]
+        key = (service_type, name)
 
-        # Check singletons
-        if service_type in self._singletons and name in self._singletons[service_type]:
-            return self._singletons[service_type][name]
+        # Check direct registrations and already-resolved singletons
+        instance = self._services.get(key, _MISSING)
+        if instance is not _MISSING:
+            return instance
 
         # Check factories
-        if service_type in self._factories and name in self._factories[service_type]:
-            factory, is_singleton = self._factories[service_type][name]
-            instance = factory()
+        entry = self._factories.get(key)
+        if entry is not None:
+            factory, is_singleton = entry
+            if not is_singleton:
+                return factory()
+
+            with self._lock:
+                # Another thread may have resolved the singleton while we waited
+                instance = self._services.get(key, _MISSING)
+                if instance is not _MISSING:
+                    return instance
+
+                # Promote singleton instances so later lookups hit _services directly
+                instance = factory()
+                self._services[key] = instance
+                self._factories.pop(key, None)
+                return instance
 
-            # Cache singleton instances
-            if is_singleton:
-                if service_type not in self._singletons:
-                    self._singletons[service_type] = {}
-                self._singletons[service_type][name] = instance
+        raise KeyError(f"Service {service_type} with name '{name}' not registered")
 
-            return instance
+    def freeze(self) -> None:
+        """
+        Freeze the registry once startup registration is complete.
 
-        raise KeyError(f"Service {service_type} with name '{name}' not registered")
+        All singleton factories are resolved eagerly and further registrations
+        are rejected. If no transient factories remain, get() is replaced by a
+        resolver bound directly to the service map.
+        """
+        with self._lock:
+            # Resolve through get() so a singleton that an earlier factory
+            # already pulled in is built once and skipped here
+            for key, (_, is_singleton) in list(self._factories.items()):
+                if is_singleton:
+                    self.get(*key)
+
+            self._frozen = True
+        if not self._factories:
+            self.get = self._build_frozen_resolver()
+
+    def _build_frozen_resolver(self) -> Callable[..., Any]:
+        """
+        Build a get() replacement for a frozen registry without transient factories.
+
+        Returns:
+            A resolver with the same signature as get()
+        """
+        services = self._services
+
+        def get(service_type: ServiceKey, name: str = "default") -> Any:
+            try:
+                return services[(service_type, name)]
+            except KeyError:
+                raise KeyError(f"Service {service_type} with name '{name}' not registered") from None
+
+        get.__doc__ = ServiceRegistry.get.__doc__
+        return get
+
+    @property
+    def frozen(self) -> bool:
+        """Whether the registry has been frozen."""
+        return self._frozen
 
     def clear(self) -> None:
-        """Clear all registered services."""
+        """Clear all registered services and unfreeze the registry."""
         self._services.clear()
         self._factories.clear()
-        self._singletons.clear()
+        self._frozen = False
+        self.__dict__.pop('get', None)
 
 # Global service registry instance
 registry = ServiceRegistry()
@@ -8,6 +8,7 @@ including order types, positions, signals, and market data structures.
 from datetime import datetime
 from enum import Enum
 from typing import Optional, Dict, Any, Union
+import sys
 
 from dataclasses import dataclass
 
@@ -18,6 +19,9 @@ from abidance.trading.position import Position as TradingPosition
 from abidance.trading.order import Order as TradingOrder
 from abidance.trading.trade import Trade as TradingTrade
 
+# Slotted dataclasses drop the per-instance __dict__ (only available on Python 3.10+)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
 class SignalType(Enum):
     """Enum representing the type of a trading signal."""
@@ -25,8 +29,25 @@ class SignalType(Enum):
     SELL = "sell"
     HOLD = "hold"
 
+    @classmethod
+    def from_value(cls, value: str) -> 'SignalType':
+        """Look up a member by its string value without going through Enum.__call__."""
+        try:
+            return _SIGNAL_TYPE_BY_VALUE[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}") from None
+
+
+# Intern enum values so comparisons and dict lookups on them can short-circuit on identity
+for _member in SignalType:
+    _member._value_ = sys.intern(_member._value_)
+del _member
+
+# Value-to-member map backing SignalType.from_value()
+_SIGNAL_TYPE_BY_VALUE = {member.value: member for member in SignalType}
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class Signal:
     """
     Represents a trading signal.
@@ -41,7 +62,7 @@ class Signal:
     metadata: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Candle:
     """
     Represents a price candle.
@@ -57,8 +78,10 @@ class Candle:
     volume: float
 
 
-# Adapter classes to maintain backward compatibility with tests
-@dataclass
+# Adapter classes to maintain backward compatibility with tests.
+# These cannot be plain aliases of the abidance.trading types: their fields differ
+# (size/timestamp here vs. quantity/entry_time/created_at there).
+@dataclass(**_DATACLASS_SLOTS)
 class Position:
     """
     Adapter for TradingPosition that matches the expected interface in tests.
@@ -72,13 +95,8 @@ class Position:
     take_profit: Optional[float] = None
     position_id: Optional[str] = None
 
-    def __post_init__(self):
-        """Convert to TradingPosition if needed."""
-        # This adapter could be expanded to convert between the two formats if needed
-        pass
-
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Order:
     """
     Adapter for TradingOrder that matches the expected interface in tests.
@@ -91,13 +109,8 @@ class Order:
     price: Optional[float] = None
     order_id: Optional[str] = None
 
-    def __post_init__(self):
-        """Convert to TradingOrder if needed."""
-        # This adapter could be expanded to convert between the two formats if needed
-        pass
 
-
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Trade:
     """
     Adapter for TradingTrade that matches the expected interface in tests.
@@ -110,8 +123,3 @@ class Trade:
     trade_id: Optional[str] = None
     fee: Optional[float] = None
     fee_currency: Optional[str] = None
-
-    def __post_init__(self):
-        """Convert to TradingTrade if needed."""
-        # This adapter could be expanded to convert between the two formats if needed
-        pass
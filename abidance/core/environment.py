@@ -6,17 +6,22 @@ It supports loading from .env files, type conversion, and validation.
 """
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union, cast
+from typing import Any, Dict, List, Optional, Type, TypeVar, Union
 import json
 import os
 
 
-from dotenv import load_dotenv
-
 from abidance.exceptions import ConfigurationError
 
 T = TypeVar('T')
 
+# Sentinel distinguishing a cache miss from a cached ``None``
+_MISSING = object()
+
+# Accepted spellings for boolean environment values
+_TRUE_VALUES = frozenset({'true', 'yes', '1', 'y', 'on'})
+_FALSE_VALUES = frozenset({'false', 'no', '0', 'n', 'off'})
+
 
 class Environment:
     """
@@ -24,11 +29,16 @@ class Environment:
 
     This class provides methods for loading environment variables from .env files,
     accessing them with type conversion, and validating required variables.
+
+    Converted values returned by the typed getters are memoized per key and
+    type. The cache is cleared by load(); call invalidate() after changing
+    os.environ directly.
     """
 
     def __init__(self) -> None:
         """Initialize the Environment instance."""
         self._loaded = False
+        self._cache: Dict[Any, Any] = {}
 
     def load(self, env_file: Optional[str] = None) -> bool:
         """
@@ -48,6 +58,9 @@ class Environment:
         if env_file and not Path(env_file).exists():
             raise ConfigurationError(f"Environment file not found: {env_file}")
 
+        from dotenv import load_dotenv
+
+        self._cache.clear()
         try:
             result = load_dotenv(dotenv_path=env_file, override=True)
             if not result and env_file:
@@ -57,6 +70,21 @@ class Environment:
         except Exception as e:
             raise ConfigurationError(f"Failed to load environment variables: {str(e)}") from e
 
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """
+        Drop memoized typed values.
+
+        Args:
+            key: Only drop values for this environment variable. If None,
+                 the whole cache is cleared.
+        """
+        if key is None:
+            self._cache.clear()
+            return
+
+        for cache_key in [k for k in self._cache if k[0] == key]:
+            del self._cache[cache_key]
+
     def get(self, key: str, default: Optional[Any] = None, required: bool = False) -> Optional[str]:
         """
         Get an environment variable.
@@ -110,14 +138,20 @@ class Environment:
             ConfigurationError: If required is True and the environment variable is not set,
                                or if the value cannot be converted to a boolean.
         """
+        cached = self._cache.get((key, 'bool'), _MISSING)
+        if cached is not _MISSING:
+            return cached
+
         value = self.get(key, None, required)
         if value is None:
             return default
 
         value = str(value).lower()
-        if value in ('true', 'yes', '1', 'y', 'on'):
+        if value in _TRUE_VALUES:
+            self._cache[(key, 'bool')] = True
             return True
-        if value in ('false', 'no', '0', 'n', 'off'):
+        if value in _FALSE_VALUES:
+            self._cache[(key, 'bool')] = False
             return False
 
         raise ConfigurationError(f"Cannot convert environment variable {key}={value} to boolean")
@@ -138,14 +172,20 @@ class Environment:
             ConfigurationError: If required is True and the environment variable is not set,
                                or if the value cannot be converted to an integer.
         """
+        cached = self._cache.get((key, 'int'), _MISSING)
+        if cached is not _MISSING:
+            return cached
+
         value = self.get(key, None, required)
         if value is None:
             return default
 
         try:
-            return int(value)
+            result = int(value)
         except ValueError:
             raise ConfigurationError(f"Cannot convert environment variable {key}={value} to integer")
+        self._cache[(key, 'int')] = result
+        return result
 
     def get_float(self, key: str, default: Optional[float] = None, required: bool = False) -> Optional[float]:
         """
@@ -163,20 +203,27 @@ class Environment:
             ConfigurationError: If required is True and the environment variable is not set,
                                or if the value cannot be converted to a float.
         """
+        cached = self._cache.get((key, 'float'), _MISSING)
+        if cached is not _MISSING:
+            return cached
+
         value = self.get(key, None, required)
         if value is None:
             return default
 
         try:
-            return float(value)
+            result = float(value)
         except ValueError:
             raise ConfigurationError(f"Cannot convert environment variable {key}={value} to float")
+        self._cache[(key, 'float')] = result
+        return result
 
     def get_list(self, key: str, default: Optional[list] = None, required: bool = False) -> Optional[list]:
         """
         Get an environment variable as a list.
 
         The environment variable should be a JSON-encoded list or a comma-separated string.
+        Values starting with '[' are always parsed as JSON.
 
         Args:
             key: The name of the environment variable.
@@ -190,19 +237,26 @@ class Environment:
             ConfigurationError: If required is True and the environment variable is not set,
                                or if the value cannot be converted to a list.
         """
+        cached = self._cache.get((key, 'list'), _MISSING)
+        if cached is not _MISSING:
+            return list(cached)
+
         value = self.get(key, None, required)
         if value is None:
             return default
 
-        # Try to parse as JSON
-        if value.startswith('['):
+        if value[:1] == '[':
+            # Values that look like JSON must parse as JSON
             try:
-                return json.loads(value)
+                result = json.loads(value)
             except json.JSONDecodeError:
-                pass  # Continue to the next parsing method
+                raise ConfigurationError(f"Cannot convert environment variable {key}={value} to list")
+        else:
+            # Comma-separated string
+            result = [item.strip() for item in value.split(',')]
 
-        # Fall back to comma-separated string
-        return [item.strip() for item in value.split(',')]
+        self._cache[(key, 'list')] = result
+        return list(result)
 
     def get_dict(self, key: str, default: Optional[Dict[str, Any]] = None, required: bool = False) -> Optional[Dict[str, Any]]:
         """
@@ -222,14 +276,23 @@ class Environment:
             ConfigurationError: If required is True and the environment variable is not set,
                                or if the value cannot be converted to a dictionary.
         """
+        cached = self._cache.get((key, 'dict'), _MISSING)
+        if cached is not _MISSING:
+            return dict(cached)
+
         value = self.get(key, None, required)
         if value is None:
             return default
 
         try:
-            return cast(Dict[str, Any], json.loads(value))
+            result = json.loads(value)
         except json.JSONDecodeError:
             raise ConfigurationError(f"Cannot convert environment variable {key}={value} to dictionary")
+        if not isinstance(result, dict):
+            # Valid JSON, but not an object (e.g. a number or a list)
+            raise ConfigurationError(f"Cannot convert environment variable {key}={value} to dictionary")
+        self._cache[(key, 'dict')] = result
+        return dict(result)
 
     def get_path(self, key: str, default: Optional[Path] = None, required: bool = False) -> Optional[Path]:
         """
@@ -246,11 +309,17 @@ class Environment:
         Raises:
             ConfigurationError: If required is True and the environment variable is not set.
         """
+        cached = self._cache.get((key, 'path'), _MISSING)
+        if cached is not _MISSING:
+            return cached
+
         value = self.get(key, None, required)
         if value is None:
             return default
 
-        return Path(value)
+        result = Path(value)
+        self._cache[(key, 'path')] = result
+        return result
 
     def get_typed(self, key: str, type_: Type[T], default: Optional[T] = None, required: bool = False) -> Optional[T]:
         """
@@ -269,14 +338,20 @@ class Environment:
             ConfigurationError: If required is True and the environment variable is not set,
                                or if the value cannot be converted to the specified type.
         """
+        cached = self._cache.get((key, type_), _MISSING)
+        if cached is not _MISSING:
+            return cached
+
         value = self.get(key, None, required)
         if value is None:
             return default
 
         try:
-            return type_(value)  # type: ignore
+            result = type_(value)  # type: ignore
         except (ValueError, TypeError):
             raise ConfigurationError(f"Cannot convert environment variable {key}={value} to {type_.__name__}")
+        self._cache[(key, type_)] = result
+        return result
 
     def get_all(self, prefix: str = '') -> Dict[str, str]:
         """
@@ -288,12 +363,29 @@ class Environment:
         Returns:
             A dictionary of environment variables.
         """
-        result = {}
-        for key, value in os.environ.items():
-            if not prefix or key.startswith(prefix):
-                result[key] = value
-        return result
+        # startswith('') is True for every key, so no separate no-prefix branch is needed
+        return {key: value for key, value in os.environ.items() if key.startswith(prefix)}
+
+
+# Global environment instance, created on first use
+_env: Optional[Environment] = None
+
+
+def get_env() -> Environment:
+    """
+    Get the global Environment instance, creating it on first use.
+
+    Returns:
+        The shared Environment instance.
+    """
+    global _env
+    if _env is None:
+        _env = Environment()
+    return _env
 
 
-# Global environment instance
-env = Environment()
+def __getattr__(name: str) -> Any:
+    """Keep ``environment.env`` working for code that used the eager global."""
+    if name == 'env':
+        return get_env()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,7 +5,7 @@ This module provides specialized event handlers and handler registration utiliti
 that work with the event system defined in the events module.
 """
 
-from typing import Dict, List, Callable, Optional, Type, TypeVar, Generic, Any, Union
+from typing import Dict, List, Callable, Iterable, Optional, Tuple, Type, TypeVar, Generic, Any, Union
 import logging
 
 from dataclasses import dataclass, field
@@ -17,6 +17,9 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+# Sentinel distinguishing a missing handler from one that was tracked
+_MISSING = object()
+
 
 class EventHandlerRegistry:
     """
@@ -34,7 +37,8 @@ class EventHandlerRegistry:
             event_system: The event system to register handlers with
         """
         self._event_system = event_system
-        self._registered_handlers: Dict[str, List[EventHandler]] = {}
+        # Handlers per event type, in registration order, mapped to their filters
+        self._registered_handlers: Dict[str, Dict[EventHandler, Optional[EventFilter]]] = {}
 
     def register(
         self,
@@ -45,18 +49,31 @@ class EventHandlerRegistry:
         """
         Register a handler for an event type.
 
+        A handler is registered at most once per event type. Registering it
+        again with the same filter is a no-op; with a different filter, the
+        new filter replaces the old one and the handler moves to the end of
+        the dispatch order.
+
         Args:
             event_type: Type of event to handle
             handler: Function to handle the event
             event_filter: Optional filter to apply to events before handling
         """
-        # Register with the event system
+        handlers = self._registered_handlers.get(event_type)
+        if handlers is None:
+            handlers = self._registered_handlers[event_type] = {}
+        else:
+            current = handlers.get(handler, _MISSING)
+            if current is event_filter:
+                return
+            if current is not _MISSING:
+                self._event_system.unregister_handler(event_type, handler)
+                del handlers[handler]
+                logger.debug("Replacing filter of handler for event type: %s in registry", event_type)
+
+        # Register with the event system and keep track of the handler
         self._event_system.register_handler(event_type, handler, event_filter)
-
-        # Keep track of registered handlers
-        if event_type not in self._registered_handlers:
-            self._registered_handlers[event_type] = []
-        self._registered_handlers[event_type].append(handler)
+        handlers[handler] = event_filter
 
         logger.debug("Registered handler for event type: %s in registry", event_type)
 
@@ -72,10 +89,26 @@ class EventHandlerRegistry:
         self._event_system.unregister_handler(event_type, handler)
 
         # Remove from our tracking
-        if event_type in self._registered_handlers:
-            if handler in self._registered_handlers[event_type]:
-                self._registered_handlers[event_type].remove(handler)
-                logger.debug("Unregistered handler for event type: %s from registry", event_type)
+        handlers = self._registered_handlers.get(event_type)
+        if handlers and handlers.pop(handler, _MISSING) is not _MISSING:
+            logger.debug("Unregistered handler for event type: %s from registry", event_type)
+
+    def unregister_many(self, event_type: str, handlers: Iterable[EventHandler]) -> None:
+        """
+        Unregister several handlers for one event type.
+
+        Equivalent to calling unregister() for each handler, but the tracked
+        handlers are looked up only once.
+
+        Args:
+            event_type: Type of event
+            handlers: Handlers to unregister
+        """
+        registered = self._registered_handlers.get(event_type, {})
+        for handler in handlers:
+            self._event_system.unregister_handler(event_type, handler)
+            registered.pop(handler, None)
+        logger.debug("Unregistered handlers for event type: %s from registry", event_type)
 
     def unregister_all(self, event_type: Optional[str] = None) -> None:
         """
@@ -89,7 +122,7 @@ class EventHandlerRegistry:
             if event_type in self._registered_handlers:
                 for handler in self._registered_handlers[event_type]:
                     self._event_system.unregister_handler(event_type, handler)
-                self._registered_handlers[event_type] = []
+                self._registered_handlers[event_type].clear()
                 logger.debug("Unregistered all handlers for event type: %s from registry", event_type)
         else:
             # Unregister all handlers for all event types
@@ -99,12 +132,13 @@ class EventHandlerRegistry:
             self._registered_handlers = {}
             logger.debug("Unregistered all handlers from registry")
 
-    def get_registered_handlers(self) -> Dict[str, List[EventHandler]]:
+    def get_registered_handlers(self) -> Dict[str, Dict[EventHandler, Optional[EventFilter]]]:
         """
         Get all registered handlers.
 
         Returns:
-            Dictionary mapping event types to lists of handlers
+            Dictionary mapping event types to insertion-ordered mappings from
+            the registered handlers to their filters (None when unfiltered)
         """
         return self._registered_handlers
 
@@ -142,7 +176,7 @@ class EventHandlerGroup:
             registry: The event handler registry to register handlers with
         """
         self._registry = registry
-        self._subscriptions: List[EventSubscription] = []
+        self._subscriptions: List[Tuple[str, EventHandler]] = []
 
     def subscribe(
         self,
@@ -162,14 +196,17 @@ class EventHandlerGroup:
             An EventSubscription object that can be used to unsubscribe
         """
         self._registry.register(event_type, handler, event_filter)
-        subscription = EventSubscription(event_type, handler, self._registry)
-        self._subscriptions.append(subscription)
-        return subscription
+        self._subscriptions.append((event_type, handler))
+        return EventSubscription(event_type, handler, self._registry)
 
     def unsubscribe_all(self) -> None:
         """Unsubscribe from all events."""
-        for subscription in self._subscriptions:
-            subscription.unsubscribe()
+        by_type: Dict[str, List[EventHandler]] = {}
+        for event_type, handler in self._subscriptions:
+            by_type.setdefault(event_type, []).append(handler)
+
+        for event_type, handlers in by_type.items():
+            self._registry.unregister_many(event_type, handlers)
         self._subscriptions = []
 
 
@@ -5,8 +5,12 @@ This module provides event handling functionality for the Abidance trading bot,
 including event emission, event handling, and event filtering.
 """
 
-from typing import Any, Dict, List, Callable, Optional, Union, TypeVar, Generic
+from collections import deque
+from typing import Any, Deque, Dict, Callable, Optional, Tuple, Union, TypeVar, Generic
 import logging
+import operator
+import sys
+import threading
 import time
 
 
@@ -25,8 +29,14 @@ class Event:
     Event class representing an event in the system.
 
     An event has a type, data, and optional metadata such as timestamp and source.
+
+    Attributes:
+        monotonic_ns: Monotonic clock reading (nanoseconds) taken when the event
+                      was created; use it to order events or measure latency
     """
 
+    __slots__ = ('type', 'data', 'source', 'monotonic_ns', '_timestamp')
+
     def __init__(
         self,
         type: str,
@@ -45,9 +55,26 @@ class Event:
         """
         self.type = type
         self.data = data
-        self.timestamp = timestamp if timestamp is not None else time.time()
+        self.monotonic_ns = time.monotonic_ns()
+        self._timestamp = timestamp
         self.source = source
 
+    @property
+    def timestamp(self) -> float:
+        """
+        Wall-clock time of the event in seconds since the epoch.
+
+        When no timestamp was given, it is derived on first access from the
+        monotonic creation time, so emitting an event does not read the wall clock.
+        """
+        if self._timestamp is None:
+            self._timestamp = time.time() - (time.monotonic_ns() - self.monotonic_ns) / 1e9
+        return self._timestamp
+
+    @timestamp.setter
+    def timestamp(self, value: float) -> None:
+        self._timestamp = value
+
     def __str__(self) -> str:
         """Return a string representation of the event."""
         return f"Event(type={self.type}, data={self.data}, timestamp={self.timestamp}, source={self.source})"
@@ -57,6 +84,57 @@ class Event:
         return self.__str__()
 
 
+class KeyEqFilter:
+    """
+    Event filter that matches events whose data holds a given value under a key.
+
+    Behaves like ``lambda event: event.data.get(key) == value``, except that an
+    event without the key never matches. The lookup is done by
+    ``operator.itemgetter`` in C rather than in a Python-level lambda.
+
+    Examples:
+        >>> event_system.register_handler("trade", on_btc_trade, KeyEqFilter("symbol", "BTC/USD"))
+    """
+
+    __slots__ = ('key', 'value', '_getter')
+
+    def __init__(self, key: str, value: Any):
+        """
+        Initialize the filter.
+
+        Args:
+            key: Key to look up in the event data
+            value: Value the key must equal for the event to match
+        """
+        self.key = key
+        self.value = value
+        self._getter = operator.itemgetter(key)
+
+    def __call__(self, event: Event) -> bool:
+        """Return True if the event data holds the expected value under the key."""
+        try:
+            return self._getter(event.data) == self.value
+        except KeyError:
+            return False
+
+
+class _FilteredHandler:
+    """Handler wrapper that forwards only the events accepted by a filter."""
+
+    __slots__ = ('event_filter', 'handler')
+
+    def __init__(self, event_filter: EventFilter, handler: EventHandler):
+        self.event_filter = event_filter
+        self.handler = handler
+
+    def __call__(self, event: Event) -> None:
+        if self.event_filter(event):
+            self.handler(event)
+
+    def __repr__(self) -> str:
+        return f"{self.handler!r} (filtered)"
+
+
 class EventSystem:
     """
     Event system for the Abidance trading bot.
@@ -66,9 +144,45 @@ class EventSystem:
     Events can be propagated to parent event types.
     """
 
-    def __init__(self):
-        """Initialize the event system."""
-        self._handlers: Dict[str, List[EventHandler]] = {}
+    def __init__(self, async_queue_size: int = 10000):
+        """
+        Initialize the event system.
+
+        Args:
+            async_queue_size: Maximum number of events waiting for the emit_async()
+                              worker; the oldest events are dropped beyond that
+        """
+        # Handler tuples are never mutated, only replaced (copy-on-write), so
+        # emit() can iterate a snapshot without taking the lock
+        self._handlers: Dict[str, Tuple[EventHandler, ...]] = {}
+        self._lock = threading.Lock()
+        # Interned event type and interned parent type (None at the top level), per type
+        self._type_info: Dict[str, Tuple[str, Optional[str]]] = {}
+
+        # emit_async() state: producers append to a bounded deque and a worker
+        # thread, started on first use, drains it
+        self._async_queue: Deque[Tuple[Event, Optional[str], bool]] = deque(maxlen=async_queue_size)
+        self._async_ready = threading.Event()
+        self._async_idle = threading.Condition()
+        self._async_dispatching = False
+        self._async_worker: Optional[threading.Thread] = None
+        self._async_stop = False
+        self._dropped_events = 0
+
+    def _register_type(self, event_type: str) -> Tuple[str, Optional[str]]:
+        """
+        Intern an event type and cache it together with its parent type.
+
+        Args:
+            event_type: Type of event
+
+        Returns:
+            Tuple of the interned event type and interned parent type (or None)
+        """
+        parent_type = event_type.rpartition('.')[0]
+        info = (sys.intern(event_type), sys.intern(parent_type) if parent_type else None)
+        self._type_info[event_type] = info
+        return info
 
     def register_handler(
         self,
@@ -84,36 +198,35 @@ class EventSystem:
             handler: Function to handle the event
             event_filter: Optional filter to apply to events before handling
         """
-        if event_type not in self._handlers:
-            self._handlers[event_type] = []
-
         # If a filter is provided, wrap the handler with the filter
         if event_filter is not None:
-            original_handler = handler
-
-            def filtered_handler(event: Event) -> None:
-                if event_filter(event):
-                    original_handler(event)
+            handler = _FilteredHandler(event_filter, handler)
 
-            handler = filtered_handler
-
-        self._handlers[event_type].append(handler)
+        event_type = (self._type_info.get(event_type) or self._register_type(event_type))[0]
+        with self._lock:
+            self._handlers[event_type] = self._handlers.get(event_type, ()) + (handler,)
         logger.debug("Registered handler for event type: %s", event_type)
 
     def unregister_handler(self, event_type: str, handler: EventHandler) -> None:
         """
         Unregister a handler for an event type.
 
+        Handlers registered with a filter are found through their wrapper.
+
         Args:
             event_type: Type of event
             handler: Handler to unregister
         """
-        if event_type in self._handlers:
-            # Try to find the handler in the list
-            # Note: This might not work for wrapped handlers with filters
-            if handler in self._handlers[event_type]:
-                self._handlers[event_type].remove(handler)
-                logger.debug("Unregistered handler for event type: %s", event_type)
+        with self._lock:
+            handlers = self._handlers.get(event_type, ())
+            for index, registered in enumerate(handlers):
+                if registered == handler or (
+                        type(registered) is _FilteredHandler and registered.handler == handler):
+                    break
+            else:
+                return
+            self._handlers[event_type] = handlers[:index] + handlers[index + 1:]
+        logger.debug("Unregistered handler for event type: %s", event_type)
 
     def clear_handlers(self, event_type: str) -> None:
         """
@@ -122,13 +235,16 @@ class EventSystem:
         Args:
             event_type: Type of event
         """
-        if event_type in self._handlers:
-            self._handlers[event_type] = []
-            logger.debug("Cleared all handlers for event type: %s", event_type)
+        with self._lock:
+            if event_type not in self._handlers:
+                return
+            self._handlers[event_type] = ()
+        logger.debug("Cleared all handlers for event type: %s", event_type)
 
     def clear_all_handlers(self) -> None:
         """Clear all handlers for all event types."""
-        self._handlers = {}
+        with self._lock:
+            self._handlers = {}
         logger.debug("Cleared all handlers for all event types")
 
     def emit(
@@ -149,37 +265,181 @@ class EventSystem:
             source: Optional source of the event
             propagate: Whether to propagate the event to parent event types
         """
+        event_type, parent_type = self._type_info.get(event_type) or self._register_type(event_type)
         event = Event(event_type, event_data, timestamp, source)
         logger.debug("Emitting event: %s", event)
+        self._dispatch(event, parent_type, propagate)
+
+    def emit_async(
+        self,
+        event_type: str,
+        event_data: EventData,
+        timestamp: Optional[float] = None,
+        source: Optional[str] = None,
+        propagate: bool = False
+    ) -> None:
+        """
+        Emit an event without waiting for its handlers.
+
+        The event is created immediately and queued; a background worker thread
+        calls the handlers in emit order. If the queue is full, the oldest queued
+        event is dropped and counted in dropped_events.
+
+        Args:
+            event_type: Type of event
+            event_data: Data for the event
+            timestamp: Optional timestamp for the event
+            source: Optional source of the event
+            propagate: Whether to propagate the event to parent event types
+        """
+        event_type, parent_type = self._type_info.get(event_type) or self._register_type(event_type)
+        event = Event(event_type, event_data, timestamp, source)
+
+        if self._async_worker is None:
+            self._start_async_worker()
+
+        queue = self._async_queue
+        if len(queue) == queue.maxlen:
+            self._dropped_events += 1
+        queue.append((event, parent_type, propagate))
+        self._async_ready.set()
+
+    @property
+    def dropped_events(self) -> int:
+        """Number of emit_async() events dropped because the queue was full."""
+        return self._dropped_events
+
+    def flush_async(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until all events queued by emit_async() have been handled.
+
+        Args:
+            timeout: Maximum number of seconds to wait (default: wait indefinitely)
+
+        Returns:
+            True if the queue was drained, False if the timeout expired
+        """
+        with self._async_idle:
+            return self._async_idle.wait_for(
+                lambda: not self._async_queue and not self._async_dispatching, timeout
+            )
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """
+        Stop the emit_async() worker thread.
+
+        Events already queued are handled before the worker exits. A later
+        emit_async() call starts a new worker.
+
+        Args:
+            timeout: Maximum number of seconds to wait for the worker (default: wait indefinitely)
+
+        Returns:
+            True if the worker has stopped, False if the timeout expired
+        """
+        with self._lock:
+            worker = self._async_worker
+            if worker is None:
+                return True
+            self._async_stop = True
+        self._async_ready.set()
+
+        if worker is threading.current_thread():
+            # Called from a handler: the worker exits once this drain completes
+            return False
+        worker.join(timeout)
+        return not worker.is_alive()
+
+    def _start_async_worker(self) -> None:
+        """Start the emit_async() worker thread if it is not running yet."""
+        with self._lock:
+            if self._async_worker is None:
+                worker = threading.Thread(target=self._run_async_worker,
+                                          name="EventSystemAsyncWorker", daemon=True)
+                worker.start()
+                self._async_worker = worker
+
+    def _run_async_worker(self) -> None:
+        """Dispatch queued events until close() is called."""
+        queue = self._async_queue
+        while not self._async_stop:
+            self._async_ready.wait()
+            # Clear before draining, so events queued during the drain re-set the flag
+            self._async_ready.clear()
+
+            self._async_dispatching = True
+            while True:
+                try:
+                    event, parent_type, propagate = queue.popleft()
+                except IndexError:
+                    break
+                self._dispatch(event, parent_type, propagate)
+
+            with self._async_idle:
+                self._async_dispatching = False
+                self._async_idle.notify_all()
+
+        with self._lock:
+            self._async_worker = None
+            self._async_stop = False
+
+    def _dispatch(self, event: Event, parent_type: Optional[str], propagate: bool) -> None:
+        """
+        Call the handlers for an event and, optionally, its parent type.
+
+        Args:
+            event: Event to handle
+            parent_type: Interned parent event type, or None at the top level
+            propagate: Whether to call handlers for the parent event type
+        """
+        # Filter results for this event, keyed by id(filter), shared by all handlers
+        # (including parent-type handlers) that were registered with the same filter
+        filter_results: Dict[int, bool] = {}
 
         # Call handlers for this event type
-        self._call_handlers(event_type, event)
+        self._call_handlers(event.type, event, filter_results)
 
         # If propagation is enabled, call handlers for parent event types
-        if propagate and '.' in event_type:
-            parent_type = event_type.rsplit('.', 1)[0]
-            self._call_handlers(parent_type, event)
+        if propagate and parent_type is not None:
+            self._call_handlers(parent_type, event, filter_results)
 
-    def _call_handlers(self, event_type: str, event: Event) -> None:
+    def _call_handlers(self, event_type: str, event: Event,
+                       filter_results: Optional[Dict[int, bool]] = None) -> None:
         """
         Call all handlers for an event type.
 
         Args:
             event_type: Type of event
             event: Event to handle
+            filter_results: Filter results already computed for this event, keyed
+                            by id(filter); updated with any newly evaluated filters
         """
-        if event_type in self._handlers:
-            for handler in self._handlers[event_type]:
-                try:
+        # Bind the current tuple once; concurrent (un)registration swaps in a new one
+        handlers = self._handlers.get(event_type)
+        if not handlers:
+            return
+        if filter_results is None:
+            filter_results = {}
+        for handler in handlers:
+            try:
+                if handler.__class__ is _FilteredHandler:
+                    event_filter = handler.event_filter
+                    accepted = filter_results.get(id(event_filter))
+                    if accepted is None:
+                        accepted = filter_results[id(event_filter)] = bool(event_filter(event))
+                    if accepted:
+                        handler.handler(event)
+                else:
                     handler(event)
-                except Exception as e:
-                    logger.error("Error in event handler for %s: %s", event_type, e)
+            except Exception:
+                # Arguments are only formatted if the record is actually emitted
+                logger.error("Error in event handler %r for %s", handler, event_type, exc_info=True)
 
-    def get_handlers(self) -> Dict[str, List[EventHandler]]:
+    def get_handlers(self) -> Dict[str, Tuple[EventHandler, ...]]:
         """
         Get all registered handlers.
 
         Returns:
-            Dictionary mapping event types to lists of handlers
+            Dictionary mapping event types to tuples of handlers
         """
         return self._handlers
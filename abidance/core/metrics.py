@@ -5,14 +5,17 @@ This module provides a framework for collecting, storing, and retrieving
 metrics about the application's performance and behavior.
 """
 
-from collections import defaultdict
-from datetime import datetime, timedelta
+from collections import deque
+from datetime import datetime, timezone
 from enum import Enum, auto
-from typing import Dict, Any, Optional, List, Union, Callable
-import threading
-
+from functools import lru_cache
+from typing import Deque, Dict, Any, Optional, List, Tuple
 import statistics
+import threading
+import time
+import weakref
 
+import numpy as np
 
 
 class AggregationType(Enum):
@@ -26,6 +29,277 @@ class AggregationType(Enum):
     FIRST = auto()
 
 
+# Integers beyond this magnitude cannot be stored exactly in a float64 array
+_MAX_EXACT_INT = 2 ** 53
+
+# Number of pending records a thread buffers before merging them itself
+_SHARD_CAPACITY = 256
+
+# A pending record: (metric name, timestamp in nanoseconds, value, tz-aware)
+_Record = Tuple[str, int, Any, bool]
+
+
+def _to_ns(timestamp: datetime) -> int:
+    """
+    Convert a datetime to nanoseconds since the epoch.
+
+    Naive datetimes are interpreted as local time, like datetime.now().
+    The conversion is exact to the microsecond.
+
+    Args:
+        timestamp: The datetime to convert
+
+    Returns:
+        Nanoseconds since the epoch
+    """
+    seconds = int(timestamp.replace(microsecond=0).timestamp())
+    return (seconds * 1_000_000 + timestamp.microsecond) * 1000
+
+
+@lru_cache(maxsize=4096)
+def _local_second(seconds: int) -> datetime:
+    """Local time at a whole epoch second; cached since reads convert runs of nearby timestamps."""
+    return datetime.fromtimestamp(seconds)
+
+
+@lru_cache(maxsize=4096)
+def _utc_second(seconds: int) -> datetime:
+    """UTC time at a whole epoch second; cached like _local_second."""
+    return datetime.fromtimestamp(seconds, timezone.utc)
+
+
+def _now_ns() -> int:
+    """
+    Get the current time in nanoseconds since the epoch, at microsecond precision.
+
+    Truncating to microseconds matches the precision of datetime.now(), so
+    records made within the same microsecond share one timestamp.
+
+    Returns:
+        Nanoseconds since the epoch
+    """
+    return time.time_ns() // 1000 * 1000
+
+
+def _from_ns(nanoseconds: int) -> datetime:
+    """
+    Convert nanoseconds since the epoch to a naive local datetime.
+
+    Timestamps are stored as integers and only converted here, when values
+    are handed back to callers.
+
+    Args:
+        nanoseconds: Nanoseconds since the epoch
+
+    Returns:
+        The corresponding datetime (microsecond precision)
+    """
+    seconds, nanoseconds = divmod(nanoseconds, 1_000_000_000)
+    return _local_second(seconds).replace(microsecond=nanoseconds // 1000)
+
+
+def _from_ns_utc(nanoseconds: int) -> datetime:
+    """
+    Convert nanoseconds since the epoch to a UTC-aware datetime.
+
+    Used for series recorded with timezone-aware timestamps.
+
+    Args:
+        nanoseconds: Nanoseconds since the epoch
+
+    Returns:
+        The corresponding datetime in UTC (microsecond precision)
+    """
+    seconds, nanoseconds = divmod(nanoseconds, 1_000_000_000)
+    return _utc_second(seconds).replace(microsecond=nanoseconds // 1000)
+
+
+class _MetricSeries:
+    """
+    Time series of one metric, stored as parallel NumPy arrays.
+
+    Timestamps are kept as int64 nanoseconds and numeric values as float64,
+    so range queries are binary searches and aggregates run over array
+    slices. Series that receive a non-numeric value (e.g. order dicts)
+    switch their value array to dtype ``object``. Capacity doubles when
+    full. The arrays are always sorted by timestamp: in-order appends go to
+    the end, and out-of-order ones are inserted at their sorted position.
+    Like the datetime-keyed dict this replaces, a series holds at most one
+    value per timestamp; recording at an existing timestamp overwrites it.
+    Timestamps are handed back timezone-aware (in UTC) when the series was
+    recorded with aware datetimes, and as naive local time otherwise.
+
+    Numeric series also keep a running sum, minimum and maximum, so
+    aggregates over the whole series cost O(1).
+    """
+
+    __slots__ = ('ts', 'vals', 'size', 'is_int', 'total', 'minimum', 'maximum', 'aware')
+
+    def __init__(self, capacity: int = 64, aware: bool = False):
+        self.ts = np.empty(capacity, dtype=np.int64)
+        self.vals = np.empty(capacity, dtype=np.float64)
+        self.size = 0
+        # Whether every value so far was an int, so reads can hand back ints
+        self.is_int = True
+        self.total = 0
+        self.minimum = None
+        self.maximum = None
+        # Whether timestamps were recorded as aware datetimes
+        self.aware = aware
+
+    def append(self, ts_ns: int, value: Any) -> None:
+        """Add a value recorded at ``ts_ns``, replacing any value with the same timestamp."""
+        if self.vals.dtype != object:
+            if isinstance(value, (int, np.integer)) and not isinstance(value, bool):
+                if not -_MAX_EXACT_INT <= value <= _MAX_EXACT_INT:
+                    self._to_object()
+            elif isinstance(value, (float, np.floating)):
+                self.is_int = False
+            else:
+                self._to_object()
+
+        n = self.size
+        i = n
+        if n and ts_ns <= self.ts[n - 1]:
+            i = int(np.searchsorted(self.ts[:n], ts_ns, side='left'))
+            if self.ts[i] == ts_ns:
+                # Same timestamp: the new value replaces the old one
+                self._replace(i, value)
+                return
+
+        if self.vals.dtype != object:
+            self.total += value
+            if self.minimum is None or value < self.minimum:
+                self.minimum = value
+            if self.maximum is None or value > self.maximum:
+                self.maximum = value
+
+        if n == len(self.ts):
+            self._grow(2 * n)
+
+        if i < n:
+            # Shift the later values up by one (insort)
+            self.ts[i + 1:n + 1] = self.ts[i:n]
+            self.vals[i + 1:n + 1] = self.vals[i:n]
+        self.ts[i] = ts_ns
+        self.vals[i] = value
+        self.size = n + 1
+
+    def _replace(self, i: int, value: Any) -> None:
+        """Overwrite the value at position ``i``, keeping the running aggregates exact."""
+        if self.vals.dtype == object:
+            self.vals[i] = value
+            return
+
+        old = self._value(i)
+        self.vals[i] = value
+        self.total += value - old
+        vals = self.vals[:self.size]
+        if value < self.minimum:
+            self.minimum = value
+        elif old == self.minimum:
+            self.minimum = vals.min()
+        if value > self.maximum:
+            self.maximum = value
+        elif old == self.maximum:
+            self.maximum = vals.max()
+
+    def _grow(self, capacity: int) -> None:
+        """Reallocate both arrays with a larger capacity."""
+        ts = np.empty(capacity, dtype=np.int64)
+        ts[:self.size] = self.ts[:self.size]
+        vals = np.empty(capacity, dtype=self.vals.dtype)
+        vals[:self.size] = self.vals[:self.size]
+        self.ts, self.vals = ts, vals
+
+    def _to_object(self) -> None:
+        """Switch the value array to dtype ``object``, keeping Python values."""
+        vals = np.empty(len(self.vals), dtype=object)
+        vals[:self.size] = self._values(0, self.size)
+        self.vals = vals
+
+    def _values(self, lo: int, hi: int) -> List[Any]:
+        """Values in ``[lo, hi)`` as Python objects."""
+        vals = self.vals[lo:hi]
+        if self.is_int and vals.dtype != object:
+            vals = vals.astype(np.int64)
+        return vals.tolist()
+
+    def _value(self, i: int) -> Any:
+        """Value at position ``i`` as a Python object."""
+        value = self.vals[i]
+        if self.vals.dtype == object:
+            return value
+        return int(value) if self.is_int else float(value)
+
+    def bounds(self, since: Optional[datetime], until: Optional[datetime]) -> Tuple[int, int]:
+        """
+        Get the slice of positions recorded within ``[since, until]``.
+
+        Both ends are found by binary search over the sorted timestamps.
+
+        Returns:
+            ``(lo, hi)`` such that positions ``lo .. hi - 1`` fall in the range
+        """
+        ts = self.ts[:self.size]
+        lo = 0 if since is None else int(np.searchsorted(ts, _to_ns(since), side='left'))
+        hi = self.size if until is None else int(np.searchsorted(ts, _to_ns(until), side='right'))
+        return lo, max(lo, hi)
+
+    def items(self, lo: int, hi: int) -> Dict[datetime, Any]:
+        """Timestamp-value pairs in ``[lo, hi)``."""
+        from_ns = _from_ns_utc if self.aware else _from_ns
+        return dict(zip(map(from_ns, self.ts[lo:hi].tolist()), self._values(lo, hi)))
+
+    def aggregate(self, aggregation_type: AggregationType, lo: int, hi: int) -> Any:
+        """Aggregate the values in ``[lo, hi)``, which must be non-empty."""
+        if aggregation_type == AggregationType.COUNT:
+            return hi - lo
+        if aggregation_type == AggregationType.LAST:
+            return self._value(hi - 1)
+        if aggregation_type == AggregationType.FIRST:
+            return self._value(lo)
+
+        if self.vals.dtype == object:
+            values = self._values(lo, hi)
+            if aggregation_type == AggregationType.SUM:
+                return sum(values)
+            if aggregation_type == AggregationType.AVG:
+                return statistics.mean(values)
+            if aggregation_type == AggregationType.MIN:
+                return min(values)
+            if aggregation_type == AggregationType.MAX:
+                return max(values)
+            return None
+
+        if lo == 0 and hi == self.size:
+            # Whole series: answer from the running aggregates
+            if aggregation_type == AggregationType.AVG:
+                return float(self.total / self.size)
+            if aggregation_type == AggregationType.SUM:
+                result = self.total
+            elif aggregation_type == AggregationType.MIN:
+                result = self.minimum
+            elif aggregation_type == AggregationType.MAX:
+                result = self.maximum
+            else:
+                return None
+            return int(result) if self.is_int else float(result)
+
+        vals = self.vals[lo:hi]
+        if aggregation_type == AggregationType.AVG:
+            return float(vals.mean())
+        if aggregation_type == AggregationType.SUM:
+            result = vals.sum()
+        elif aggregation_type == AggregationType.MIN:
+            result = vals.min()
+        elif aggregation_type == AggregationType.MAX:
+            result = vals.max()
+        else:
+            return None
+        return int(result) if self.is_int else float(result)
+
+
 class MetricsCollector:
     """
     Collector for application metrics.
@@ -36,8 +310,70 @@ class MetricsCollector:
 
     def __init__(self):
         """Initialize the metrics collector with empty metrics storage."""
-        self._metrics: Dict[str, Dict[datetime, Any]] = defaultdict(dict)
+        self._metrics: Dict[str, _MetricSeries] = {}
+        # Guards _metrics and _shards. Recording does not take it: each thread
+        # appends to its own shard, which is merged on reads or when it fills.
         self._lock = threading.Lock()
+        self._local = threading.local()
+        self._shards: List[Tuple[weakref.ref, Deque[_Record]]] = []
+
+    def _get_shard(self) -> Deque[_Record]:
+        """
+        Get the calling thread's shard of pending records, creating it if needed.
+
+        Returns:
+            The deque the calling thread appends its records to
+        """
+        shard = deque()
+        with self._lock:
+            self._shards.append((weakref.ref(threading.current_thread()), shard))
+        self._local.shard = shard
+        return shard
+
+    def _append(self, metric_name: str, value: Any, ts_ns: int, aware: bool = False) -> None:
+        """
+        Queue a value on the calling thread's shard.
+
+        Args:
+            metric_name: The name of the metric to record
+            value: The value to record
+            ts_ns: The timestamp in nanoseconds since the epoch
+            aware: Whether the timestamp was given as a timezone-aware datetime
+        """
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = self._get_shard()
+        shard.append((metric_name, ts_ns, value, aware))
+        if len(shard) >= _SHARD_CAPACITY:
+            with self._lock:
+                self._drain()
+
+    def _drain(self) -> None:
+        """
+        Merge all pending records into the metric series.
+
+        Must be called with the lock held. Shards are emptied with popleft(),
+        which is safe against their owner appending concurrently; shards of
+        threads that have exited are dropped once empty.
+        """
+        metrics = self._metrics
+        live = []
+        for thread_ref, shard in self._shards:
+            while True:
+                try:
+                    metric_name, ts_ns, value, aware = shard.popleft()
+                except IndexError:
+                    break
+                series = metrics.get(metric_name)
+                if series is None:
+                    # The first record decides how the series hands back timestamps
+                    series = metrics[metric_name] = _MetricSeries(aware=aware)
+                series.append(ts_ns, value)
+
+            thread = thread_ref()
+            if thread is not None and thread.is_alive():
+                live.append((thread_ref, shard))
+        self._shards = live
 
     def record(self, metric_name: str, value: Any) -> None:
         """
@@ -47,8 +383,7 @@ class MetricsCollector:
             metric_name: The name of the metric to record
             value: The value to record
         """
-        with self._lock:
-            self._metrics[metric_name][datetime.now()] = value
+        self._append(metric_name, value, _now_ns())
 
     def record_with_timestamp(self, metric_name: str, value: Any, timestamp: datetime) -> None:
         """
@@ -59,8 +394,18 @@ class MetricsCollector:
             value: The value to record
             timestamp: The timestamp to associate with the value
         """
+        self._append(metric_name, value, _to_ns(timestamp), timestamp.utcoffset() is not None)
+
+    def get_metric_names(self) -> List[str]:
+        """
+        Get the names of all metrics that have recorded values.
+
+        Returns:
+            List of metric names
+        """
         with self._lock:
-            self._metrics[metric_name][timestamp] = value
+            self._drain()
+            return list(self._metrics)
 
     def get_metric(self, metric_name: str,
                   since: Optional[datetime] = None,
@@ -68,26 +413,24 @@ class MetricsCollector:
         """
         Get recorded values for a metric with optional time filtering.
 
+        Timestamps are returned with microsecond precision, so values recorded
+        within the same microsecond share one key and only the last is kept.
+
         Args:
             metric_name: The name of the metric to retrieve
             since: Optional start time for filtering (inclusive)
             until: Optional end time for filtering (inclusive)
 
         Returns:
-            A dictionary mapping timestamps to metric values
+            A dictionary mapping timestamps to metric values, in time order
         """
         with self._lock:
-            data = self._metrics.get(metric_name, {})
-            filtered_data = {}
-
-            for ts, val in data.items():
-                if since and ts < since:
-                    continue
-                if until and ts > until:
-                    continue
-                filtered_data[ts] = val
-
-            return filtered_data
+            self._drain()
+            series = self._metrics.get(metric_name)
+            if series is None:
+                return {}
+            lo, hi = series.bounds(since, until)
+            return series.items(lo, hi)
 
     def get_metrics_list(self, metric_names: List[str],
                         since: Optional[datetime] = None,
@@ -118,13 +461,7 @@ class MetricsCollector:
         Returns:
             The most recent value, or None if no values exist
         """
-        with self._lock:
-            data = self._metrics.get(metric_name, {})
-            if not data:
-                return None
-
-            latest_ts = max(data.keys())
-            return data[latest_ts]
+        return self.aggregate(metric_name, AggregationType.LAST)
 
     def aggregate(self, metric_name: str,
                  aggregation_type: AggregationType,
@@ -142,30 +479,64 @@ class MetricsCollector:
         Returns:
             The aggregated value, or None if no values exist
         """
-        data = self.get_metric(metric_name, since, until)
-        values = list(data.values())
+        with self._lock:
+            self._drain()
+            series = self._metrics.get(metric_name)
+            if series is None:
+                return None
+            lo, hi = series.bounds(since, until)
+            if lo == hi:
+                return None
+            return series.aggregate(aggregation_type, lo, hi)
 
-        if not values:
-            return None
+    def to_arrow(self, metric_names: Optional[List[str]] = None) -> 'pyarrow.Table':
+        """
+        Export numeric metrics as an Apache Arrow table.
 
-        if aggregation_type == AggregationType.SUM:
-            return sum(values)
-        if aggregation_type == AggregationType.AVG:
-            return statistics.mean(values)
-        if aggregation_type == AggregationType.MIN:
-            return min(values)
-        if aggregation_type == AggregationType.MAX:
-            return max(values)
-        if aggregation_type == AggregationType.COUNT:
-            return len(values)
-        if aggregation_type == AggregationType.LAST:
-            latest_ts = max(data.keys())
-            return data[latest_ts]
-        if aggregation_type == AggregationType.FIRST:
-            earliest_ts = min(data.keys())
-            return data[earliest_ts]
+        The table has the columns ``metric`` (dictionary-encoded string),
+        ``timestamp`` (``timestamp[ns]``) and ``value`` (``float64``), with one
+        record batch per metric. Metrics holding non-numeric values are skipped.
+        Requires the optional ``pyarrow`` package.
 
-        return None
+        Args:
+            metric_names: Names of the metrics to export (default: all metrics)
+
+        Returns:
+            A pyarrow.Table with one row per recorded value
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        import pyarrow as pa
+
+        schema = pa.schema([
+            ('metric', pa.dictionary(pa.int32(), pa.string())),
+            ('timestamp', pa.timestamp('ns')),
+            ('value', pa.float64()),
+        ])
+
+        # Copy the series under the lock; the arrays are shifted in place by later inserts
+        with self._lock:
+            self._drain()
+            names = list(self._metrics) if metric_names is None else metric_names
+            columns = []
+            for name in names:
+                series = self._metrics.get(name)
+                if series is None or series.vals.dtype == object:
+                    continue
+                columns.append((name, series.ts[:series.size].copy(), series.vals[:series.size].copy()))
+
+        dictionary = pa.array([name for name, _, _ in columns], type=pa.string())
+        batches = [
+            pa.record_batch([
+                pa.DictionaryArray.from_arrays(
+                    pa.array(np.full(len(ts), metric_id, dtype=np.int32)), dictionary),
+                pa.array(ts, type=pa.timestamp('ns')),
+                pa.array(vals, type=pa.float64()),
+            ], schema=schema)
+            for metric_id, (_, ts, vals) in enumerate(columns)
+        ]
+        return pa.Table.from_batches(batches, schema=schema)
 
     def clear(self, metric_name: Optional[str] = None) -> None:
         """
@@ -176,8 +547,8 @@ class MetricsCollector:
                          If None, all metrics are cleared.
         """
         with self._lock:
+            self._drain()
             if metric_name:
-                if metric_name in self._metrics:
-                    del self._metrics[metric_name]
+                self._metrics.pop(metric_name, None)
             else:
                 self._metrics.clear()
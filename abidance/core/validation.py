@@ -6,12 +6,23 @@ and consistent validation across the application.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Type, Union, Callable
+from collections import OrderedDict
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence, Type, Union, Callable, Hashable, Tuple
+import sys
+import threading
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
+import numpy as np
 
-@dataclass
+
+# Slotted dataclasses drop the per-instance __dict__ (only available on Python 3.10+)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ValidationError:
     """
     Represents a validation error.
@@ -30,15 +41,28 @@ class ValidationError:
         return f"ValidationError(field='{self.field}', message='{self.message}', code='{self.code}')"
 
 
+# Shared result of a successful validate(); avoids allocating a list per call
+_NO_ERRORS: Tuple[ValidationError, ...] = ()
+
+
 class Validator(ABC):
     """
     Abstract base class for validators.
 
     All validators should inherit from this class and implement the validate method.
+
+    Attributes:
+        pure: Whether validate() depends only on its argument. Results of a
+              ValidationContext whose validators are all pure may be cached.
+              Defaults to False; subclasses opt in by setting it to True.
     """
 
+    __slots__ = ()
+
+    pure: bool = False
+
     @abstractmethod
-    def validate(self, value: Any) -> List[ValidationError]:
+    def validate(self, value: Any) -> Sequence[ValidationError]:
         """
         Validate a value and return a list of validation errors.
 
@@ -46,7 +70,8 @@ class Validator(ABC):
             value: The value to validate
 
         Returns:
-            A list of validation errors, or an empty list if validation passes
+            A list of validation errors, or an empty sequence (such as the
+            shared _NO_ERRORS tuple) if validation passes
         """
         pass
 
@@ -56,12 +81,26 @@ class ValidationContext:
     Manages multiple validators for different fields.
 
     This class allows adding validators for specific fields and validating
-    a data dictionary against all registered validators.
+    a data dictionary against all registered validators. Results are kept in a
+    bounded LRU cache keyed on the validated field values, as long as every
+    validator is pure and the values are immutable scalars or containers of them.
     """
 
-    def __init__(self):
-        """Initialize the validation context with an empty validators dictionary."""
+    def __init__(self, cache_size: int = 1024):
+        """
+        Initialize the validation context with an empty validators dictionary.
+
+        Args:
+            cache_size: Maximum number of cached validation results (0 disables caching)
+        """
         self.validators: Dict[str, List[Validator]] = {}
+        # Bound validate methods per field (with their validator, for the array
+        # path), built by add_validator() so the validation loop skips method lookup
+        self._bound: Dict[str, List[Tuple[Callable[[Any], Sequence[ValidationError]], Validator]]] = {}
+        self._cache: 'OrderedDict[Tuple, Tuple[ValidationError, ...]]' = OrderedDict()
+        self._cache_size = cache_size
+        self._cache_lock = threading.Lock()
+        self._cacheable = cache_size > 0
 
     def add_validator(self, field: str, validator: Validator) -> None:
         """
@@ -73,32 +112,98 @@ class ValidationContext:
         """
         if field not in self.validators:
             self.validators[field] = []
+            self._bound[field] = []
         self.validators[field].append(validator)
+        self._bound[field].append((validator.validate, validator))
+
+        # Cached results no longer reflect the full set of validators
+        with self._cache_lock:
+            self._cache.clear()
+        self._cacheable = self._cacheable and validator.pure
+
+    def _cache_key(self, data: Dict[str, Any]) -> Optional[Tuple]:
+        """
+        Build the cache key for a data dictionary.
+
+        Args:
+            data: The data dictionary to validate
+
+        Returns:
+            A hashable key, or None if the result must not be cached
+        """
+        if not self._cacheable:
+            return None
+        try:
+            return tuple((field, _freeze(data[field])) for field in self.validators if field in data)
+        except TypeError:
+            return None
 
     def validate(self, data: Dict[str, Any]) -> List[ValidationError]:
         """
         Validate a data dictionary against all registered validators.
 
+        NumPy array values are validated element-wise by validators that provide
+        a ``validate_batch`` method; errors for failing elements are reported
+        with the element index in the field name (e.g. ``"price[3]"``).
+
+        Args:
+            data: The data dictionary to validate
+
+        Returns:
+            A list of validation errors, or an empty list if validation passes
+        """
+        key = self._cache_key(data)
+        if key is not None:
+            with self._cache_lock:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+            if cached is not None:
+                return [replace(error) for error in cached]
+
+        errors = self._run_validators(data)
+
+        if key is not None:
+            with self._cache_lock:
+                self._cache[key] = tuple(replace(error) for error in errors)
+                if len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+        return errors
+
+    def _run_validators(self, data: Dict[str, Any]) -> List[ValidationError]:
+        """
+        Run all registered validators against a data dictionary.
+
         Args:
             data: The data dictionary to validate
 
         Returns:
             A list of validation errors, or an empty list if validation passes
         """
-        errors = []
+        # Only allocated once the first error is found
+        errors = None
 
-        for field, validators in self.validators.items():
+        for field, bound in self._bound.items():
             if field in data:
                 value = data[field]
-                for validator in validators:
-                    field_errors = validator.validate(value)
+                is_array = isinstance(value, np.ndarray)
+                for validate, validator in bound:
+                    if is_array and hasattr(validator, 'validate_batch'):
+                        field_errors = _validate_array(field, value, validator)
+                    else:
+                        field_errors = validate(value)
+                    if not field_errors:
+                        continue
+
+                    if errors is None:
+                        errors = []
                     for error in field_errors:
                         # Set the field name if not already set
                         if not error.field:
                             error.field = field
                         errors.append(error)
 
-        return errors
+        return errors if errors is not None else []
 
     def is_valid(self, data: Dict[str, Any]) -> bool:
         """
@@ -111,3 +216,63 @@ class ValidationContext:
             True if the data is valid, False otherwise
         """
         return len(self.validate(data)) == 0
+
+
+# Immutable scalar types whose values can safely key the validation cache
+_FROZEN_SCALARS = (str, bytes, int, float, Decimal, date, datetime, type(None))
+
+
+def _freeze(value: Any) -> Hashable:
+    """
+    Convert a value into a hashable cache key component.
+
+    The value's type is part of the key, so equal values of different types
+    (such as ``1``, ``1.0`` and ``True``) do not share cached results.
+
+    Args:
+        value: The value to convert
+
+    Returns:
+        A hashable representation of the value
+
+    Raises:
+        TypeError: If the value is not an immutable scalar or a container of them
+    """
+    value_type = type(value)
+    if isinstance(value, _FROZEN_SCALARS):
+        return value_type, value
+    if isinstance(value, (list, tuple)):
+        return value_type, tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return value_type, frozenset(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return value_type, frozenset((_freeze(k), _freeze(v)) for k, v in value.items())
+    raise TypeError(f"Cannot use {value_type.__name__} as a validation cache key")
+
+
+def _validate_array(field: str, values: np.ndarray, validator: Validator) -> List[ValidationError]:
+    """
+    Validate an array with a validator's batch path.
+
+    Only the elements rejected by the batch mask are passed through validate()
+    again, to build their error messages.
+
+    Args:
+        field: The name of the field being validated
+        values: The array to validate
+        validator: A validator with a ``validate_batch`` method
+
+    Returns:
+        A list of validation errors, or an empty list if all elements pass
+    """
+    mask = validator.validate_batch(values)
+    if mask.all():
+        return []
+
+    errors = []
+    flat = values.ravel()
+    for index in np.flatnonzero(~mask.ravel()).tolist():
+        for error in validator.validate(flat[index].item() if flat.dtype != object else flat[index]):
+            error.field = f"{field}[{index}]"
+            errors.append(error)
+    return errors
@@ -6,17 +6,72 @@ with the validation framework.
 """
 
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Type, Union, Callable, Pattern
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Type, Union, Callable, Pattern
+import math
 import re
 
+import numpy as np
 
-from .validation import Validator, ValidationError
+from .validation import Validator, ValidationError, _NO_ERRORS
+
+
+# Value types that RangeValidator checks on its fast path (bool is deliberately excluded)
+_PLAIN_NUMBER_TYPES = frozenset((int, float))
+
+
+@lru_cache(maxsize=64)
+def _line_pattern(pattern: Pattern) -> Optional[Pattern]:
+    """
+    Build a MULTILINE variant of a pattern that matches at every line start.
+
+    Args:
+        pattern: The compiled pattern
+
+    A match contained in its own line only consumes that line, so the only
+    constructs that can see the newline separator are lookarounds; the $,
+    end-of-string and word-boundary anchors give the same or a stricter
+    answer at a line end, and misses are re-checked individually by the
+    caller.
+
+    Returns:
+        The line-anchored pattern, or None if the pattern cannot be scanned
+        over joined lines safely (bytes patterns, lookarounds, inline flags)
+    """
+    source = pattern.pattern
+    if not isinstance(source, str) or any(
+            look in source for look in ('(?=', '(?!', '(?<=', '(?<!')):
+        return None
+    try:
+        return re.compile(f'^(?:{source})', pattern.flags | re.MULTILINE)
+    except re.error:
+        return None
+
+
+def _validate_each(validator: Validator, values: np.ndarray) -> np.ndarray:
+    """
+    Validate an array element by element with the scalar validate() path.
+
+    Args:
+        validator: The validator to apply
+        values: The values to validate
+
+    Returns:
+        A boolean array that is True where the value passes validation
+    """
+    flat = values.ravel().tolist()
+    mask = np.fromiter((not validator.validate(value) for value in flat), dtype=bool, count=len(flat))
+    return mask.reshape(values.shape)
 
 
 class RequiredValidator(Validator):
     """Validator that ensures a value is not None or empty."""
 
-    def validate(self, value: Any) -> List[ValidationError]:
+    __slots__ = ()
+
+    pure = True
+
+    def validate(self, value: Any) -> Sequence[ValidationError]:
         """
         Validate that a value is not None or empty.
 
@@ -24,35 +79,37 @@ class RequiredValidator(Validator):
             value: The value to validate
 
         Returns:
-            A list of validation errors, or an empty list if validation passes
+            A list of validation errors, or an empty sequence if validation passes
         """
-        errors = []
-
         if value is None:
-            errors.append(ValidationError(
+            return [ValidationError(
                 field="",
                 message="Value is required",
                 code="required"
-            ))
-        elif isinstance(value, str) and not value.strip():
-            errors.append(ValidationError(
+            )]
+        if isinstance(value, str) and not value.strip():
+            return [ValidationError(
                 field="",
                 message="Value cannot be empty",
                 code="required"
-            ))
-        elif isinstance(value, (list, dict, set, tuple)) and not value:
-            errors.append(ValidationError(
+            )]
+        if isinstance(value, (list, dict, set, tuple)) and not value:
+            return [ValidationError(
                 field="",
                 message="Value cannot be empty",
                 code="required"
-            ))
+            )]
 
-        return errors
+        return _NO_ERRORS
 
 
 class TypeValidator(Validator):
     """Validator that ensures a value is of a specific type."""
 
+    __slots__ = ('expected_type',)
+
+    pure = True
+
     def __init__(self, expected_type: Union[Type, tuple]):
         """
         Initialize the type validator.
@@ -62,7 +119,7 @@ class TypeValidator(Validator):
         """
         self.expected_type = expected_type
 
-    def validate(self, value: Any) -> List[ValidationError]:
+    def validate(self, value: Any) -> Sequence[ValidationError]:
         """
         Validate that a value is of the expected type.
 
@@ -70,33 +127,32 @@ class TypeValidator(Validator):
             value: The value to validate
 
         Returns:
-            A list of validation errors, or an empty list if validation passes
+            A list of validation errors, or an empty sequence if validation passes
         """
-        errors = []
+        if value is None or isinstance(value, self.expected_type):
+            return _NO_ERRORS
 
-        if value is None:
-            return errors
-
-        if not isinstance(value, self.expected_type):
-            # Format the type name differently depending on whether it's a single type or a tuple
-            if isinstance(self.expected_type, tuple):
-                type_names = [t.__name__ for t in self.expected_type]
-                expected_type_str = f"one of ({', '.join(type_names)})"
-            else:
-                expected_type_str = self.expected_type.__name__
-
-            errors.append(ValidationError(
-                field="",
-                message=f"Expected type {expected_type_str}, got {type(value).__name__}",
-                code="type"
-            ))
+        # Format the type name differently depending on whether it's a single type or a tuple
+        if isinstance(self.expected_type, tuple):
+            type_names = [t.__name__ for t in self.expected_type]
+            expected_type_str = f"one of ({', '.join(type_names)})"
+        else:
+            expected_type_str = self.expected_type.__name__
 
-        return errors
+        return [ValidationError(
+            field="",
+            message=f"Expected type {expected_type_str}, got {type(value).__name__}",
+            code="type"
+        )]
 
 
 class RangeValidator(Validator):
     """Validator that ensures a numeric value is within a specified range."""
 
+    __slots__ = ('_min_value', '_max_value', '_plain_bounds', '_lo', '_hi', '_min_message', '_max_message')
+
+    pure = True
+
     def __init__(self, min_value: Optional[Union[int, float, Decimal]] = None,
                 max_value: Optional[Union[int, float, Decimal]] = None):
         """
@@ -106,10 +162,41 @@ class RangeValidator(Validator):
             min_value: The minimum allowed value (inclusive)
             max_value: The maximum allowed value (inclusive)
         """
-        self.min_value = min_value
-        self.max_value = max_value
-
-    def validate(self, value: Union[int, float, Decimal]) -> List[ValidationError]:
+        self._min_value = min_value
+        self._max_value = max_value
+        self._prepare()
+
+    @property
+    def min_value(self) -> Optional[Union[int, float, Decimal]]:
+        """The minimum allowed value (inclusive)."""
+        return self._min_value
+
+    @min_value.setter
+    def min_value(self, value: Optional[Union[int, float, Decimal]]) -> None:
+        self._min_value = value
+        self._prepare()
+
+    @property
+    def max_value(self) -> Optional[Union[int, float, Decimal]]:
+        """The maximum allowed value (inclusive)."""
+        return self._max_value
+
+    @max_value.setter
+    def max_value(self, value: Optional[Union[int, float, Decimal]]) -> None:
+        self._max_value = value
+        self._prepare()
+
+    def _prepare(self) -> None:
+        """Precompute the fast-path bounds and the error messages from the current bounds."""
+        min_value, max_value = self._min_value, self._max_value
+        # Plain int/float values can be compared against any non-Decimal bounds directly
+        self._plain_bounds = not isinstance(min_value, Decimal) and not isinstance(max_value, Decimal)
+        self._lo = -math.inf if min_value is None else min_value
+        self._hi = math.inf if max_value is None else max_value
+        self._min_message = f"Value must be at least {min_value}"
+        self._max_message = f"Value must be at most {max_value}"
+
+    def validate(self, value: Union[int, float, Decimal]) -> Sequence[ValidationError]:
         """
         Validate that a value is within the specified range.
 
@@ -117,41 +204,79 @@ class RangeValidator(Validator):
             value: The value to validate
 
         Returns:
-            A list of validation errors, or an empty list if validation passes
+            A list of validation errors, or an empty sequence if validation passes
         """
-        errors = []
-
-        if value is None:
-            return errors
-
-        if not isinstance(value, (int, float, Decimal)):
-            errors.append(ValidationError(
+        if value.__class__ in _PLAIN_NUMBER_TYPES and self._plain_bounds:
+            # Fast path; NaN passes, as with the comparisons below
+            if not (value < self._lo or value > self._hi):
+                return _NO_ERRORS
+        elif value is None:
+            return _NO_ERRORS
+        elif not isinstance(value, (int, float, Decimal)):
+            return [ValidationError(
                 field="",
                 message=f"Expected numeric value, got {type(value).__name__}",
                 code="type"
-            ))
-            return errors
+            )]
+
+        below = self._min_value is not None and value < self._min_value
+        above = self._max_value is not None and value > self._max_value
+        if not (below or above):
+            return _NO_ERRORS
 
-        if self.min_value is not None and value < self.min_value:
+        errors = []
+
+        if below:
             errors.append(ValidationError(
                 field="",
-                message=f"Value must be at least {self.min_value}",
+                message=self._min_message,
                 code="min_value"
             ))
 
-        if self.max_value is not None and value > self.max_value:
+        if above:
             errors.append(ValidationError(
                 field="",
-                message=f"Value must be at most {self.max_value}",
+                message=self._max_message,
                 code="max_value"
             ))
 
         return errors
 
+    def validate_batch(self, values: np.ndarray) -> np.ndarray:
+        """
+        Validate an array of values at once.
+
+        Numeric arrays are checked with vectorized comparisons; other arrays
+        (e.g. of Decimal objects) and Decimal bounds fall back to validate()
+        per element.
+
+        Args:
+            values: The values to validate
+
+        Returns:
+            A boolean array that is True where the value passes validation
+        """
+        values = np.asarray(values)
+        if (values.dtype.kind not in 'biuf'
+                or isinstance(self.min_value, Decimal) or isinstance(self.max_value, Decimal)):
+            return _validate_each(self, values)
+
+        # Negated comparisons keep NaN valid, as in validate()
+        mask = np.ones(values.shape, dtype=bool)
+        if self.min_value is not None:
+            mask &= ~(values < self.min_value)
+        if self.max_value is not None:
+            mask &= ~(values > self.max_value)
+        return mask
+
 
 class LengthValidator(Validator):
     """Validator that ensures a value's length is within a specified range."""
 
+    __slots__ = ('min_length', 'max_length')
+
+    pure = True
+
     def __init__(self, min_length: Optional[int] = None, max_length: Optional[int] = None):
         """
         Initialize the length validator.
@@ -163,7 +288,7 @@ class LengthValidator(Validator):
         self.min_length = min_length
         self.max_length = max_length
 
-    def validate(self, value: Any) -> List[ValidationError]:
+    def validate(self, value: Any) -> Sequence[ValidationError]:
         """
         Validate that a value's length is within the specified range.
 
@@ -171,22 +296,21 @@ class LengthValidator(Validator):
             value: The value to validate
 
         Returns:
-            A list of validation errors, or an empty list if validation passes
+            A list of validation errors, or an empty sequence if validation passes
         """
-        errors = []
-
         if value is None:
-            return errors
+            return _NO_ERRORS
 
         try:
             length = len(value)
         except TypeError:
-            errors.append(ValidationError(
+            return [ValidationError(
                 field="",
                 message=f"Value of type {type(value).__name__} has no length",
                 code="length"
-            ))
-            return errors
+            )]
+
+        errors = []
 
         if self.min_length is not None and length < self.min_length:
             errors.append(ValidationError(
@@ -202,12 +326,41 @@ class LengthValidator(Validator):
                 code="max_length"
             ))
 
-        return errors
+        return errors or _NO_ERRORS
+
+    def validate_batch(self, values: np.ndarray) -> np.ndarray:
+        """
+        Validate the length of each value in an array at once.
+
+        String arrays are measured with ``np.char.str_len``; other arrays fall
+        back to validate() per element.
+
+        Args:
+            values: The values to validate
+
+        Returns:
+            A boolean array that is True where the value passes validation
+        """
+        values = np.asarray(values)
+        if values.dtype.kind not in 'US':
+            return _validate_each(self, values)
+
+        lengths = np.char.str_len(values)
+        mask = np.ones(values.shape, dtype=bool)
+        if self.min_length is not None:
+            mask &= lengths >= self.min_length
+        if self.max_length is not None:
+            mask &= lengths <= self.max_length
+        return mask
 
 
 class PatternValidator(Validator):
     """Validator that ensures a string value matches a regular expression pattern."""
 
+    __slots__ = ('pattern', 'error_message')
+
+    pure = True
+
     def __init__(self, pattern: Union[str, Pattern], error_message: Optional[str] = None):
         """
         Initialize the pattern validator.
@@ -219,7 +372,7 @@ class PatternValidator(Validator):
         self.pattern = re.compile(pattern) if isinstance(pattern, str) else pattern
         self.error_message = error_message or "Value does not match the required pattern"
 
-    def validate(self, value: str) -> List[ValidationError]:
+    def validate(self, value: str) -> Sequence[ValidationError]:
         """
         Validate that a string value matches the specified pattern.
 
@@ -227,34 +380,103 @@ class PatternValidator(Validator):
             value: The value to validate
 
         Returns:
-            A list of validation errors, or an empty list if validation passes
+            A list of validation errors, or an empty sequence if validation passes
         """
-        errors = []
-
         if value is None:
-            return errors
+            return _NO_ERRORS
 
         if not isinstance(value, str):
-            errors.append(ValidationError(
+            return [ValidationError(
                 field="",
                 message=f"Expected string value, got {type(value).__name__}",
                 code="type"
-            ))
-            return errors
+            )]
 
         if not self.pattern.match(value):
-            errors.append(ValidationError(
+            return [ValidationError(
                 field="",
                 message=self.error_message,
                 code="pattern"
-            ))
+            )]
 
-        return errors
+        return _NO_ERRORS
+
+    def validate_batch(self, values: Union[List[str], np.ndarray]) -> np.ndarray:
+        """
+        Validate a batch of strings at once.
+
+        Each distinct string is matched only once, which pays off for columns
+        with many repeated values such as symbols. Batches that are not all
+        strings fall back to validate() per element.
+
+        Args:
+            values: The values to validate
+
+        Returns:
+            A boolean array that is True where the value passes validation
+        """
+        values = np.asarray(values)
+        if values.dtype.kind != 'U':
+            return _validate_each(self, values)
+
+        uniques, inverse = np.unique(values, return_inverse=True)
+        match = self.pattern.match
+        matched = np.fromiter((match(value) is not None for value in uniques.tolist()),
+                              dtype=bool, count=len(uniques))
+        return matched[inverse].reshape(values.shape)
+
+    def validate_many(self, values: Sequence[str]) -> np.ndarray:
+        """
+        Validate a sequence of strings with a single regex scan.
+
+        The values are joined with newlines and scanned once with a
+        line-anchored MULTILINE variant of the pattern; each match is mapped
+        back to its value by binary search over the line offsets. Values not
+        confirmed by a match contained in their own line are re-checked
+        individually, so results always agree with validate(). Inputs that
+        are not all strings, or that contain newlines, use validate_batch().
+
+        Args:
+            values: The values to validate
+
+        Returns:
+            A boolean array that is True where the value passes validation
+        """
+        values = list(values)
+        if not values:
+            return np.zeros(0, dtype=bool)
+
+        line_pattern = _line_pattern(self.pattern)
+        try:
+            buffer = '\n'.join(values)
+        except TypeError:
+            line_pattern = None
+        if line_pattern is None or buffer.count('\n') != max(len(values) - 1, 0):
+            return self.validate_batch(values)
+
+        lengths = np.fromiter(map(len, values), dtype=np.int64, count=len(values))
+        line_ends = np.cumsum(lengths + 1) - 1
+        line_starts = line_ends - lengths
+
+        spans = np.array([match.span() for match in line_pattern.finditer(buffer)],
+                         dtype=np.int64).reshape(-1, 2)
+        lines = np.searchsorted(line_starts, spans[:, 0], side='right') - 1
+        contained = (line_starts[lines] == spans[:, 0]) & (spans[:, 1] <= line_ends[lines])
+
+        mask = np.zeros(len(values), dtype=bool)
+        mask[lines[contained]] = True
+
+        match = self.pattern.match
+        for index in np.flatnonzero(~mask).tolist():
+            mask[index] = match(values[index]) is not None
+        return mask
 
 
 class EmailValidator(PatternValidator):
     """Validator that ensures a string value is a valid email address."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Initialize the email validator with an email pattern."""
         # Simple email pattern for demonstration purposes
@@ -266,8 +488,10 @@ class EmailValidator(PatternValidator):
 class CustomValidator(Validator):
     """Validator that uses a custom validation function."""
 
+    __slots__ = ('validation_func', 'error_message', 'error_code', 'pure')
+
     def __init__(self, validation_func: Callable[[Any], bool],
-                error_message: str, error_code: str = "custom"):
+                error_message: str, error_code: str = "custom", pure: bool = False):
         """
         Initialize the custom validator.
 
@@ -275,12 +499,15 @@ class CustomValidator(Validator):
             validation_func: A function that takes a value and returns True if valid
             error_message: The error message to use when validation fails
             error_code: The error code to use when validation fails
+            pure: Whether validation_func depends only on its argument, so that
+                  validation results may be cached
         """
         self.validation_func = validation_func
         self.error_message = error_message
         self.error_code = error_code
+        self.pure = pure
 
-    def validate(self, value: Any) -> List[ValidationError]:
+    def validate(self, value: Any) -> Sequence[ValidationError]:
         """
         Validate a value using the custom validation function.
 
@@ -288,15 +515,13 @@ class CustomValidator(Validator):
             value: The value to validate
 
         Returns:
-            A list of validation errors, or an empty list if validation passes
+            A list of validation errors, or an empty sequence if validation passes
         """
-        errors = []
-
-        if not self.validation_func(value):
-            errors.append(ValidationError(
-                field="",
-                message=self.error_message,
-                code=self.error_code
-            ))
-
-        return errors
+        if self.validation_func(value):
+            return _NO_ERRORS
+
+        return [ValidationError(
+            field="",
+            message=self.error_message,
+            code=self.error_code
+        )]
@@ -3,11 +3,39 @@ Database index definitions for query optimization.
 
 This module defines indexes for the database tables to optimize query performance.
 """
+import re
+import zlib
+from typing import Iterable, List, Optional
+
 from sqlalchemy import Index, text
 
 from abidance.database.models import Trade, OHLCV, Strategy
 
 
+_TRADE_INDEXES = {idx.name: idx for idx in Trade.__table__.indexes}
+
+# Index objects attach themselves to their table's metadata when constructed,
+# so they are defined once here rather than on every create_indexes() call
+INDEXES = (
+    # Trade indexes are declared on the model; they are listed here so databases
+    # created before they were added there get them too
+    _TRADE_INDEXES['idx_trade_symbol_timestamp'],
+    _TRADE_INDEXES['idx_trade_strategy_cover'],
+
+    # OHLCV indexes ((symbol, timestamp) is covered by the model's unique idx_symbol_timestamp)
+    Index('idx_ohlcv_timestamp', OHLCV.timestamp),
+
+    # Strategy indexes
+    Index('idx_strategy_name', Strategy.name),
+)
+
+# Indexes created by earlier versions that are now subsumed by one of INDEXES
+SUPERSEDED_INDEXES = ('idx_trade_strategy_timestamp',)
+
+# Name prefix of the per-symbol partial OHLCV indexes
+SYMBOL_INDEX_PREFIX = 'idx_ohlcv_ts_'
+
+
 def create_indexes(engine):
     """
     Create all indexes for optimized query performance.
@@ -15,41 +43,21 @@ def create_indexes(engine):
     Args:
         engine: SQLAlchemy engine instance
     """
-    # Trade indexes
-    trade_timestamp_idx = Index('idx_trade_timestamp', Trade.timestamp)
-    trade_symbol_timestamp_idx = Index('idx_trade_symbol_timestamp',
-                                      Trade.symbol, Trade.timestamp)
-    trade_strategy_timestamp_idx = Index('idx_trade_strategy_timestamp',
-                                        Trade.strategy_id, Trade.timestamp)
-
-    # OHLCV indexes
-    ohlcv_timestamp_idx = Index('idx_ohlcv_timestamp', OHLCV.timestamp)
-    ohlcv_symbol_timestamp_idx = Index('idx_ohlcv_symbol_timestamp',
-                                      OHLCV.symbol, OHLCV.timestamp)
-
-    # Strategy indexes
-    strategy_name_idx = Index('idx_strategy_name', Strategy.name)
-
-    # Create all indexes
-    indexes = [
-        trade_timestamp_idx,
-        trade_symbol_timestamp_idx,
-        trade_strategy_timestamp_idx,
-        ohlcv_timestamp_idx,
-        ohlcv_symbol_timestamp_idx,
-        strategy_name_idx
-    ]
-
-    # Create indexes that don't already exist
+    # Look up the existing indexes once and only create the missing ones
     with engine.connect() as conn:
-        for idx in indexes:
-            # Check if index already exists
-            idx_name = idx.name
-            result = conn.execute(text(
-                f"SELECT 1 FROM sqlite_master WHERE type='index' AND name='{idx_name}'"
-            ))
-            if not result.scalar():
-                idx.create(engine)
+        existing = {row[0] for row in conn.execute(text(
+            "SELECT name FROM sqlite_master WHERE type='index'"
+        ))}
+
+    for idx in INDEXES:
+        if idx.name not in existing:
+            idx.create(engine, checkfirst=True)
+
+    superseded = [name for name in SUPERSEDED_INDEXES if name in existing]
+    if superseded:
+        with engine.begin() as conn:
+            for idx_name in superseded:
+                conn.execute(text(f"DROP INDEX IF EXISTS {idx_name}"))
 
 
 def drop_indexes(engine):
@@ -59,42 +67,107 @@ def drop_indexes(engine):
     Args:
         engine: SQLAlchemy engine instance
     """
-    index_names = [
-        'idx_trade_timestamp',
-        'idx_trade_symbol_timestamp',
-        'idx_trade_strategy_timestamp',
-        'idx_ohlcv_timestamp',
-        'idx_ohlcv_symbol_timestamp',
-        'idx_strategy_name'
-    ]
-
-    with engine.connect() as conn:
-        for idx_name in index_names:
-            result = conn.execute(text(
-                f"SELECT 1 FROM sqlite_master WHERE type='index' AND name='{idx_name}'"
-            ))
-            if result.scalar():
-                conn.execute(text(f"DROP INDEX IF EXISTS {idx_name}"))
+    # IF EXISTS makes a prior sqlite_master lookup unnecessary
+    with engine.begin() as conn:
+        for idx in INDEXES:
+            conn.execute(text(f"DROP INDEX IF EXISTS {idx.name}"))
 
 
 def create_function_based_indexes(engine):
     """
     Create function-based indexes for advanced query optimization.
 
+    The indexes are on integer ``ts_epoch`` buckets. The bucket expressions must
+    match the ones used by QueryOptimizer.get_aggregated_ohlcv() exactly for
+    SQLite to use them.
+
     Args:
         engine: SQLAlchemy engine instance
     """
     # These are more advanced indexes that might be database-specific
     # For SQLite, we can create indexes on expressions
-    with engine.connect() as conn:
-        # Index for date extraction (for time-based grouping)
+    with engine.begin() as conn:
+        # Day buckets (for daily aggregation)
         conn.execute(text("""
-        CREATE INDEX IF NOT EXISTS idx_ohlcv_date
-        ON ohlcv(strftime('%Y-%m-%d', timestamp))
+        CREATE INDEX IF NOT EXISTS idx_ohlcv_day_bucket
+        ON ohlcv(symbol, ts_epoch / 86400)
         """))
 
-        # Index for hour extraction (for hourly aggregation)
+        # Hour buckets (for hourly aggregation)
         conn.execute(text("""
-        CREATE INDEX IF NOT EXISTS idx_ohlcv_hour
-        ON ohlcv(strftime('%Y-%m-%d %H', timestamp))
+        CREATE INDEX IF NOT EXISTS idx_ohlcv_hour_bucket
+        ON ohlcv(symbol, ts_epoch / 3600)
         """))
+
+        # Superseded strftime() expression indexes
+        conn.execute(text("DROP INDEX IF EXISTS idx_ohlcv_date"))
+        conn.execute(text("DROP INDEX IF EXISTS idx_ohlcv_hour"))
+
+
+def symbol_index_name(symbol: str) -> str:
+    """
+    Get the name of the partial OHLCV index for a symbol.
+
+    Args:
+        symbol: Trading pair symbol (e.g., 'BTC/USDT')
+
+    Returns:
+        Index name; a checksum keeps symbols that differ only in punctuation apart
+    """
+    slug = re.sub(r'[^0-9a-z]+', '_', symbol.lower()).strip('_')
+    return f"{SYMBOL_INDEX_PREFIX}{slug}_{zlib.crc32(symbol.encode()):08x}"
+
+
+def create_symbol_indexes(engine, symbols: Optional[Iterable[str]] = None) -> List[str]:
+    """
+    Create one partial, covering OHLCV index per symbol.
+
+    Each index holds only its symbol's candles, in timestamp order, with every
+    OHLCV column. Per-symbol reads are therefore served from a compact,
+    contiguous B-tree rather than table pages shared by all symbols, which
+    keeps the hot symbols' working set small. Every insert also writes to its
+    symbol's index, so only actively queried symbols should be indexed.
+
+    SQLite only considers a partial index when the query compares symbol with
+    the same literal, and it still prefers the unique (symbol, timestamp)
+    index, so readers opt in with ``INDEXED BY symbol_index_name(symbol)``.
+
+    Args:
+        engine: SQLAlchemy engine instance
+        symbols: Symbols to index (default: every symbol currently in ohlcv)
+
+    Returns:
+        Names of the per-symbol indexes
+    """
+    with engine.begin() as conn:
+        if symbols is None:
+            symbols = [row[0] for row in conn.execute(text("SELECT DISTINCT symbol FROM ohlcv"))]
+
+        names = []
+        for symbol in symbols:
+            name = symbol_index_name(symbol)
+            # The partial index predicate must be a literal, so the symbol is quoted inline
+            literal = symbol.replace("'", "''")
+            conn.execute(text(
+                f"CREATE INDEX IF NOT EXISTS {name} "
+                f"ON ohlcv(timestamp, ts_epoch, open, high, low, close, volume, symbol) "
+                f"WHERE symbol = '{literal}'"
+            ))
+            names.append(name)
+    return names
+
+
+def drop_symbol_indexes(engine):
+    """
+    Drop all per-symbol partial OHLCV indexes.
+
+    Args:
+        engine: SQLAlchemy engine instance
+    """
+    with engine.begin() as conn:
+        names = [row[0] for row in conn.execute(text(
+            "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='ohlcv'"
+        ))]
+        for name in names:
+            if name.startswith(SYMBOL_INDEX_PREFIX):
+                conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
@@ -0,0 +1,73 @@
+"""
+Vectorized indicator kernels for OHLCV query results.
+
+This module computes the indicators returned by QueryOptimizer directly on
+NumPy arrays, using running sums instead of per-window reductions.
+"""
+from typing import Tuple
+
+import numpy as np
+
+
+def _rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Sum each value with up to ``window - 1`` preceding values.
+
+    Args:
+        values: One-dimensional array
+        window: Window length
+
+    Returns:
+        Array of trailing window sums, partial for the first ``window - 1`` entries
+    """
+    sums = np.cumsum(values)
+    if len(sums) > window:
+        sums[window:] = sums[window:] - sums[:-window]
+    return sums
+
+
+def sma_rsi(close: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the simple moving average and average gain/loss ratio of a close series.
+
+    Both indicators use trailing windows that are partial for the first
+    ``window - 1`` rows. The first row has no previous close and counts as
+    neither a gain nor a loss. The ratio is NaN wherever the window holds no losses.
+
+    Args:
+        close: Close prices in timestamp order
+        window: Lookback window length (must be at least 1)
+
+    Returns:
+        Tuple of (sma, rsi_ratio) float64 arrays with the same length as ``close``
+
+    Raises:
+        ValueError: If window is less than 1
+    """
+    if window < 1:
+        raise ValueError(f"window must be at least 1, got {window}")
+
+    close = np.asarray(close, dtype=np.float64)
+    if close.size == 0:
+        return np.empty(0), np.empty(0)
+
+    counts = np.minimum(np.arange(1, close.size + 1), window)
+
+    # Summing offsets from the first close keeps the running sums small, which
+    # limits the rounding error left behind when old values are subtracted
+    offset = close[0]
+    sma = _rolling_sum(close - offset, window) / counts + offset
+
+    change = np.diff(close, prepend=offset)
+    gain = np.maximum(change, 0.0)
+    loss = np.maximum(-change, 0.0)
+
+    gain_sum = np.maximum(_rolling_sum(gain, window), 0.0)
+    loss_sum = _rolling_sum(loss, window)
+    # Count losses exactly so windows without any are NaN rather than rounding noise
+    loss_count = _rolling_sum((loss > 0).astype(np.int64), window)
+
+    rsi_ratio = np.full(close.size, np.nan)
+    has_loss = loss_count > 0
+    rsi_ratio[has_loss] = gain_sum[has_loss] / loss_sum[has_loss]
+    return sma, rsi_ratio
@@ -4,159 +4,169 @@ Database migration manager.
 This module provides utility functions for managing database migrations,
 including creating new migrations, upgrading, and downgrading the database.
 """
+import io
+import logging
 import sys
 import argparse
-import subprocess
 from pathlib import Path
 
+from alembic import command
+from alembic.config import Config
+
 # Add the project root to the Python path
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+# Fixed locations, resolved once at import
+_MIGRATIONS_DIR = Path(__file__).parent.resolve()
+_ALEMBIC_INI = _MIGRATIONS_DIR.parent / "alembic.ini"
+
+# Alembic configuration shared by all commands, built on first use
+_config = None
+
 
 def get_alembic_config_path():
     """Get the path to the alembic.ini file."""
-    return Path(__file__).parent.parent / "alembic.ini"
+    return _ALEMBIC_INI
 
 
 def get_migrations_dir():
     """Get the path to the migrations directory."""
-    return Path(__file__).parent
+    return _MIGRATIONS_DIR
 
 
-def create_migration(message):
-    """Create a new migration with the given message."""
+def build_alembic_config(database_url=None):
+    """
+    Build an Alembic configuration for running commands in-process.
+
+    Relative paths in alembic.ini (the script location and SQLite database file)
+    are resolved against the directory containing alembic.ini, matching what the
+    ``alembic`` command line does when run from that directory.
+
+    Args:
+        database_url: Optional database URL overriding the one in alembic.ini
+
+    Returns:
+        Alembic Config object
+    """
     alembic_ini_path = get_alembic_config_path()
-    migrations_dir = get_migrations_dir()
-
-    result = subprocess.run(
-        [
-            "alembic",
-            "-c",
-            str(alembic_ini_path),
-            "revision",
-            "--autogenerate",
-            "-m",
-            message
-        ],
-        cwd=migrations_dir.parent,
-        capture_output=True,
-        text=True,
-        check=False
-    )
+    config = Config(str(alembic_ini_path))
+    config.set_main_option("script_location", str(get_migrations_dir()))
+
+    url = database_url or config.get_main_option("sqlalchemy.url")
+    prefix = "sqlite:///"
+    if url.startswith(prefix) and url != prefix + ":memory:" and not Path(url[len(prefix):]).is_absolute():
+        url = prefix + str(alembic_ini_path.parent / url[len(prefix):])
+    config.set_main_option("sqlalchemy.url", url)
+    # Leave the application's logging configuration alone (see env.py)
+    config.attributes["configure_logger"] = False
+    return config
+
+
+def get_alembic_config():
+    """Get the process-wide Alembic configuration, building it on first use."""
+    global _config  # pylint: disable=global-statement
+    if _config is None:
+        _config = build_alembic_config()
+    return _config
+
+
+def _run_command(alembic_command, config, *args, **kwargs):
+    """
+    Run an Alembic command in-process and capture its output.
+
+    Besides what the command writes to ``config.stdout``, the INFO messages
+    Alembic logs while it runs (such as each migration step applied) are
+    captured as well.
+
+    Args:
+        alembic_command: Function from alembic.command to run
+        config: Alembic configuration, or None for the process-wide one
+        *args: Positional arguments for the command
+        **kwargs: Keyword arguments for the command
+
+    Returns:
+        Tuple of (success, output), where output is the error message on failure
+    """
+    config = config or get_alembic_config()
+    output = io.StringIO()
+    stdout, config.stdout = config.stdout, output
+
+    alembic_logger = logging.getLogger("alembic")
+    handler = logging.StreamHandler(output)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    level = alembic_logger.level
+    alembic_logger.addHandler(handler)
+    if not alembic_logger.isEnabledFor(logging.INFO):
+        alembic_logger.setLevel(logging.INFO)
+    try:
+        alembic_command(config, *args, **kwargs)
+    except Exception as e:  # pylint: disable=broad-except
+        return False, str(e)
+    finally:
+        config.stdout = stdout
+        alembic_logger.removeHandler(handler)
+        alembic_logger.setLevel(level)
+    return True, output.getvalue()
+
+
+def create_migration(message, config=None):
+    """Create a new migration with the given message."""
+    success, output = _run_command(command.revision, config, message=message, autogenerate=True)
 
-    if result.returncode != 0:
-        print(f"Error creating migration: {result.stderr}")
+    if not success:
+        print(f"Error creating migration: {output}")
         return False
 
-    print(f"Migration created successfully: {result.stdout}")
+    print(f"Migration created successfully: {output}")
     return True
 
 
-def upgrade_database(revision="head"):
+def upgrade_database(revision="head", config=None):
     """Upgrade the database to the specified revision."""
-    alembic_ini_path = get_alembic_config_path()
-    migrations_dir = get_migrations_dir()
-
-    result = subprocess.run(
-        [
-            "alembic",
-            "-c",
-            str(alembic_ini_path),
-            "upgrade",
-            revision
-        ],
-        cwd=migrations_dir.parent,
-        capture_output=True,
-        text=True,
-        check=False
-    )
+    success, output = _run_command(command.upgrade, config, revision)
 
-    if result.returncode != 0:
-        print(f"Error upgrading database: {result.stderr}")
+    if not success:
+        print(f"Error upgrading database: {output}")
         return False
 
-    print(f"Database upgraded successfully: {result.stdout}")
+    print(f"Database upgraded successfully: {output}")
     return True
 
 
-def downgrade_database(revision="-1"):
+def downgrade_database(revision="-1", config=None):
     """Downgrade the database by the specified number of revisions."""
-    alembic_ini_path = get_alembic_config_path()
-    migrations_dir = get_migrations_dir()
-
-    result = subprocess.run(
-        [
-            "alembic",
-            "-c",
-            str(alembic_ini_path),
-            "downgrade",
-            revision
-        ],
-        cwd=migrations_dir.parent,
-        capture_output=True,
-        text=True,
-        check=False
-    )
+    success, output = _run_command(command.downgrade, config, revision)
 
-    if result.returncode != 0:
-        print(f"Error downgrading database: {result.stderr}")
+    if not success:
+        print(f"Error downgrading database: {output}")
         return False
 
-    print(f"Database downgraded successfully: {result.stdout}")
+    print(f"Database downgraded successfully: {output}")
     return True
 
 
-def show_history():
+def show_history(config=None):
     """Show the migration history."""
-    alembic_ini_path = get_alembic_config_path()
-    migrations_dir = get_migrations_dir()
-
-    result = subprocess.run(
-        [
-            "alembic",
-            "-c",
-            str(alembic_ini_path),
-            "history",
-            "--verbose"
-        ],
-        cwd=migrations_dir.parent,
-        capture_output=True,
-        text=True,
-        check=False
-    )
+    success, output = _run_command(command.history, config, verbose=True)
 
-    if result.returncode != 0:
-        print(f"Error showing history: {result.stderr}")
+    if not success:
+        print(f"Error showing history: {output}")
         return False
 
-    print(f"Migration history:\n{result.stdout}")
+    print(f"Migration history:\n{output}")
     return True
 
 
-def show_current():
+def show_current(config=None):
     """Show the current migration version."""
-    alembic_ini_path = get_alembic_config_path()
-    migrations_dir = get_migrations_dir()
-
-    result = subprocess.run(
-        [
-            "alembic",
-            "-c",
-            str(alembic_ini_path),
-            "current"
-        ],
-        cwd=migrations_dir.parent,
-        capture_output=True,
-        text=True,
-        check=False
-    )
+    success, output = _run_command(command.current, config)
 
-    if result.returncode != 0:
-        print(f"Error showing current version: {result.stderr}")
+    if not success:
+        print(f"Error showing current version: {output}")
         return False
 
-    print(f"Current migration version:\n{result.stdout}")
+    print(f"Current migration version:\n{output}")
     return True
 
 
@@ -0,0 +1,27 @@
+"""Drop redundant trade symbol index
+
+Revision ID: 4c8e2b71f0a3
+Revises: dafd9a0cd380
+Create Date: 2026-10-17 10:12:41.305117
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '4c8e2b71f0a3'
+down_revision = 'dafd9a0cd380'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # ix_trades_symbol is a prefix of idx_trade_symbol_timestamp(symbol, timestamp)
+    op.drop_index(op.f('ix_trades_symbol'), table_name='trades')
+    # Duplicates created by earlier versions of abidance.database.indexes.create_indexes()
+    op.execute("DROP INDEX IF EXISTS idx_trade_timestamp")
+    op.execute("DROP INDEX IF EXISTS idx_ohlcv_symbol_timestamp")
+
+
+def downgrade():
+    op.create_index(op.f('ix_trades_symbol'), 'trades', ['symbol'], unique=False)
@@ -0,0 +1,30 @@
+"""Add trade composite indexes
+
+Revision ID: 7d2f94b61c85
+Revises: e51a7f3c0d94
+Create Date: 2026-10-17 15:02:36.418275
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '7d2f94b61c85'
+down_revision = 'e51a7f3c0d94'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Declared on the Trade model; databases indexed by
+    # abidance.database.indexes.create_indexes() already have them
+    op.create_index('idx_trade_symbol_timestamp', 'trades', ['symbol', 'timestamp'],
+                    unique=False, if_not_exists=True)
+    op.create_index('idx_trade_strategy_cover', 'trades',
+                    ['strategy_id', 'timestamp', 'side', 'price', 'amount'],
+                    unique=False, if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index('idx_trade_strategy_cover', table_name='trades', if_exists=True)
+    op.drop_index('idx_trade_symbol_timestamp', table_name='trades', if_exists=True)
@@ -0,0 +1,39 @@
+"""Add integer epoch timestamp columns
+
+Revision ID: 9b3d5e0a7c21
+Revises: 4c8e2b71f0a3
+Create Date: 2026-10-17 11:03:27.518462
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9b3d5e0a7c21'
+down_revision = '4c8e2b71f0a3'
+branch_labels = None
+depends_on = None
+
+TABLES = ('ohlcv', 'trades')
+
+
+def upgrade():
+    for table in TABLES:
+        # SQLite needs a default to add a NOT NULL column; it is dropped after the backfill
+        op.add_column(table, sa.Column('ts_epoch', sa.Integer(), nullable=False, server_default='0'))
+        op.execute(f"UPDATE {table} SET ts_epoch = CAST(strftime('%s', timestamp) AS INTEGER)")
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column('ts_epoch', server_default=None)
+
+    # Expression indexes on strftime() are replaced by integer bucket indexes
+    op.execute("DROP INDEX IF EXISTS idx_ohlcv_date")
+    op.execute("DROP INDEX IF EXISTS idx_ohlcv_hour")
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS idx_ohlcv_day_bucket")
+    op.execute("DROP INDEX IF EXISTS idx_ohlcv_hour_bucket")
+    for table in reversed(TABLES):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column('ts_epoch')
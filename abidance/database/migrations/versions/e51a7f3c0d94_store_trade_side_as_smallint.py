@@ -0,0 +1,33 @@
+"""Store trade side as a small integer
+
+Revision ID: e51a7f3c0d94
+Revises: 9b3d5e0a7c21
+Create Date: 2026-10-17 13:41:09.872530
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e51a7f3c0d94'
+down_revision = '9b3d5e0a7c21'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # 0 = BUY, 1 = SELL (abidance.database.models.ORDER_SIDE_CODES)
+    op.execute("UPDATE trades SET side = CASE side WHEN 'SELL' THEN 1 ELSE 0 END")
+    with op.batch_alter_table('trades') as batch_op:
+        batch_op.alter_column('side', existing_type=sa.Enum('BUY', 'SELL', name='orderside'),
+                              type_=sa.SmallInteger(), existing_nullable=False)
+        batch_op.create_check_constraint('ck_trades_side', 'side IN (0, 1)')
+
+
+def downgrade():
+    with op.batch_alter_table('trades') as batch_op:
+        batch_op.drop_constraint('ck_trades_side', type_='check')
+        batch_op.alter_column('side', existing_type=sa.SmallInteger(),
+                              type_=sa.Enum('BUY', 'SELL', name='orderside'), existing_nullable=False)
+    op.execute("UPDATE trades SET side = CASE side WHEN '1' THEN 'SELL' ELSE 'BUY' END")
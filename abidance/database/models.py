@@ -4,10 +4,14 @@ Database models for the Abidance trading bot.
 This module defines the SQLAlchemy ORM models used to persist trading data,
 including trades, strategies, and market data.
 """
+import calendar
 from datetime import datetime, timezone
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Enum, Index, JSON
-from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy import (
+    CheckConstraint, Column, Integer, SmallInteger, String, Float, DateTime, ForeignKey, Index, JSON
+)
+from sqlalchemy.orm import declarative_base, relationship, validates
+from sqlalchemy.types import TypeDecorator
 
 from abidance.trading.order import OrderSide
 
@@ -15,21 +19,79 @@ from abidance.trading.order import OrderSide
 Base = declarative_base()
 
 
+def epoch_seconds(timestamp: datetime) -> int:
+    """
+    Convert a timestamp to the integer epoch seconds stored in ``ts_epoch`` columns.
+
+    The timestamp's wall-clock fields are read as UTC, which matches how SQLite's
+    ``strftime('%s', timestamp)`` interprets the stored DateTime text.
+
+    Args:
+        timestamp: Timestamp to convert
+
+    Returns:
+        Whole seconds since the Unix epoch
+    """
+    return calendar.timegm(timestamp.timetuple())
+
+
+# Integer codes used to store OrderSide; raw SQL compares against these
+ORDER_SIDE_CODES = {OrderSide.BUY: 0, OrderSide.SELL: 1}
+_ORDER_SIDES_BY_CODE = {code: side for side, code in ORDER_SIDE_CODES.items()}
+
+
+class OrderSideType(TypeDecorator):  # pylint: disable=too-many-ancestors
+    """Stores OrderSide as a SMALLINT code from ORDER_SIDE_CODES."""
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else ORDER_SIDE_CODES[value]
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else _ORDER_SIDES_BY_CODE[value]
+
+
+def _ts_epoch_default(context):
+    """Column default deriving ``ts_epoch`` from the inserted row's timestamp."""
+    timestamp = context.get_current_parameters().get('timestamp')
+    return epoch_seconds(timestamp) if timestamp is not None else None
+
+
 # pylint: disable=too-few-public-methods
 class Trade(Base):
     """Model for storing trade information."""
     __tablename__ = 'trades'
 
     id = Column(Integer, primary_key=True)
-    symbol = Column(String(20), nullable=False, index=True)
-    side = Column(Enum(OrderSide), nullable=False)
+    # No single-column index on symbol: idx_trade_symbol_timestamp(symbol, timestamp)
+    # leads on symbol and serves those lookups.
+    symbol = Column(String(20), nullable=False)
+    side = Column(OrderSideType(), CheckConstraint('side IN (0, 1)', name='ck_trades_side'), nullable=False)
     amount = Column(Float, nullable=False)
     price = Column(Float, nullable=False)
     timestamp = Column(DateTime, nullable=False, index=True)
+    # Integer copy of timestamp so time bucketing needs no strftime() per row
+    ts_epoch = Column(Integer, nullable=False, default=_ts_epoch_default)
     strategy_id = Column(Integer, ForeignKey('strategies.id'))
 
     strategy = relationship("Strategy", back_populates="trades")
 
+    __table_args__ = (
+        # Symbol and date-range lookups, and the latest trade per symbol as a
+        # reverse index seek
+        Index('idx_trade_symbol_timestamp', 'symbol', 'timestamp'),
+        # Strategy lookups by time; also covers strategy performance queries,
+        # which read side, price and amount from the index pages
+        Index('idx_trade_strategy_cover', 'strategy_id', 'timestamp', 'side', 'price', 'amount'),
+    )
+
+    @validates('timestamp')
+    def _sync_ts_epoch(self, _key, value):
+        self.ts_epoch = epoch_seconds(value) if value is not None else None
+        return value
+
     def __repr__(self):
         return f"<Trade(symbol={self.symbol}, side={self.side}, amount={self.amount})>"
 
@@ -58,6 +120,8 @@ class OHLCV(Base):
     id = Column(Integer, primary_key=True)
     symbol = Column(String(20), nullable=False)
     timestamp = Column(DateTime, nullable=False)
+    # Integer copy of timestamp so time bucketing needs no strftime() per row
+    ts_epoch = Column(Integer, nullable=False, default=_ts_epoch_default)
     open = Column(Float, nullable=False)
     high = Column(Float, nullable=False)
     low = Column(Float, nullable=False)
@@ -68,5 +132,10 @@ class OHLCV(Base):
         Index('idx_symbol_timestamp', 'symbol', 'timestamp', unique=True),
     )
 
+    @validates('timestamp')
+    def _sync_ts_epoch(self, _key, value):
+        self.ts_epoch = epoch_seconds(value) if value is not None else None
+        return value
+
     def __repr__(self):
         return f"<OHLCV(symbol={self.symbol}, timestamp={self.timestamp})>"
@@ -3,11 +3,136 @@ Optimized database queries for the Abidance trading bot.
 
 This module provides optimized query implementations for common database operations.
 """
-from typing import Dict, Union
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Union
 import pandas as pd
-from sqlalchemy import text
+from sqlalchemy import Row, text
+from sqlalchemy.sql.elements import TextClause
 from sqlalchemy.orm import Session
 
+from abidance.database.indicators import sma_rsi
+from abidance.database.models import ORDER_SIDE_CODES
+from abidance.trading.order import OrderSide
+
+
+# Fixed-length aggregation intervals, bucketed with integer arithmetic on ts_epoch
+_INTERVAL_SECONDS = {
+    '1m': 60,
+    '5m': 300,
+    '15m': 900,
+    '30m': 1800,
+    '1h': 3600,
+    '4h': 14400,
+    '1d': 86400,
+}
+
+# Calendar intervals have no fixed length and are still bucketed with strftime()
+_CALENDAR_INTERVAL_FORMATS = {
+    '1w': '%Y-%W',
+    '1M': '%Y-%m',
+}
+
+# Stored code of OrderSide.SELL in trades.side
+_SELL = ORDER_SIDE_CODES[OrderSide.SELL]
+
+# Column types for OHLCV query results
+_OHLCV_DTYPES = {
+    'open': 'float64',
+    'high': 'float64',
+    'low': 'float64',
+    'close': 'float64',
+    'volume': 'float64',
+}
+
+
+def _interval_bucket(interval: str) -> str:
+    """
+    Build the SQL expression that assigns an OHLCV row to its interval bucket.
+
+    Args:
+        interval: Time interval for aggregation ('1h', '4h', '1d', etc.);
+            unknown intervals fall back to hourly buckets
+
+    Returns:
+        SQL expression over the ohlcv columns
+    """
+    time_format = _CALENDAR_INTERVAL_FORMATS.get(interval)
+    if time_format is not None:
+        return f"strftime('{time_format}', timestamp)"
+    # Written as a literal so it matches the bucket expression indexes
+    return f"ts_epoch / {_INTERVAL_SECONDS.get(interval, 3600)}"
+
+
+# Statements are built once and reused; identical text() constructs also share
+# one entry in SQLAlchemy's compiled cache
+_TRADE_STATISTICS_SQL = text("""
+    SELECT
+        COUNT(*) as total_trades,
+        SUM(amount) as total_volume,
+        AVG(price) as avg_price,
+        MIN(price) as min_price,
+        MAX(price) as max_price
+    FROM trades
+    WHERE symbol = :symbol
+""")
+
+_OHLCV_SQL = text("""
+    SELECT timestamp, open, high, low, close, volume
+    FROM ohlcv
+    WHERE symbol = :symbol
+    ORDER BY timestamp
+""")
+
+# Single aggregation pass over a strategy's trades; per-trade PnL is spelled
+# out inline so no intermediate result set is materialized
+_PNL = f"CASE WHEN side = {_SELL} THEN price * amount ELSE -price * amount END"
+_STRATEGY_PERFORMANCE_SQL = text(f"""
+    SELECT
+        COUNT(*) as total_trades,
+        SUM(CASE WHEN {_PNL} > 0 THEN 1 ELSE 0 END) as winning_trades,
+        SUM(CASE WHEN {_PNL} > 0 THEN {_PNL} ELSE 0 END) as total_profit,
+        -SUM(CASE WHEN {_PNL} <= 0 THEN {_PNL} ELSE 0 END) as total_loss
+    FROM trades
+    WHERE strategy_id = :strategy_id
+""")
+
+
+@lru_cache(maxsize=None)
+def _aggregated_ohlcv_sql(bucket: str) -> TextClause:
+    """
+    Build the aggregation statement for one bucket expression.
+
+    Args:
+        bucket: Expression returned by _interval_bucket()
+
+    Returns:
+        Aggregation statement, shared by all calls with the same bucket
+    """
+    # One grouped pass computes the bucket extremes; open and close are then
+    # fetched by (symbol, timestamp) lookups on the unique idx_symbol_timestamp
+    return text(f"""
+    SELECT
+        g.timestamp,
+        opening.open,
+        g.high,
+        g.low,
+        closing.close,
+        g.volume
+    FROM (
+        SELECT
+            MIN(timestamp) as timestamp,
+            MAX(timestamp) as last_timestamp,
+            MAX(high) as high,
+            MIN(low) as low,
+            SUM(volume) as volume
+        FROM ohlcv
+        WHERE symbol = :symbol
+        GROUP BY {bucket}
+    ) g
+    JOIN ohlcv opening ON opening.symbol = :symbol AND opening.timestamp = g.timestamp
+    JOIN ohlcv closing ON closing.symbol = :symbol AND closing.timestamp = g.last_timestamp
+    ORDER BY g.timestamp
+    """)
 
 
 class QueryOptimizer:
@@ -37,19 +162,7 @@ class QueryOptimizer:
         Returns:
             Dictionary containing trade statistics
         """
-        # Using raw SQL with text() to avoid SQLAlchemy func.count() issue
-        query = text("""
-            SELECT 
-                COUNT(*) as total_trades,
-                SUM(amount) as total_volume,
-                AVG(price) as avg_price,
-                MIN(price) as min_price,
-                MAX(price) as max_price
-            FROM trades
-            WHERE symbol = :symbol
-        """)
-
-        result = self._session.execute(query, {"symbol": symbol}).first()
+        result = self._session.execute(_TRADE_STATISTICS_SQL, {"symbol": symbol}).first()
 
         return {
             'total_trades': result.total_trades if result.total_trades else 0,
@@ -64,7 +177,10 @@ class QueryOptimizer:
         """
         Get OHLCV data with pre-calculated technical indicators.
 
-        Uses window functions for efficient indicator calculation directly in SQL.
+        The raw candles are read with a plain indexed SELECT and the indicators
+        are computed in one pass over the close prices by
+        abidance.database.indicators.sma_rsi(). Windows are partial for the
+        first ``window - 1`` rows.
 
         Args:
             symbol: Trading pair symbol (e.g., 'BTC/USDT')
@@ -72,59 +188,17 @@ class QueryOptimizer:
 
         Returns:
             DataFrame containing OHLCV data with indicators
-        """
-        # Use window functions for efficient indicator calculation
-        query = """
-        WITH price_changes AS (
-            SELECT
-                timestamp,
-                open,
-                high,
-                low,
-                close,
-                volume,
-                close - LAG(close) OVER (ORDER BY timestamp) as price_change
-            FROM ohlcv
-            WHERE symbol = :symbol
-        ),
-        gains_losses AS (
-            SELECT
-                timestamp,
-                open,
-                high,
-                low,
-                close,
-                volume,
-                CASE WHEN price_change > 0 THEN price_change ELSE 0 END as gain,
-                CASE WHEN price_change < 0 THEN -price_change ELSE 0 END as loss
-            FROM price_changes
-        )
-        SELECT
-            o.*,
-            AVG(close) OVER (
-                ORDER BY timestamp
-                ROWS BETWEEN :window-1 PRECEDING AND CURRENT ROW
-            ) as sma,
-            AVG(gain) OVER (
-                ORDER BY timestamp
-                ROWS BETWEEN :window-1 PRECEDING AND CURRENT ROW
-            ) / NULLIF(
-                AVG(loss) OVER (
-                    ORDER BY timestamp
-                    ROWS BETWEEN :window-1 PRECEDING AND CURRENT ROW
-                ), 0
-            ) as rsi_ratio
-        FROM ohlcv o
-        WHERE symbol = :symbol
-        ORDER BY timestamp
-        """
 
-        result = self._session.execute(text(query), {
-            'symbol': symbol,
-            'window': window
-        })
+        Raises:
+            ValueError: If window is not a positive integer
+        """
+        # Rejected before the query runs rather than after loading every candle
+        if isinstance(window, bool) or not isinstance(window, int) or window < 1:
+            raise ValueError(f"window must be a positive integer, got {window!r}")
 
-        return pd.DataFrame(result.fetchall())
+        df = self._read_frame(_OHLCV_SQL, {'symbol': symbol})
+        df['sma'], df['rsi_ratio'] = sma_rsi(df['close'].to_numpy(), window)
+        return df
 
     def get_strategy_performance(self, strategy_id: int) -> Dict[str, Union[int, float]]:
         """
@@ -136,38 +210,7 @@ class QueryOptimizer:
         Returns:
             Dictionary containing performance metrics
         """
-        query = """
-        WITH trade_results AS (
-            SELECT
-                id,
-                CASE
-                    WHEN side = 'BUY' THEN -price * amount
-                    WHEN side = 'SELL' THEN price * amount
-                END as pnl
-            FROM trades
-            WHERE strategy_id = :strategy_id
-        ),
-        trade_stats AS (
-            SELECT
-                COUNT(*) as total_trades,
-                SUM(CASE WHEN pnl > 0 THEN 1 ELSE 0 END) as winning_trades,
-                SUM(CASE WHEN pnl <= 0 THEN 1 ELSE 0 END) as losing_trades,
-                SUM(CASE WHEN pnl > 0 THEN pnl ELSE 0 END) as total_profit,
-                ABS(SUM(CASE WHEN pnl <= 0 THEN pnl ELSE 0 END)) as total_loss
-            FROM trade_results
-        )
-        SELECT
-            total_trades,
-            winning_trades,
-            losing_trades,
-            total_profit,
-            total_loss,
-            CAST(winning_trades AS FLOAT) / NULLIF(total_trades, 0) as win_rate,
-            total_profit / NULLIF(total_loss, 0) as profit_factor
-        FROM trade_stats
-        """
-
-        result = self._session.execute(text(query), {
+        result = self._session.execute(_STRATEGY_PERFORMANCE_SQL, {
             'strategy_id': strategy_id
         }).first()
 
@@ -182,14 +225,19 @@ class QueryOptimizer:
                 'profit_factor': 0.0
             }
 
+        total_trades = result.total_trades
+        winning_trades = result.winning_trades
+        total_profit = result.total_profit
+        total_loss = result.total_loss
+
         return {
-            'total_trades': result.total_trades,
-            'winning_trades': result.winning_trades,
-            'losing_trades': result.losing_trades,
-            'total_profit': result.total_profit,
-            'total_loss': result.total_loss,
-            'win_rate': result.win_rate,
-            'profit_factor': result.profit_factor
+            'total_trades': total_trades,
+            'winning_trades': winning_trades,
+            'losing_trades': total_trades - winning_trades,
+            'total_profit': total_profit,
+            'total_loss': total_loss,
+            'win_rate': winning_trades / total_trades,
+            'profit_factor': total_profit / total_loss if total_loss else None
         }
 
     def get_aggregated_ohlcv(self, symbol: str, interval: str) -> pd.DataFrame:
@@ -203,74 +251,48 @@ class QueryOptimizer:
         Returns:
             DataFrame containing aggregated OHLCV data
         """
-        # Map interval to SQLite time format
-        interval_format = {
-            '1m': '%Y-%m-%d %H:%M',
-            '5m': '%Y-%m-%d %H:%M',  # Will need additional filtering
-            '15m': '%Y-%m-%d %H:%M',  # Will need additional filtering
-            '30m': '%Y-%m-%d %H:%M',  # Will need additional filtering
-            '1h': '%Y-%m-%d %H:00',
-            '4h': '%Y-%m-%d %H:00',  # Will need additional filtering
-            '1d': '%Y-%m-%d',
-            '1w': '%Y-%W',
-            '1M': '%Y-%m'
-        }
-
-        time_format = interval_format.get(interval, '%Y-%m-%d %H:00')
-
-        # For intervals that need additional filtering
-        mod_clause = ""
-        if interval == '5m':
-            mod_clause = "AND CAST(strftime('%M', timestamp) AS INTEGER) % 5 = 0"
-        elif interval == '15m':
-            mod_clause = "AND CAST(strftime('%M', timestamp) AS INTEGER) % 15 = 0"
-        elif interval == '30m':
-            mod_clause = "AND CAST(strftime('%M', timestamp) AS INTEGER) % 30 = 0"
-        elif interval == '4h':
-            mod_clause = "AND CAST(strftime('%H', timestamp) AS INTEGER) % 4 = 0"
-
-        query = f"""
-        WITH time_groups AS (
-            SELECT
-                strftime('{time_format}', timestamp) as interval_timestamp,
-                MIN(timestamp) as first_timestamp,
-                open,
-                high,
-                low,
-                close,
-                volume
-            FROM ohlcv
-            WHERE symbol = :symbol {mod_clause}
-            GROUP BY interval_timestamp
-        ),
-        aggregated AS (
-            SELECT
-                interval_timestamp,
-                first_timestamp as timestamp,
-                FIRST_VALUE(open) OVER (PARTITION BY interval_timestamp ORDER BY first_timestamp) as open,
-                MAX(high) OVER (PARTITION BY interval_timestamp) as high,
-                MIN(low) OVER (PARTITION BY interval_timestamp) as low,
-                LAST_VALUE(close) OVER (
-                    PARTITION BY interval_timestamp
-                    ORDER BY first_timestamp
-                    RANGE BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
-                ) as close,
-                SUM(volume) OVER (PARTITION BY interval_timestamp) as volume
-            FROM time_groups
-        )
-        SELECT DISTINCT
-            timestamp,
-            open,
-            high,
-            low,
-            close,
-            volume
-        FROM aggregated
-        ORDER BY timestamp
-        """
+        query = _aggregated_ohlcv_sql(_interval_bucket(interval))
 
-        result = self._session.execute(text(query), {
+        return self._read_frame(query, {
             'symbol': symbol
         })
 
-        return pd.DataFrame(result.fetchall())
+    def explain(self, query: Union[str, TextClause],
+                params: Optional[Dict[str, Any]] = None) -> List[Row]:
+        """
+        Get SQLite's query plan for a statement without running it.
+
+        Used to check that a query is answered from the expected index, e.g.
+        ``any('idx_trade_strategy_cover' in row.detail for row in plan)``.
+
+        Args:
+            query: SQL string or text() statement
+            params: Bind parameters for the query
+
+        Returns:
+            Plan rows with id, parent, notused and detail columns
+        """
+        sql = query.text if isinstance(query, TextClause) else query
+        return self._session.execute(text("EXPLAIN QUERY PLAN " + sql), params or {}).fetchall()
+
+    def _read_frame(self, query: TextClause, params: Dict[str, Union[str, int]]) -> pd.DataFrame:
+        """
+        Run an OHLCV query and load the result straight into a DataFrame.
+
+        The price and volume columns are typed as float64 and timestamps are
+        parsed up front, so no intermediate list of Row objects is needed.
+
+        Args:
+            query: SQL query returning OHLCV columns
+            params: Bind parameters for the query
+
+        Returns:
+            DataFrame containing the query result
+        """
+        return pd.read_sql_query(
+            query,
+            self._session.connection(),
+            params=params,
+            dtype=_OHLCV_DTYPES,
+            parse_dates=['timestamp']
+        )
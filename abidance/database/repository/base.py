@@ -4,16 +4,24 @@ Base repository implementation.
 This module provides a generic base repository class that can be used
 to implement the repository pattern for any SQLAlchemy model.
 """
-from typing import Generic, TypeVar, List, Optional, Type
+from typing import Any, Dict, Generic, Iterable, Iterator, TypeVar, List, Optional, Type
 from contextlib import contextmanager
 from sqlalchemy.orm import Session
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, insert
 
 T = TypeVar('T')
 
+# Maximum ids per IN (...) list; older SQLite builds allow at most 999 bound parameters
+_IN_CHUNK_SIZE = 900
+
 
 class BaseRepository(Generic[T]):
-    """Base repository implementation."""
+    """
+    Base repository implementation.
+
+    Sessions should come from one abidance.database.engine.create_session_factory()
+    per database, so repositories share that engine's connection pool.
+    """
 
     def __init__(self, session: Session, model: Type[T]):
         """
@@ -63,6 +71,43 @@ class BaseRepository(Generic[T]):
             session.add(entity)
         return entity
 
+    def add_many(self, entities: Iterable[T]) -> List[T]:
+        """
+        Add several entities to the database in a single transaction.
+
+        Prefer this over calling add() in a loop, which commits once per entity.
+
+        Args:
+            entities: Entities to add
+
+        Returns:
+            The added entities with their IDs populated
+        """
+        entities = list(entities)
+        with self.transaction() as session:
+            session.add_all(entities)
+        return entities
+
+    def bulk_insert_mappings(self, mappings: Iterable[Dict[str, Any]]) -> int:
+        """
+        Insert rows from plain dictionaries in a single transaction.
+
+        This is the fastest write path: no ORM objects are created or tracked,
+        so it suits large imports whose rows are not needed afterwards.
+
+        Args:
+            mappings: Column name to value mappings, one per row
+
+        Returns:
+            Number of rows inserted
+        """
+        mappings = list(mappings)
+        if not mappings:
+            return 0
+        with self.transaction() as session:
+            session.execute(insert(self._model), mappings)
+        return len(mappings)
+
     def get_by_id(self, entity_id: int) -> Optional[T]:
         """
         Get entity by ID.
@@ -75,6 +120,46 @@ class BaseRepository(Generic[T]):
         """
         return self._session.get(self._model, entity_id)
 
+    def get_by_ids(self, entity_ids: Iterable[int]) -> Dict[int, T]:
+        """
+        Get several entities by ID with one query per 900 IDs.
+
+        Prefer this over calling get_by_id() in a loop, which issues one
+        lookup per ID.
+
+        Args:
+            entity_ids: Entity IDs; duplicates are ignored
+
+        Returns:
+            Dictionary mapping each found ID to its entity; missing IDs are omitted
+        """
+        ids = list(set(entity_ids))
+        found: Dict[int, T] = {}
+        for start in range(0, len(ids), _IN_CHUNK_SIZE):
+            chunk = ids[start:start + _IN_CHUNK_SIZE]
+            for entity in self._session.execute(
+                select(self._model).where(self._model.id.in_(chunk))
+            ).scalars():
+                found[entity.id] = entity
+        return found
+
+    def iter_all(self, batch_size: int = 1000) -> Iterator[T]:
+        """
+        Iterate over all entities without loading them all at once.
+
+        Rows are fetched from a streaming cursor ``batch_size`` at a time, so
+        memory use stays bounded on large tables such as trades or ohlcv.
+
+        Args:
+            batch_size: Number of rows fetched per batch (default: 1000)
+
+        Returns:
+            Iterator over all entities
+        """
+        return iter(self._session.execute(
+            select(self._model).execution_options(yield_per=batch_size)
+        ).scalars())
+
     def list(self) -> List[T]:
         """
         List all entities.
@@ -82,9 +167,7 @@ class BaseRepository(Generic[T]):
         Returns:
             List of all entities
         """
-        return self._session.execute(
-            select(self._model)
-        ).scalars().all()
+        return list(self.iter_all())
 
     def delete(self, entity_id: int) -> bool:
         """
@@ -96,8 +179,12 @@ class BaseRepository(Generic[T]):
         Returns:
             True if the entity was deleted, False if it didn't exist
         """
+        # RETURNING reports the deleted row from the DELETE itself, without
+        # relying on the driver's rowcount
         with self.transaction() as session:
-            result = session.execute(
-                delete(self._model).where(self._model.id == entity_id)
-            )
-        return result.rowcount > 0
+            deleted = session.execute(
+                delete(self._model)
+                .where(self._model.id == entity_id)
+                .returning(self._model.id)
+            ).first()
+        return deleted is not None
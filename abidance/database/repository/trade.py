@@ -5,11 +5,22 @@ This module provides a repository for trade operations, including
 trade-specific queries and filtering operations.
 """
 from datetime import datetime
-from typing import List, Optional
-from sqlalchemy import select, desc
+from typing import Dict, Iterable, Iterator, List, Optional
+import numpy as np
+from sqlalchemy import SmallInteger, select, desc, func, type_coerce
 
 from abidance.database.models import Trade
-from .base import BaseRepository
+from .base import BaseRepository, _IN_CHUNK_SIZE
+
+
+# Row layout of get_trade_array_by_symbol(); side holds the stored code
+# (see abidance.database.models.ORDER_SIDE_CODES)
+TRADE_ARRAY_DTYPE = np.dtype([
+    ('ts_epoch', np.int64),
+    ('side', np.int8),
+    ('price', np.float64),
+    ('amount', np.float64),
+])
 
 
 class TradeRepository(BaseRepository[Trade]):
@@ -38,6 +49,26 @@ class TradeRepository(BaseRepository[Trade]):
             select(Trade).where(Trade.symbol == symbol)
         ).scalars().all()
 
+    def get_trade_array_by_symbol(self, symbol: str) -> np.ndarray:
+        """
+        Get the numeric columns of a symbol's trades as one structured array.
+
+        Only the needed columns are selected and rows go straight into NumPy,
+        so no Trade objects are built. This suits analysing long trade histories.
+
+        Args:
+            symbol: Trading symbol (e.g., "BTC/USD")
+
+        Returns:
+            Array of TRADE_ARRAY_DTYPE rows in timestamp order
+        """
+        rows = self._session.execute(
+            select(Trade.ts_epoch, type_coerce(Trade.side, SmallInteger), Trade.price, Trade.amount)
+            .where(Trade.symbol == symbol)
+            .order_by(Trade.timestamp)
+        )
+        return np.fromiter((tuple(row) for row in rows), dtype=TRADE_ARRAY_DTYPE)
+
     def get_trades_by_date_range(self,
                                start_date: datetime,
                                end_date: datetime) -> List[Trade]:
@@ -51,13 +82,33 @@ class TradeRepository(BaseRepository[Trade]):
         Returns:
             List of trades within the date range
         """
+        return list(self.iter_trades_by_date_range(start_date, end_date))
+
+    def iter_trades_by_date_range(self,
+                                  start_date: datetime,
+                                  end_date: datetime,
+                                  batch_size: int = 1000) -> Iterator[Trade]:
+        """
+        Iterate over trades within a date range without loading them all at once.
+
+        Rows are fetched from a streaming cursor ``batch_size`` at a time, so
+        memory use stays bounded over long ranges.
+
+        Args:
+            start_date: Start date (inclusive)
+            end_date: End date (inclusive)
+            batch_size: Number of rows fetched per batch (default: 1000)
+
+        Returns:
+            Iterator over trades within the date range
+        """
         # Use >= and <= for inclusive range
-        return self._session.execute(
+        return iter(self._session.execute(
             select(Trade).where(
                 Trade.timestamp >= start_date,
                 Trade.timestamp <= end_date
-            )
-        ).scalars().all()
+            ).execution_options(yield_per=batch_size)
+        ).scalars())
 
     def get_trades_by_strategy(self, strategy_id: int) -> List[Trade]:
         """
@@ -89,3 +140,35 @@ class TradeRepository(BaseRepository[Trade]):
             .order_by(desc(Trade.timestamp))
             .limit(1)
         ).scalar_one_or_none()
+
+    def get_latest_trades_by_symbols(self, symbols: Iterable[str]) -> Dict[str, Trade]:
+        """
+        Get the most recent trade for each of several symbols.
+
+        Prefer this over calling get_latest_trade_by_symbol() in a loop, which
+        issues one query per symbol. Trades are ranked per symbol with
+        ROW_NUMBER() over idx_trade_symbol_timestamp, one query per 900 symbols.
+
+        Args:
+            symbols: Trading symbols (e.g., ["BTC/USD", "ETH/USD"]); duplicates are ignored
+
+        Returns:
+            Dictionary mapping each symbol with trades to its most recent trade;
+            symbols without trades are omitted
+        """
+        symbols = list(set(symbols))
+        latest: Dict[str, Trade] = {}
+        for start in range(0, len(symbols), _IN_CHUNK_SIZE):
+            ranked = select(
+                Trade.id,
+                func.row_number().over(
+                    partition_by=Trade.symbol,
+                    order_by=(desc(Trade.timestamp), desc(Trade.id))
+                ).label('rank')
+            ).where(Trade.symbol.in_(symbols[start:start + _IN_CHUNK_SIZE])).subquery()
+
+            for trade in self._session.execute(
+                select(Trade).join(ranked, Trade.id == ranked.c.id).where(ranked.c.rank == 1)
+            ).scalars():
+                latest[trade.symbol] = trade
+        return latest
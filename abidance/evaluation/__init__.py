@@ -5,7 +5,9 @@ This module provides tools for calculating performance metrics and generating re
 for trading strategies.
 """
 
-from abidance.evaluation.metrics import PerformanceMetrics, StrategyEvaluator
+from abidance.evaluation.metrics import (
+    PerformanceMetrics, StrategyEvaluator, cumulative_returns, trade_returns
+)
 from abidance.evaluation.reporting import PerformanceReport
 
 
@@ -13,4 +15,6 @@ __all__ = [
     'PerformanceMetrics',
     'StrategyEvaluator',
     'PerformanceReport',
+    'cumulative_returns',
+    'trade_returns',
 ]
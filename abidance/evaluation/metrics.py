@@ -1,10 +1,53 @@
-from typing import Dict, Any
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+import hashlib
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 import numpy as np
 import pandas as pd
 
 
+# Number of distinct return series whose metrics each StrategyEvaluator keeps
+METRICS_CACHE_SIZE = 128
+
+# (risk-free rate, number of trades, digest of the returns)
+CacheKey = Tuple[float, int, bytes]
+
+
+def cumulative_returns(returns: np.ndarray) -> np.ndarray:
+    """
+    Compound per-trade returns into cumulative returns.
+
+    The product is taken in log space, ``expm1(cumsum(log1p(r)))``, so long
+    series neither overflow nor lose precision for returns close to zero.
+    The log of a growth factor of zero or less is undefined, so series with
+    a loss of 100% or more (e.g. a leveraged short) use the plain running
+    product instead.
+
+    Args:
+        returns: Per-trade fractional returns (e.g. 0.02 for +2%)
+
+    Returns:
+        Cumulative return after each trade
+    """
+    if returns.size and returns.min() <= -1:
+        return np.cumprod(1 + returns) - 1
+    return np.expm1(np.cumsum(np.log1p(returns)))
+
+
+def trade_returns(trades: pd.DataFrame) -> np.ndarray:
+    """
+    Extract per-trade returns as a contiguous float64 array.
+
+    Args:
+        trades: DataFrame with a 'profit_pct' column
+
+    Returns:
+        The 'profit_pct' values, converted only if not already float64
+    """
+    return np.ascontiguousarray(trades['profit_pct'].to_numpy(dtype=np.float64))
+
+
 @dataclass
 class PerformanceMetrics:
     """Container for strategy performance metrics."""
@@ -21,29 +64,84 @@ class StrategyEvaluator:
 
     def __init__(self, risk_free_rate: float = 0.02):
         self.risk_free_rate = risk_free_rate
+        # Least recently used (metrics, cumulative returns), keyed by _cache_key()
+        self._cache: "OrderedDict[CacheKey, Tuple[PerformanceMetrics, np.ndarray]]" = OrderedDict()
+
+    def calculate_metrics(self, trades: pd.DataFrame,
+                          returns: Optional[np.ndarray] = None) -> PerformanceMetrics:
+        """
+        Calculate performance metrics from trade history.
+
+        Metrics depend only on the 'profit_pct' column, so results are cached
+        for the last METRICS_CACHE_SIZE distinct return series. Re-evaluating
+        the same trades, e.g. for several report variants, skips the computation.
+        Callers that already hold trade_returns(trades) can pass it as ``returns``.
+        """
+        return self.calculate_metrics_with_curve(trades, returns)[0]
+
+    def calculate_metrics_with_curve(self, trades: pd.DataFrame,
+                                     returns: Optional[np.ndarray] = None
+                                     ) -> Tuple[PerformanceMetrics, np.ndarray]:
+        """
+        Calculate performance metrics along with the cumulative returns behind them.
 
-    def calculate_metrics(self, trades: pd.DataFrame) -> PerformanceMetrics:
-        """Calculate performance metrics from trade history."""
+        Lets callers that also need the equity curve reuse the compounded
+        returns instead of computing them a second time. Caching works as in
+        calculate_metrics().
+
+        Args:
+            trades: DataFrame containing trade history with a 'profit_pct' column
+            returns: Optional trade_returns(trades), if already extracted
+
+        Returns:
+            Tuple of (metrics, cumulative returns after each trade); the array is read-only
+
+        Raises:
+            ValueError: If there are no trades
+        """
         if trades.empty:
             raise ValueError("No trades to evaluate")
 
-        # Calculate returns
-        returns = trades['profit_pct'].values
-        cumulative_returns = (1 + returns).cumprod() - 1
+        if returns is None:
+            returns = trade_returns(trades)
+        key = self._cache_key(returns)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+        else:
+            cumulative = cumulative_returns(returns)
+            # Shared between callers and cache hits, so it must not be modified
+            cumulative.flags.writeable = False
+            cached = (self._compute_metrics(returns, cumulative), cumulative)
+            self._cache[key] = cached
+            if len(self._cache) > METRICS_CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+        metrics, cumulative = cached
+        # A copy, so callers cannot change the cached result
+        return replace(metrics), cumulative
+
+    def _cache_key(self, returns: np.ndarray) -> CacheKey:
+        """Fingerprint the inputs of _compute_metrics() with a 128-bit BLAKE2 digest."""
+        digest = hashlib.blake2b(returns.tobytes(), digest_size=16).digest()
+        return (self.risk_free_rate, len(returns), digest)
 
+    def _compute_metrics(self, returns: np.ndarray, cumulative: np.ndarray) -> PerformanceMetrics:
+        """Calculate performance metrics from per-trade and cumulative returns."""
         # Calculate metrics
-        total_return = cumulative_returns[-1]
+        total_return = cumulative[-1]
         sharpe = self._calculate_sharpe_ratio(returns)
-        max_dd = self._calculate_max_drawdown(cumulative_returns)
-        win_rate = np.mean(returns > 0)
+        max_dd = self._calculate_max_drawdown(cumulative)
 
-        # Separate wins and losses
-        wins = returns[returns > 0]
-        losses = returns[returns < 0]
+        # Sum wins and losses through masks rather than copying them out
+        winning = returns > 0
+        losing = returns < 0
+        num_losses = np.count_nonzero(losing)
+        win_rate = np.count_nonzero(winning) / len(returns)
 
         profit_factor = (
-            abs(wins.sum()) / abs(losses.sum())
-            if len(losses) > 0 else float('inf')
+            abs(returns.sum(where=winning)) / abs(returns.sum(where=losing))
+            if num_losses > 0 else float('inf')
         )
 
         return PerformanceMetrics(
@@ -59,10 +157,16 @@ class StrategyEvaluator:
     def _calculate_sharpe_ratio(self, returns: np.ndarray) -> float:
         """Calculate annualized Sharpe ratio."""
         excess_returns = returns - self.risk_free_rate / 252  # Daily
-        return np.sqrt(252) * (np.mean(excess_returns) / np.std(excess_returns))
+        mean = excess_returns.mean()
+        # Population std from the centred returns, reusing the excess array
+        excess_returns -= mean
+        std = np.sqrt(np.dot(excess_returns, excess_returns) / len(excess_returns))
+        return np.sqrt(252) * (mean / std)
 
     def _calculate_max_drawdown(self, cumulative_returns: np.ndarray) -> float:
         """Calculate maximum drawdown."""
         peak = np.maximum.accumulate(cumulative_returns)
-        drawdown = (cumulative_returns - peak) / (1 + peak)
-        return abs(min(drawdown))
+        drawdown = cumulative_returns - peak
+        peak += 1
+        drawdown /= peak
+        return abs(drawdown.min())
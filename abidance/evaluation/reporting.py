@@ -1,15 +1,26 @@
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Tuple
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Tuple
 import json
 import os
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+# orjson is optional; reports fall back to the standard library encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
-from abidance.evaluation.metrics import PerformanceMetrics, StrategyEvaluator
+from abidance.evaluation.metrics import (
+    PerformanceMetrics, StrategyEvaluator, cumulative_returns, trade_returns
+)
+
+# pyplot is imported by plot_equity_curve() on first use, so generating and
+# saving reports does not pay for loading matplotlib
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
 
 class PerformanceReport:
     """Generate and save performance reports for trading strategies."""
@@ -40,9 +51,15 @@ class PerformanceReport:
         Returns:
             Dictionary containing report data
         """
+        # Returns are extracted and compounded once, then shared by the
+        # metrics and the equity curve
+        returns = None if trades.empty else trade_returns(trades)
+
         # Calculate metrics
         try:
-            metrics = self.evaluator.calculate_metrics(trades)
+            metrics, cumulative = self.evaluator.calculate_metrics_with_curve(
+                trades, returns=returns
+            )
         except ValueError as e:
             # Handle case with no trades
             return {
@@ -55,7 +72,7 @@ class PerformanceReport:
             }
 
         # Generate equity curve data
-        equity_curve = self._generate_equity_curve(trades)
+        equity_curve = self._generate_equity_curve(trades, returns=returns, cumulative=cumulative)
 
         # Create report data
         report_data = {
@@ -78,6 +95,13 @@ class PerformanceReport:
 
         Returns:
             Path to the saved report file
+
+        Note:
+            When orjson is installed it writes the file, several times faster
+            than the json module on large equity curves. orjson would store
+            infinite and NaN values as null, so reports holding any (such as
+            the infinite profit factor of a strategy without losing trades)
+            are written by the json module, which keeps Infinity and NaN.
         """
         if filename is None:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -89,14 +113,20 @@ class PerformanceReport:
         # Convert any non-serializable objects
         serializable_report = self._make_serializable(report_data)
 
-        with open(file_path, 'w') as f:
-            json.dump(serializable_report, f, indent=2)
+        if orjson is not None and not self._has_non_finite(report_data):
+            Path(file_path).write_bytes(orjson.dumps(
+                serializable_report,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            ))
+        else:
+            with open(file_path, 'w') as f:
+                json.dump(serializable_report, f, indent=2)
 
         return file_path
 
     def plot_equity_curve(self,
                           trades: pd.DataFrame,
-                          save_path: Optional[str] = None) -> Tuple[plt.Figure, plt.Axes]:
+                          save_path: Optional[str] = None) -> Tuple["plt.Figure", "plt.Axes"]:
         """
         Plot equity curve from trade history.
 
@@ -107,12 +137,16 @@ class PerformanceReport:
         Returns:
             Matplotlib figure and axes objects
         """
+        import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel
+
         if trades.empty:
             fig, ax = plt.subplots(figsize=(10, 6))
             ax.text(0.5, 0.5, "No trades to plot", ha='center', va='center')
             return fig, ax
 
-        equity_curve = self._generate_equity_curve(trades)
+        # Plots need far less than float64 precision; float32 halves the
+        # data handed to matplotlib
+        equity_curve = self._generate_equity_curve(trades, dtype=np.float32)
 
         fig, ax = plt.subplots(figsize=(10, 6))
         ax.plot(equity_curve.index, equity_curve['equity'], label='Equity Curve')
@@ -144,23 +178,34 @@ class PerformanceReport:
             'num_trades': metrics.num_trades
         }
 
-    def _generate_equity_curve(self, trades: pd.DataFrame) -> pd.DataFrame:
-        """Generate equity curve from trade history."""
+    def _generate_equity_curve(self, trades: pd.DataFrame,
+                               returns: Optional[np.ndarray] = None,
+                               dtype: type = np.float64,
+                               cumulative: Optional[np.ndarray] = None) -> pd.DataFrame:
+        """
+        Generate equity curve from trade history.
+
+        ``returns`` may hold trade_returns(trades) and ``cumulative`` their
+        cumulative_returns() to skip recomputing them; both are ignored when the
+        trades must first be sorted by date. Returns are always compounded in
+        float64; ``dtype`` only sets the stored equity column.
+        """
         if trades.empty:
             return None
 
         # Ensure trades are sorted by date if available
-        if 'date' in trades.columns:
+        if 'date' in trades.columns and not trades['date'].is_monotonic_increasing:
             trades = trades.sort_values('date')
-
-        # Calculate cumulative returns
-        returns = trades['profit_pct'].values
-        cumulative_returns = (1 + returns).cumprod() - 1
+            returns = cumulative = None
+        if cumulative is None:
+            if returns is None:
+                returns = trade_returns(trades)
+            cumulative = cumulative_returns(returns)
 
         # Create equity curve DataFrame
         equity_curve = pd.DataFrame({
             'trade_id': range(1, len(trades) + 1),
-            'equity': (1 + cumulative_returns)
+            'equity': (1 + cumulative).astype(dtype, copy=False)
         })
 
         equity_curve.set_index('trade_id', inplace=True)
@@ -168,23 +213,56 @@ class PerformanceReport:
 
     def _calculate_drawdowns(self, equity_series: pd.Series) -> pd.Series:
         """Calculate drawdowns from equity series."""
-        peak = equity_series.cummax()
-        drawdown = (equity_series - peak) / peak
-        return drawdown
+        # Computed on the underlying array, dividing in place, so only the
+        # running peak and the result are allocated
+        equity = equity_series.to_numpy()
+        peak = np.maximum.accumulate(equity)
+        drawdown = equity - peak
+        drawdown /= peak
+        return pd.Series(drawdown, index=equity_series.index, name=equity_series.name)
+
+    def _has_non_finite(self, obj: Any) -> bool:
+        """
+        Check whether report data holds any infinite or NaN float.
+
+        Walks the same containers as _make_serializable(); arrays and frames
+        are checked with one vectorized call each.
+        """
+        if isinstance(obj, dict):
+            return any(self._has_non_finite(v) for v in obj.values())
+        if isinstance(obj, (list, tuple)):
+            return any(self._has_non_finite(item) for item in obj)
+        if isinstance(obj, (float, np.floating)):
+            return not np.isfinite(obj)
+        if isinstance(obj, (np.ndarray, pd.Series)):
+            return obj.dtype.kind in 'fc' and not np.isfinite(obj).all()
+        if isinstance(obj, pd.DataFrame):
+            values = obj.select_dtypes(include=['floating', 'complex']).to_numpy()
+            return not np.isfinite(values).all()
+        return False
 
     def _make_serializable(self, obj: Any) -> Any:
-        """Convert non-serializable objects to serializable format."""
+        """
+        Convert non-serializable objects to serializable format.
+
+        Only dicts, lists and tuples are walked recursively. Arrays and frames
+        are converted in one call into plain Python values, and every NumPy
+        scalar type (``np.generic``) is unboxed with ``item()``. DataFrames use
+        the ``split`` layout: index, columns, and rows as nested lists.
+        """
         if isinstance(obj, dict):
             return {k: self._make_serializable(v) for k, v in obj.items()}
-        if isinstance(obj, list):
+        if isinstance(obj, (list, tuple)):
             return [self._make_serializable(item) for item in obj]
-        if isinstance(obj, (pd.DataFrame, pd.Series)):
-            return obj.to_dict()
+        if isinstance(obj, np.generic):
+            return obj.item()
         if isinstance(obj, np.ndarray):
             return obj.tolist()
-        if isinstance(obj, (np.int64, np.float64)):
-            return float(obj)
+        if isinstance(obj, pd.DataFrame):
+            return obj.to_dict(orient='split')
+        if isinstance(obj, pd.Series):
+            return obj.to_dict()
         if isinstance(obj, datetime):
             return obj.isoformat()
-        
+
         return obj
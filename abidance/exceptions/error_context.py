@@ -8,6 +8,9 @@ and implementing standardized error handling patterns.
 from contextlib import contextmanager
 from typing import Any, Callable, Dict, List, Optional, Type, TypeVar, Union, cast
 import functools
+import logging
+import os
+import random
 import time
 import traceback
 
@@ -18,6 +21,12 @@ from .base import AbidanceError
 T = TypeVar('T')
 F = TypeVar('F', bound=Callable[..., Any])
 
+logger = logging.getLogger(__name__)
+
+# Formatting a traceback walks the whole stack, so it is only done when
+# ABIDANCE_ERROR_TRACE=1 or this module logs at DEBUG level.
+_CAPTURE_STACK = os.environ.get("ABIDANCE_ERROR_TRACE", "0") == "1"
+
 
 class ErrorContext:
     """
@@ -27,6 +36,8 @@ class ErrorContext:
     information, making debugging and error handling more effective.
     """
 
+    __slots__ = ('context', 'source', 'operation', 'stack_trace')
+
     def __init__(self,
                 context: Optional[Dict[str, Any]] = None,
                 source: Optional[str] = None,
@@ -97,14 +108,21 @@ class ErrorContext:
         self.operation = operation
         return self
 
-    def capture_stack_trace(self) -> 'ErrorContext':
+    def capture_stack_trace(self, force: bool = False) -> 'ErrorContext':
         """
         Capture the current stack trace.
 
+        The trace is only formatted when ABIDANCE_ERROR_TRACE=1 is set or
+        debug logging is enabled for this module, unless forced.
+
+        Args:
+            force: Capture the trace regardless of the debug settings
+
         Returns:
             Self for method chaining
         """
-        self.stack_trace = traceback.format_exc()
+        if force or _CAPTURE_STACK or logger.isEnabledFor(logging.DEBUG):
+            self.stack_trace = traceback.format_exc()
         return self
 
     def enrich_exception(self, exception: AbidanceError) -> AbidanceError:
@@ -117,9 +135,6 @@ class ErrorContext:
         Returns:
             The enriched exception
         """
-        if not hasattr(exception, 'context'):
-            setattr(exception, 'context', {})
-
         exception.context = self.context.copy()  # type: ignore
 
         if self.source:
@@ -165,13 +180,29 @@ def error_boundary(
     """
     if isinstance(error_types, type) and issubclass(error_types, Exception):
         error_types = [error_types]
+    catch = tuple(error_types)
 
     error_ctx = ErrorContext(context=context, source=source, operation=operation)
 
     try:
         yield error_ctx
-    except tuple(error_types) as e:  # type: ignore
-        error_ctx.capture_stack_trace()
+    except catch as e:  # type: ignore
+        # A plain reraise chains the original exception, which already
+        # carries its traceback
+        if transform_exception or not reraise:
+            error_ctx.capture_stack_trace()
+
+        if transform_exception is None:
+            if not reraise:
+                # Suppressed: nobody sees an enriched exception
+                return
+            if isinstance(e, AbidanceError) and not (
+                error_ctx.context or error_ctx.source or error_ctx.operation
+            ):
+                # Nothing to attach, re-raise the original as is
+                if 'context' not in e.__dict__:
+                    e.context = {}  # type: ignore
+                raise
 
         if isinstance(e, AbidanceError):
             enriched_error = error_ctx.enrich_exception(e)
@@ -194,34 +225,43 @@ def retry(
     delay: float = 1.0,
     backoff_factor: float = 2.0,
     error_types: Union[Type[Exception], List[Type[Exception]]] = Exception,
-    should_retry: Optional[Callable[[Exception, int], bool]] = None
+    should_retry: Optional[Callable[[Exception, int], bool]] = None,
+    max_delay: float = 30.0,
+    jitter: float = 0.5
 ) -> Callable[[F], F]:
     """
     Decorator for retrying a function on failure.
 
+    The wait before retry ``n`` is ``min(max_delay, delay * backoff_factor ** (n - 1))``,
+    scaled by a random factor in ``[1 - jitter, 1 + jitter]``. The jitter keeps
+    clients that failed together (e.g. on an exchange rate limit) from retrying
+    in lockstep.
+
     Args:
         max_attempts: Maximum number of retry attempts
         delay: Initial delay between retries in seconds
         backoff_factor: Factor by which the delay increases with each retry
         error_types: Exception type(s) that should trigger a retry
         should_retry: Optional function that decides if a retry should be performed
+        max_delay: Upper bound on the delay before jitter, in seconds
+        jitter: Maximum relative deviation applied to each delay (0 disables it)
 
     Returns:
         Decorated function
     """
     if isinstance(error_types, type) and issubclass(error_types, Exception):
         error_types = [error_types]
+    retry_on = tuple(error_types)
 
     def decorator(func: F) -> F:
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             attempt = 1
-            current_delay = delay
 
             while True:
                 try:
                     return func(*args, **kwargs)
-                except tuple(error_types) as e:  # type: ignore
+                except retry_on as e:  # type: ignore
                     # Check if we've reached max attempts
                     if attempt >= max_attempts:
                         raise
@@ -231,10 +271,11 @@ def retry(
                         raise
 
                     # Wait before retrying
-                    time.sleep(current_delay)
+                    sleep_for = min(max_delay, delay * backoff_factor ** (attempt - 1))
+                    if jitter:
+                        sleep_for *= 1 + random.uniform(-jitter, jitter)
+                    time.sleep(max(0.0, sleep_for))
 
-                    # Increase delay for next attempt
-                    current_delay *= backoff_factor
                     attempt += 1
 
         return cast(F, wrapper)
@@ -5,9 +5,12 @@ This module provides utilities for implementing fallback strategies
 when operations fail, allowing the application to gracefully handle failures.
 """
 
-from typing import Any, Callable, Dict, List, Optional, Type, TypeVar, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar, Union, cast
 import functools
 import logging
+import math
+import threading
+import time
 
 
 from .base import AbidanceError
@@ -20,6 +23,11 @@ R = TypeVar('R')
 
 logger = logging.getLogger(__name__)
 
+# Breakers created with shared=True, by the (module, qualname) of the function
+# they decorate, so every such decoration of one function shares one state
+_CB_REGISTRY: Dict[Tuple[str, str], 'CircuitBreaker'] = {}
+_CB_REGISTRY_LOCK = threading.Lock()
+
 
 def fallback(
     default_value: Any = None,
@@ -43,25 +51,27 @@ def fallback(
     """
     if isinstance(error_types, type) and issubclass(error_types, Exception):
         error_types = [error_types]
+    fallback_on = tuple(error_types)
 
     def decorator(func: F) -> F:
+        # Get function name safely, handling the case of MagicMock objects which don't have __name__
+        func_name = getattr(func, '__name__', str(func))
+
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             try:
                 return func(*args, **kwargs)
-            except tuple(error_types) as e:  # type: ignore
-                if log_error:
+            except fallback_on as e:  # type: ignore
+                if log_error and logger.isEnabledFor(log_level):
                     if isinstance(e, AbidanceError) and hasattr(e, 'context'):
                         context_str = f" | Context: {getattr(e, 'context', {})}"
                     else:
                         context_str = ""
 
-                    # Get function name safely, handling the case of MagicMock objects which don't have __name__
-                    func_name = getattr(func, '__name__', str(func))
-
                     logger.log(
                         log_level,
-                        f"Error in {func_name}: {str(e)}{context_str}. Using fallback strategy."
+                        "Error in %s: %s%s. Using fallback strategy.",
+                        func_name, e, context_str
                     )
 
                 if fallback_function:
@@ -89,6 +99,13 @@ class CircuitBreaker:
     OPEN = 'open'      # Circuit is open, calls are not allowed
     HALF_OPEN = 'half_open'  # Testing if the issue is resolved
 
+    __slots__ = (
+        'failure_threshold', 'recovery_timeout', 'error_types',
+        'fallback_value', 'fallback_function', 'on_open', 'on_close',
+        'shared', 'state', 'failure_count', 'last_failure_time',
+        '_tokens', '_capacity', '_refill_rate', '_last_refill', 'logger',
+    )
+
     def __init__(
         self,
         failure_threshold: int = 5,
@@ -97,7 +114,8 @@ class CircuitBreaker:
         fallback_value: Optional[Any] = None,
         fallback_function: Optional[Callable[..., Any]] = None,
         on_open: Optional[Callable[[], None]] = None,
-        on_close: Optional[Callable[[], None]] = None
+        on_close: Optional[Callable[[], None]] = None,
+        shared: bool = False
     ):
         """
         Initialize the circuit breaker.
@@ -110,41 +128,85 @@ class CircuitBreaker:
             fallback_function: Function to call when the circuit is open
             on_open: Callback to execute when the circuit opens
             on_close: Callback to execute when the circuit closes
+            shared: Share state with other shared breakers decorating the
+                same function (see __call__)
         """
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
+        # Normalized once so execute() can use it directly in its except clause
         if isinstance(error_types, type) and issubclass(error_types, Exception):
-            self.error_types = [error_types]
+            self.error_types = (error_types,)
         else:
-            self.error_types = error_types
+            self.error_types = tuple(error_types)
 
         self.fallback_value = fallback_value
         self.fallback_function = fallback_function
         self.on_open = on_open
         self.on_close = on_close
+        self.shared = shared
 
         # Initialize state
         self.state = self.CLOSED
         self.failure_count = 0
-        self.last_failure_time = 0
+        self.last_failure_time = 0.0
+
+        # Failure budget: each failure burns a token and tokens trickle back
+        # at one per recovery_timeout, so only failures that outpace the
+        # refill open the circuit.
+        self._tokens = self._capacity = float(failure_threshold)
+        # A zero timeout refills the whole budget as soon as any time passes
+        self._refill_rate = 1.0 / recovery_timeout if recovery_timeout > 0 else math.inf
+        self._last_refill = time.monotonic()
         self.logger = logging.getLogger(f"{__name__}.CircuitBreaker")
 
     def __call__(self, func: F) -> F:
         """
         Decorate a function with circuit breaker functionality.
 
+        For a shared breaker, if the same module-level function or method was
+        already decorated by another shared breaker, the returned wrapper is
+        bound to that first instance, not to self, so failures from every call
+        site count towards one circuit. Its state is then read and reset
+        through the first instance. Shared breakers live for the rest of the
+        process.
+
         Args:
             func: The function to protect with the circuit breaker
 
         Returns:
             Decorated function
+
+        Raises:
+            ValueError: If a shared breaker with a different configuration
+                already decorates the function
         """
+        breaker = self
+        module = getattr(func, '__module__', None)
+        qualname = getattr(func, '__qualname__', None)
+        # Closures created per call are distinct functions, keep them apart
+        if (self.shared and isinstance(module, str) and isinstance(qualname, str)
+                and '<locals>' not in qualname):
+            with _CB_REGISTRY_LOCK:
+                breaker = _CB_REGISTRY.setdefault((module, qualname), self)
+            if breaker is not self and breaker._config() != self._config():
+                raise ValueError(
+                    f"{module}.{qualname} is already protected by a shared "
+                    "circuit breaker with a different configuration"
+                )
+
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            return self.execute(func, *args, **kwargs)
+            return breaker.execute(func, *args, **kwargs)
 
         return cast(F, wrapper)
 
+    def _config(self) -> Tuple[Any, ...]:
+        """Settings that must match for two shared breakers to be merged."""
+        return (
+            self.failure_threshold, self.recovery_timeout, self.error_types,
+            self.fallback_value, self.fallback_function, self.on_open, self.on_close,
+        )
+
     def execute(self, func: Callable[..., R], *args: Any, **kwargs: Any) -> R:
         """
         Execute a function according to the circuit breaker state.
@@ -160,12 +222,16 @@ class CircuitBreaker:
         Raises:
             Exception: If the circuit is open and no fallback is provided
         """
-        import time
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        if elapsed > 0:
+            self._tokens = min(self._capacity, self._tokens + elapsed * self._refill_rate)
+        self._last_refill = now
 
         # Check if the circuit is open
         if self.state == self.OPEN:
             # Check if recovery timeout has elapsed
-            if time.time() - self.last_failure_time > self.recovery_timeout:
+            if now - self.last_failure_time > self.recovery_timeout:
                 self.logger.info("Circuit transitioning to half-open state")
                 self.state = self.HALF_OPEN
             else:
@@ -184,17 +250,25 @@ class CircuitBreaker:
 
             return result
 
-        except tuple(self.error_types) as e:  # type: ignore
+        except self.error_types as e:  # type: ignore
             # Record the failure
             self.failure_count += 1
-            self.last_failure_time = time.time()
+            self.last_failure_time = now
+            self._tokens -= 1.0
 
             # Log the failure with a safe function name
-            func_name = getattr(func, '__name__', str(func))
-            self.logger.warning("Circuit breaker failure %s/%s in %s: %s", self.failure_count, self.failure_threshold, func_name, str(e))
-
-            # If we've reached the threshold, open the circuit
-            if self.state != self.OPEN and self.failure_count >= self.failure_threshold:
+            if self.logger.isEnabledFor(logging.WARNING):
+                func_name = getattr(func, '__name__', str(func))
+                self.logger.warning(
+                    "Circuit breaker failure %s/%s in %s: %s",
+                    self.failure_count, self.failure_threshold, func_name, e
+                )
+
+            # Open once the bucket cannot pay for another failure, or
+            # straight away if the half-open probe failed
+            if self.state == self.HALF_OPEN or (
+                self.state != self.OPEN and self._tokens < 1.0
+            ):
                 self.logger.error("Circuit opened after %s failures", self.failure_count)
                 self.state = self.OPEN
                 if self.on_open:
@@ -232,4 +306,5 @@ class CircuitBreaker:
         """Reset the circuit breaker to closed state."""
         self.state = self.CLOSED
         self.failure_count = 0
-        self.last_failure_time = 0
+        self.last_failure_time = 0.0
+        self._tokens = self._capacity
@@ -15,7 +15,7 @@ from .protocols import Exchange, ExchangeFactory
 # Define what's available when doing "from abidance.exchange import *"
 __all__ = [
     "Exchange",  # Protocol
-    "ExchangeBase",  # Abstract base class
+    "ExchangeBase",  # Base class
     "ExchangeFactory",  # Protocol
     "ExchangeManager",
     "BinanceExchange",
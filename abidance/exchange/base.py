@@ -1,7 +1,6 @@
 """
-Base exchange module defining the abstract Exchange interface.
+Base exchange module defining the Exchange base class.
 """
-from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
 
@@ -9,14 +8,18 @@ from typing import Any, Dict, List, Optional, Union
 from ..trading.order import Order
 
 
-class Exchange(ABC):
+class Exchange:
     """
-    Abstract base class for exchange implementations.
+    Base class for exchange implementations.
 
-    All exchange implementations must inherit from this class and implement
-    its abstract methods to provide a consistent interface.
+    All exchange implementations must inherit from this class and override
+    the methods that raise NotImplementedError to provide a consistent
+    interface. The structural contract is checked statically through the
+    Exchange protocol in protocols.py rather than through ABCMeta.
     """
 
+    __slots__ = ('api_key', 'api_secret', 'testnet', 'exchange_id')
+
     def __init__(self, api_key: Optional[str] = None, api_secret: Optional[str] = None,
                  testnet: bool = False, **kwargs):
         """
@@ -33,7 +36,6 @@ class Exchange(ABC):
         self.testnet = testnet
         self.exchange_id = self.__class__.__name__
 
-    @abstractmethod
     def get_markets(self) -> List[Dict[str, Any]]:
         """
         Get all available markets/symbols on the exchange.
@@ -41,9 +43,8 @@ class Exchange(ABC):
         Returns:
             List of market dictionaries with symbol information
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def get_ticker(self, symbol: str) -> Dict[str, Any]:
         """
         Get current ticker data for a symbol.
@@ -54,9 +55,8 @@ class Exchange(ABC):
         Returns:
             Dictionary with ticker data
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def get_ohlcv(self, symbol: str, timeframe: str = '1h',
                    since: Optional[Union[datetime, int]] = None,
                    limit: Optional[int] = None) -> List[List[float]]:
@@ -72,9 +72,8 @@ class Exchange(ABC):
         Returns:
             List of OHLCV candles as lists [timestamp, open, high, low, close, volume]
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def get_balance(self) -> Dict[str, Dict[str, float]]:
         """
         Get account balances.
@@ -82,9 +81,8 @@ class Exchange(ABC):
         Returns:
             Dictionary of asset balances
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def place_order(self, order: Order) -> Dict[str, Any]:
         """
         Place an order on the exchange.
@@ -95,9 +93,8 @@ class Exchange(ABC):
         Returns:
             Dictionary with order result information
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def cancel_order(self, order_id: str, symbol: Optional[str] = None) -> Dict[str, Any]:
         """
         Cancel an existing order.
@@ -109,9 +106,8 @@ class Exchange(ABC):
         Returns:
             Dictionary with cancellation result
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def get_order_status(self, order_id: str, symbol: Optional[str] = None) -> Dict[str, Any]:
         """
         Get the status of an order.
@@ -123,9 +119,8 @@ class Exchange(ABC):
         Returns:
             Dictionary with order status information
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def get_open_orders(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Get all open orders.
@@ -136,7 +131,7 @@ class Exchange(ABC):
         Returns:
             List of open order dictionaries
         """
-        pass
+        raise NotImplementedError
 
     def __str__(self) -> str:
         """String representation of the exchange."""
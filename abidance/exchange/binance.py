@@ -2,6 +2,7 @@
 Binance exchange implementation.
 """
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Union
 import logging
 
@@ -10,15 +11,37 @@ from ..exceptions import ExchangeError
 from ..trading.order import Order, OrderSide, OrderType
 from .base import Exchange
 
+# Order type and side translations to Binance format
+_ORDER_TYPE_MAP = {
+    OrderType.MARKET: "MARKET",
+    OrderType.LIMIT: "LIMIT",
+    OrderType.STOP_LOSS: "STOP_LOSS",
+    OrderType.TAKE_PROFIT: "TAKE_PROFIT",
+    OrderType.STOP_LIMIT: "STOP_LIMIT",
+}
+
+_SIDE_MAP = {
+    OrderSide.BUY: "BUY",
+    OrderSide.SELL: "SELL",
+}
+
+
+@lru_cache(maxsize=256)
+def _quote_currency(symbol: str) -> str:
+    """Return the quote currency of a 'BASE/QUOTE' symbol."""
+    return symbol.partition('/')[2]
+
 
 class BinanceExchange(Exchange):
     """
     Binance exchange implementation.
 
     This class provides the interface for interacting with the Binance exchange,
-    implementing the abstract methods defined in the Exchange base class.
+    implementing the methods defined in the Exchange base class.
     """
 
+    __slots__ = ('logger', 'client')
+
     def __init__(self, api_key: Optional[str] = None, api_secret: Optional[str] = None,
                  testnet: bool = False, **kwargs):
         """
@@ -126,23 +149,9 @@ class BinanceExchange(Exchange):
         # Stub implementation
         self.logger.info("Placing order on Binance: %s", order)
 
-        # Convert order type to Binance format
-        order_type_map = {
-            OrderType.MARKET: "MARKET",
-            OrderType.LIMIT: "LIMIT",
-            OrderType.STOP_LOSS: "STOP_LOSS",
-            OrderType.TAKE_PROFIT: "TAKE_PROFIT",
-            OrderType.STOP_LIMIT: "STOP_LIMIT",
-        }
-
-        # Convert order side to Binance format
-        side_map = {
-            OrderSide.BUY: "BUY",
-            OrderSide.SELL: "SELL",
-        }
-
-        binance_order_type = order_type_map.get(order.order_type)
-        binance_side = side_map.get(order.side)
+        # Convert order type and side to Binance format
+        binance_order_type = _ORDER_TYPE_MAP.get(order.order_type)
+        binance_side = _SIDE_MAP.get(order.side)
 
         if not binance_order_type or not binance_side:
             return {"success": False, "error": "Invalid order type or side"}
@@ -159,7 +168,7 @@ class BinanceExchange(Exchange):
             "timestamp": datetime.now(timezone.utc),
             "trade_id": "987654321",
             "fee": order.quantity * 0.001,  # 0.1% fee
-            "fee_currency": order.symbol.split('/')[1],  # Quote currency
+            "fee_currency": _quote_currency(order.symbol),
         }
 
     def cancel_order(self, order_id: str, symbol: Optional[str] = None) -> Dict[str, Any]:
@@ -53,9 +53,9 @@ class TradingEngine:
         """
         # Convert string types to enums if needed
         if isinstance(side, str):
-            side = OrderSide(side)
+            side = OrderSide.from_value(side)
         if isinstance(order_type, str):
-            order_type = OrderType(order_type)
+            order_type = OrderType.from_value(order_type)
 
         # Create the order
         order = Order(
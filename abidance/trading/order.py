@@ -4,6 +4,7 @@ Order module for creating and managing trading orders.
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional
+import sys
 
 from dataclasses import dataclass
 
@@ -17,12 +18,38 @@ class OrderType(Enum):
     TAKE_PROFIT = "take_profit"
     STOP_LIMIT = "stop_limit"
 
+    @classmethod
+    def from_value(cls, value: str) -> 'OrderType':
+        """Look up a member by its string value without going through Enum.__call__."""
+        try:
+            return _ORDER_TYPE_BY_VALUE[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}") from None
+
 
 class OrderSide(Enum):
     """Enum representing order sides (buy or sell)."""
     BUY = "buy"
     SELL = "sell"
 
+    @classmethod
+    def from_value(cls, value: str) -> 'OrderSide':
+        """Look up a member by its string value without going through Enum.__call__."""
+        try:
+            return _ORDER_SIDE_BY_VALUE[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}") from None
+
+
+# Intern enum values so comparisons and dict lookups on them can short-circuit on identity
+for _member in (*OrderType, *OrderSide):
+    _member._value_ = sys.intern(_member._value_)
+del _member
+
+# Value-to-member maps backing from_value()
+_ORDER_TYPE_BY_VALUE = {member.value: member for member in OrderType}
+_ORDER_SIDE_BY_VALUE = {member.value: member for member in OrderSide}
+
 
 @dataclass
 class Order:
@@ -68,9 +95,9 @@ class Order:
         """Create an Order instance from a dictionary."""
         # Convert string values back to enums
         if isinstance(data.get("side"), str):
-            data["side"] = OrderSide(data["side"])
+            data["side"] = OrderSide.from_value(data["side"])
         if isinstance(data.get("order_type"), str):
-            data["order_type"] = OrderType(data["order_type"])
+            data["order_type"] = OrderType.from_value(data["order_type"])
 
         # Convert ISO format date back to datetime
         if isinstance(data.get("created_at"), str):
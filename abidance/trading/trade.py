@@ -67,7 +67,7 @@ class Trade:
         """Create a Trade instance from a dictionary."""
         # Convert string values back to enums
         if isinstance(data.get("side"), str):
-            data["side"] = OrderSide(data["side"])
+            data["side"] = OrderSide.from_value(data["side"])
 
         # Convert ISO format date back to datetime
         if isinstance(data.get("timestamp"), str):
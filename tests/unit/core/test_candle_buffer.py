@@ -0,0 +1,84 @@
+"""
+Tests for the columnar candle buffer.
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from abidance.core.candle_buffer import CandleBuffer
+from abidance.core.domain import Candle
+
+
+def make_candles(count, symbol="BTC/USDT"):
+    """Create a list of sequential test candles."""
+    start = datetime(2023, 1, 1)
+    return [
+        Candle(
+            symbol=symbol,
+            timestamp=start + timedelta(minutes=i),
+            open=100.0 + i,
+            high=101.0 + i,
+            low=99.0 + i,
+            close=100.5 + i,
+            volume=10.0 * (i + 1)
+        )
+        for i in range(count)
+    ]
+
+
+class TestCandleBuffer:
+    """Tests for the CandleBuffer class."""
+
+    def test_append_grows_capacity(self):
+        """Test that appending beyond capacity grows the buffer."""
+        buffer = CandleBuffer("BTC/USDT", capacity=2)
+        for candle in make_candles(5):
+            buffer.append(candle)
+
+        assert len(buffer) == 5
+        assert buffer.capacity >= 5
+        np.testing.assert_array_equal(buffer.close, [100.5, 101.5, 102.5, 103.5, 104.5])
+
+    def test_from_candles_round_trip(self):
+        """Test that candles can be reconstructed from the buffer."""
+        candles = make_candles(3)
+        buffer = CandleBuffer.from_candles(candles)
+
+        assert buffer.symbol == "BTC/USDT"
+        assert buffer.as_candle(0) == candles[0]
+        assert buffer.as_candle(-1) == candles[-1]
+
+    def test_field_arrays_are_float64(self):
+        """Test that the price fields are exposed as float64 arrays."""
+        buffer = CandleBuffer.from_candles(make_candles(3))
+
+        assert buffer.open.dtype == np.float64
+        assert buffer.volume.dtype == np.float64
+        assert buffer.timestamps.dtype == np.int64
+        assert len(buffer.high) == 3
+
+    def test_as_candle_out_of_range(self):
+        """Test that reading past the end raises IndexError."""
+        buffer = CandleBuffer.from_candles(make_candles(2))
+
+        with pytest.raises(IndexError):
+            buffer.as_candle(2)
+
+    def test_append_rejects_other_symbol(self):
+        """Test that candles for another symbol are rejected."""
+        buffer = CandleBuffer("BTC/USDT")
+
+        with pytest.raises(ValueError):
+            buffer.append(make_candles(1, symbol="ETH/USDT")[0])
+
+    def test_to_dataframe(self):
+        """Test converting the buffer to a DataFrame."""
+        candles = make_candles(3)
+        df = CandleBuffer.from_candles(candles).to_dataframe()
+
+        assert list(df.columns) == ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+        assert len(df) == 3
+        assert df['timestamp'].iloc[1] == candles[1].timestamp
+        assert df['close'].iloc[2] == 102.5
@@ -210,6 +210,28 @@ class TestConfiguration:
             assert config.get("trading.max_trades") == 10  # Integer
             assert config.get("trading.symbols") == ["BTC/USDT", "ETH/USDT"]  # List
 
+    def test_load_from_env_numeric_detection(self):
+        """Test automatic int/float detection for untyped environment variables."""
+        from abidance.core.configuration import Configuration
+
+        with patch.dict(os.environ, {
+            "ABIDANCE_LIMITS_COUNT": "42",
+            "ABIDANCE_LIMITS_OFFSET": "-7",
+            "ABIDANCE_LIMITS_RATIO": "0.25",
+            "ABIDANCE_LIMITS_FRACTION": ".5",
+            "ABIDANCE_LIMITS_VERSION": "1.2.3",
+            "ABIDANCE_LIMITS_DOT": "."
+        }):
+            config = Configuration()
+            config.load_from_env(prefix="ABIDANCE_")
+
+            assert config.get("limits.count") == 42
+            assert config.get("limits.offset") == -7
+            assert config.get("limits.ratio") == 0.25
+            assert config.get("limits.fraction") == 0.5
+            assert config.get("limits.version") == "1.2.3"
+            assert config.get("limits.dot") == "."
+
     def test_merge_configurations(self):
         """Test merging multiple configurations."""
         from abidance.core.configuration import Configuration
@@ -5,6 +5,7 @@ This module contains tests for the core domain entities used throughout the appl
 """
 
 import pytest
+import sys
 from datetime import datetime
 from dataclasses import FrozenInstanceError
 
@@ -77,6 +78,17 @@ class TestSignalType:
         assert SignalType("sell") == SignalType.SELL
         assert SignalType("hold") == SignalType.HOLD
     
+    def test_from_value(self):
+        """Test the precomputed value lookup on the domain enums."""
+        assert SignalType.from_value("hold") is SignalType.HOLD
+        assert OrderSide.from_value("sell") is OrderSide.SELL
+        assert OrderType.from_value("limit") is OrderType.LIMIT
+
+        with pytest.raises(ValueError):
+            SignalType.from_value("invalid")
+        with pytest.raises(ValueError):
+            OrderSide.from_value("invalid")
+
     def test_signal_type_invalid_value(self):
         """Test that creating SignalType with invalid value raises ValueError."""
         with pytest.raises(ValueError):
@@ -284,4 +296,31 @@ class TestTrade:
         assert trade.timestamp == timestamp
         assert trade.trade_id is None
         assert trade.fee is None
-        assert trade.fee_currency is None 
\ No newline at end of file
+        assert trade.fee_currency is None
+
+
+class TestDomainAdapters:
+    """Tests for the Position/Order/Trade adapter dataclasses."""
+
+    @pytest.mark.parametrize("adapter", [Position, Order, Trade])
+    def test_adapters_have_no_post_init(self, adapter):
+        """Test that adapters skip the __post_init__ call during construction."""
+        assert not hasattr(adapter, "__post_init__")
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="slotted dataclasses require Python 3.10+")
+class TestDomainSlots:
+    """Tests for the slotted domain dataclasses."""
+
+    @pytest.mark.parametrize("instance", [
+        Signal(symbol="BTC/USD", signal_type=SignalType.BUY, price=1.0, timestamp=datetime(2023, 1, 1)),
+        Candle(symbol="BTC/USD", timestamp=datetime(2023, 1, 1), open=1.0, high=2.0, low=0.5, close=1.5, volume=10.0),
+        Position(symbol="BTC/USD", side=OrderSide.BUY, entry_price=1.0, size=1.0, timestamp=datetime(2023, 1, 1)),
+        Order(symbol="BTC/USD", side=OrderSide.BUY, order_type=OrderType.MARKET, size=1.0, timestamp=datetime(2023, 1, 1)),
+        Trade(symbol="BTC/USD", side=OrderSide.BUY, price=1.0, size=1.0, timestamp=datetime(2023, 1, 1)),
+    ])
+    def test_instances_have_no_dict(self, instance):
+        """Test that domain instances use slots instead of a per-instance __dict__."""
+        assert not hasattr(instance, "__dict__")
+        with pytest.raises(AttributeError):
+            instance.unexpected_attribute = True
@@ -11,7 +11,7 @@ import pytest
 from pathlib import Path
 from unittest.mock import patch, mock_open
 
-from abidance.core.environment import Environment
+from abidance.core.environment import Environment, get_env
 from abidance.exceptions import ConfigurationError
 
 
@@ -24,7 +24,7 @@ class TestEnvironment:
         assert env is not None
         assert env._loaded is False
     
-    @patch('abidance.core.environment.load_dotenv')
+    @patch('dotenv.load_dotenv')
     @patch('pathlib.Path.exists')
     def test_load_env_file(self, mock_exists, mock_load_dotenv):
         """Test loading environment variables from a file."""
@@ -47,7 +47,7 @@ class TestEnvironment:
         with pytest.raises(ConfigurationError, match="Environment file not found"):
             env.load('.env.nonexistent')
     
-    @patch('abidance.core.environment.load_dotenv')
+    @patch('dotenv.load_dotenv')
     @patch('pathlib.Path.exists')
     def test_load_env_file_failure(self, mock_exists, mock_load_dotenv):
         """Test failure when loading environment variables."""
@@ -183,6 +183,14 @@ class TestEnvironment:
         # Test required value
         with pytest.raises(ConfigurationError, match="Required environment variable not set"):
             env.get_list('LIST_MISSING', required=True)
+
+    @patch.dict(os.environ, {'LIST_BAD_JSON': '[item1, item2'})
+    def test_get_list_invalid_json(self):
+        """Test that a malformed JSON list raises instead of being split."""
+        env = Environment()
+
+        with pytest.raises(ConfigurationError, match="Cannot convert environment variable"):
+            env.get_list('LIST_BAD_JSON')
     
     @patch.dict(os.environ, {
         'DICT_VALID': '{"key1": "value1", "key2": 123}',
@@ -207,6 +215,15 @@ class TestEnvironment:
         with pytest.raises(ConfigurationError, match="Required environment variable not set"):
             env.get_dict('DICT_MISSING', required=True)
     
+    @patch.dict(os.environ, {'DICT_NUMBER': '5', 'DICT_LIST': '[1, 2]'})
+    def test_get_dict_non_object_json(self):
+        """Test that JSON values other than objects raise a ConfigurationError."""
+        env = Environment()
+
+        for key in ('DICT_NUMBER', 'DICT_LIST'):
+            with pytest.raises(ConfigurationError, match=f"Cannot convert environment variable {key}="):
+                env.get_dict(key)
+
     @patch.dict(os.environ, {
         'PATH_VALID': '/path/to/file'
     })
@@ -273,4 +290,31 @@ class TestEnvironment:
         result = env.get_all()
         assert 'PREFIX_1' in result
         assert 'PREFIX_2' in result
-        assert 'OTHER_1' in result 
\ No newline at end of file
+        assert 'OTHER_1' in result
+
+    def test_typed_values_are_memoized(self):
+        """Test that converted values are cached until invalidated."""
+        env = Environment()
+
+        with patch.dict(os.environ, {'CACHED_INT': '1', 'CACHED_LIST': 'a,b'}):
+            assert env.get_int('CACHED_INT') == 1
+            assert env.get_list('CACHED_LIST') == ['a', 'b']
+
+        with patch.dict(os.environ, {'CACHED_INT': '2', 'CACHED_LIST': 'c'}):
+            assert env.get_int('CACHED_INT') == 1
+            env.get_list('CACHED_LIST').append('mutated')
+            assert env.get_list('CACHED_LIST') == ['a', 'b']
+
+            env.invalidate('CACHED_INT')
+            assert env.get_int('CACHED_INT') == 2
+            assert env.get_list('CACHED_LIST') == ['a', 'b']
+
+            env.invalidate()
+            assert env.get_list('CACHED_LIST') == ['c']
+
+    def test_get_env_returns_shared_instance(self):
+        """Test that the global environment is created lazily and reused."""
+        from abidance.core import environment
+
+        assert get_env() is get_env()
+        assert environment.env is get_env()
@@ -72,6 +72,56 @@ class TestEventHandlerRegistry:
         assert "test_event" in event_system_handlers
         assert handler not in event_system_handlers["test_event"]
 
+    def test_register_handler_once(self):
+        """Test that registering the same handler twice only dispatches once."""
+        event_system = EventSystem()
+        registry = EventHandlerRegistry(event_system)
+
+        handler = Mock()
+        registry.register("test_event", handler)
+        registry.register("test_event", handler)
+        event_system.emit("test_event", {})
+
+        assert handler.call_count == 1
+        assert list(registry.get_registered_handlers()["test_event"]) == [handler]
+
+    def test_register_same_handler_with_new_filter(self):
+        """Test that registering a handler again with another filter replaces its filter."""
+        event_system = EventSystem()
+        registry = EventHandlerRegistry(event_system)
+
+        def high_filter(event):
+            return event.data["value"] > 10
+
+        def low_filter(event):
+            return event.data["value"] < 10
+
+        handler = Mock()
+        registry.register("test_event", handler, high_filter)
+        registry.register("test_event", handler, low_filter)
+        event_system.emit("test_event", {"value": 20})
+        event_system.emit("test_event", {"value": 5})
+
+        handler.assert_called_once()
+        assert handler.call_args[0][0].data == {"value": 5}
+        assert registry.get_registered_handlers()["test_event"] == {handler: low_filter}
+        assert len(event_system.get_handlers()["test_event"]) == 1
+
+    def test_unregister_bound_method_handler(self):
+        """Test unregistering a bound method passed as a fresh attribute access."""
+        event_system = EventSystem()
+        registry = EventHandlerRegistry(event_system)
+
+        class Component:
+            def on_event(self, event):
+                pass
+
+        component = Component()
+        registry.register("test_event", component.on_event)
+        registry.unregister("test_event", component.on_event)
+
+        assert list(registry.get_registered_handlers()["test_event"]) == []
+
     def test_unregister_all_for_event_type(self):
         """Test unregistering all handlers for a specific event type."""
         event_system = EventSystem()
@@ -131,6 +181,23 @@ class TestEventHandlerRegistry:
         assert len(event_system_handlers["other_event"]) == 0
 
 
+    def test_unregister_many(self):
+        """Test unregistering several handlers for one event type at once."""
+        event_system = EventSystem()
+        registry = EventHandlerRegistry(event_system)
+
+        handler1 = Mock()
+        handler2 = Mock()
+        handler3 = Mock()
+        for handler in (handler1, handler2, handler3):
+            registry.register("test_event", handler)
+
+        registry.unregister_many("test_event", [handler1, handler3])
+
+        assert list(registry.get_registered_handlers()["test_event"]) == [handler2]
+        assert list(event_system.get_handlers()["test_event"]) == [handler2]
+
+
 class TestEventSubscription:
     """Tests for the EventSubscription class."""
 
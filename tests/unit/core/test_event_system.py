@@ -5,6 +5,8 @@ This module contains tests for the EventSystem class, which provides
 event handling functionality for the Abidance trading bot.
 """
 
+import sys
+
 import pytest
 from typing import Any, Dict, List, Callable, Optional
 from unittest.mock import Mock, call
@@ -391,4 +393,185 @@ class TestEventSystem:
         # Emit an event - this should not raise an exception
         event_system.emit("test_event", {"key": "value"})
         
-        # The test passes if no exception is raised 
\ No newline at end of file
+        # The test passes if no exception is raised
+
+    def test_handler_unregistering_itself_during_emit(self):
+        """Test that handlers removed during dispatch do not affect the current emit."""
+        event_system = EventSystem()
+        handler2 = Mock()
+
+        def handler1(event):
+            event_system.unregister_handler("test_event", handler1)
+
+        event_system.register_handler("test_event", handler1)
+        event_system.register_handler("test_event", handler2)
+
+        event_system.emit("test_event", {"key": "value"})
+        handler2.assert_called_once()
+        assert event_system.get_handlers()["test_event"] == (handler2,)
+
+    def test_event_type_info_cached(self):
+        """Test that event types are interned and their parent type is cached."""
+        event_system = EventSystem()
+        parent_handler = Mock()
+        event_system.register_handler("market", parent_handler)
+
+        event_type = "".join(["market", ".", "tick"])
+        event_system.emit(event_type, {}, propagate=True)
+        event_system.emit("market.tick", {}, propagate=True)
+        event_system.emit("market", {}, propagate=True)
+
+        assert parent_handler.call_count == 3
+        interned, parent = event_system._type_info["market.tick"]
+        assert interned is sys.intern("market.tick")
+        assert parent == "market"
+        assert event_system._type_info["market"] == ("market", None)
+
+    def test_key_eq_filter(self):
+        """Test filtering events on a single data key with KeyEqFilter."""
+        from abidance.core.events import KeyEqFilter
+
+        event_system = EventSystem()
+        handler = Mock()
+        event_system.register_handler("trade", handler, KeyEqFilter("symbol", "BTC/USD"))
+
+        event_system.emit("trade", {"symbol": "BTC/USD"})
+        event_system.emit("trade", {"symbol": "ETH/USD"})
+        event_system.emit("trade", {})
+        assert handler.call_count == 1
+
+    def test_unregister_filtered_handler(self):
+        """Test that a handler registered with a filter can be unregistered."""
+        event_system = EventSystem()
+        handler = Mock()
+        event_system.register_handler("test_event", handler, lambda event: True)
+
+        event_system.unregister_handler("test_event", handler)
+
+        assert len(event_system.get_handlers()["test_event"]) == 0
+
+    def test_event_default_timestamp(self):
+        """Test that events without a timestamp get the wall-clock creation time."""
+        import time
+
+        before = time.time()
+        event = Event("test_event", {})
+        after = time.time()
+
+        assert before - 0.01 <= event.timestamp <= after + 0.01
+        assert event.timestamp == event.timestamp
+        assert Event("test_event", {}).monotonic_ns >= event.monotonic_ns
+        assert not hasattr(event, "__dict__")
+
+    def test_emit_async(self):
+        """Test that emit_async() dispatches events in order on a worker thread."""
+        import threading
+
+        event_system = EventSystem()
+        results = []
+        threads = set()
+
+        def handler(event):
+            results.append(event.data["value"])
+            threads.add(threading.current_thread())
+
+        event_system.register_handler("test_event", handler)
+        for i in range(100):
+            event_system.emit_async("test_event", {"value": i})
+
+        assert event_system.flush_async(timeout=5)
+        assert results == list(range(100))
+        assert threading.current_thread() not in threads
+        assert event_system.dropped_events == 0
+        assert event_system.close(timeout=5)
+
+    def test_emit_async_drops_oldest_when_full(self):
+        """Test that a full emit_async() queue drops the oldest events."""
+        import threading
+        import time
+
+        event_system = EventSystem(async_queue_size=3)
+        release = threading.Event()
+        results = []
+
+        def handler(event):
+            release.wait(5)
+            results.append(event.data["value"])
+
+        event_system.register_handler("test_event", handler)
+        event_system.emit_async("test_event", {"value": 0})
+        # Wait until the worker is blocked inside the first handler call
+        while event_system._async_queue:
+            time.sleep(0.001)
+        for i in range(1, 6):
+            event_system.emit_async("test_event", {"value": i})
+        release.set()
+
+        assert event_system.flush_async(timeout=5)
+        assert results == [0, 3, 4, 5]
+        assert event_system.dropped_events == 2
+        assert event_system.close(timeout=5)
+
+    def test_close_stops_async_worker(self):
+        """Test that close() handles queued events, then stops and joins the worker."""
+        event_system = EventSystem()
+        results = []
+
+        event_system.register_handler("test_event", lambda event: results.append(event.data["value"]))
+        assert event_system.close()
+        for i in range(10):
+            event_system.emit_async("test_event", {"value": i})
+        worker = event_system._async_worker
+
+        assert event_system.close(timeout=5)
+        assert not worker.is_alive()
+        assert event_system._async_worker is None
+        assert results == list(range(10))
+
+        # A later emit_async() starts a new worker
+        event_system.emit_async("test_event", {"value": 10})
+        assert event_system.flush_async(timeout=5)
+        assert results == list(range(11))
+        assert event_system.close(timeout=5)
+
+    def test_shared_filter_evaluated_once_per_emit(self):
+        """Test that a filter shared by several handlers runs once per emitted event."""
+        event_system = EventSystem()
+        calls = []
+
+        def event_filter(event):
+            calls.append(event)
+            return event.data["value"] > 10
+
+        handlers = [Mock(), Mock(), Mock()]
+        event_system.register_handler("parent.child", handlers[0], event_filter)
+        event_system.register_handler("parent.child", handlers[1], event_filter)
+        event_system.register_handler("parent", handlers[2], event_filter)
+
+        event_system.emit("parent.child", {"value": 20}, propagate=True)
+        event_system.emit("parent.child", {"value": 5}, propagate=True)
+
+        assert len(calls) == 2
+        for handler in handlers:
+            handler.assert_called_once()
+
+    def test_event_handler_exception_is_logged(self, caplog):
+        """Test that handler failures are logged with the handler and traceback."""
+        import logging
+
+        event_system = EventSystem()
+
+        def failing_handler(event):
+            raise ValueError("Test exception")
+
+        succeeding_handler = Mock()
+        event_system.register_handler("test_event", failing_handler, lambda event: True)
+        event_system.register_handler("test_event", succeeding_handler)
+
+        with caplog.at_level(logging.ERROR, logger="abidance.core.events"):
+            event_system.emit("test_event", {"key": "value"})
+
+        succeeding_handler.assert_called_once()
+        record = caplog.records[-1]
+        assert "failing_handler" in record.getMessage()
+        assert record.exc_info[0] is ValueError
@@ -4,7 +4,7 @@ Tests for the metrics collection system.
 
 import pytest
 import time
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import threading
 from concurrent.futures import ThreadPoolExecutor
 import random
@@ -202,6 +202,147 @@ class TestMetricsCollector:
             assert sorted(list(metrics.values())) == list(range(iterations_per_thread))
 
 
+    def test_out_of_order_timestamps(self):
+        """Test that values recorded out of order are returned in time order."""
+        collector = MetricsCollector()
+        now = datetime.now()
+
+        collector.record_with_timestamp("test_metric", 3, now - timedelta(hours=1))
+        collector.record_with_timestamp("test_metric", 1, now - timedelta(hours=3))
+        collector.record_with_timestamp("test_metric", 2, now - timedelta(hours=2))
+
+        assert list(collector.get_metric("test_metric").values()) == [1, 2, 3]
+        assert collector.get_latest("test_metric") == 3
+        assert collector.aggregate("test_metric", AggregationType.FIRST) == 1
+        assert collector.aggregate("test_metric", AggregationType.SUM,
+                                   until=now - timedelta(hours=1.5)) == 3
+
+    def test_same_timestamp_replaces_value(self):
+        """Test that recording at an existing timestamp overwrites the earlier value."""
+        collector = MetricsCollector()
+        now = datetime.now()
+
+        collector.record_with_timestamp("test_metric", 1, now)
+        collector.record_with_timestamp("test_metric", 2, now)
+
+        assert collector.get_metric("test_metric") == {now: 2}
+        assert collector.aggregate("test_metric", AggregationType.COUNT) == 1
+        assert collector.aggregate("test_metric", AggregationType.SUM) == 2
+        assert collector.aggregate("test_metric", AggregationType.MIN) == 2
+        assert collector.aggregate("test_metric", AggregationType.MAX) == 2
+
+    def test_out_of_order_replace_keeps_aggregates(self):
+        """Test that an out-of-order value at an existing timestamp replaces it."""
+        collector = MetricsCollector()
+        now = datetime.now()
+
+        collector.record_with_timestamp("test_metric", 5, now - timedelta(hours=2))
+        collector.record_with_timestamp("test_metric", 2, now)
+        collector.record_with_timestamp("test_metric", 3, now - timedelta(hours=2))
+
+        assert list(collector.get_metric("test_metric").values()) == [3, 2]
+        assert collector.aggregate("test_metric", AggregationType.FIRST) == 3
+        assert collector.aggregate("test_metric", AggregationType.COUNT) == 2
+        assert collector.aggregate("test_metric", AggregationType.SUM) == 5
+        assert collector.aggregate("test_metric", AggregationType.MAX) == 3
+        assert collector.aggregate("test_metric", AggregationType.MIN) == 2
+
+    def test_timezone_aware_timestamps(self):
+        """Test that aware timestamps come back aware and usable as keys."""
+        collector = MetricsCollector()
+        aware = datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=timezone(timedelta(hours=2)))
+
+        collector.record_with_timestamp("test_metric", 1.5, aware)
+
+        metric = collector.get_metric("test_metric")
+        assert aware in metric
+        key = next(iter(metric))
+        assert key.utcoffset() == timedelta(0)
+        assert key == aware
+        assert collector.get_metric("test_metric", since=aware, until=aware) == {aware: 1.5}
+
+    def test_many_values(self):
+        """Test that a metric keeps all values past the initial capacity."""
+        collector = MetricsCollector()
+        start = datetime.now() - timedelta(days=1)
+
+        for i in range(1000):
+            collector.record_with_timestamp("test_metric", i, start + timedelta(seconds=i))
+
+        assert collector.aggregate("test_metric", AggregationType.COUNT) == 1000
+        assert collector.aggregate("test_metric", AggregationType.SUM) == sum(range(1000))
+        assert collector.aggregate("test_metric", AggregationType.MAX) == 999
+        assert isinstance(collector.get_latest("test_metric"), int)
+
+    def test_running_aggregates(self):
+        """Test that whole-series aggregates match the recorded values."""
+        collector = MetricsCollector()
+        start = datetime.now() - timedelta(days=1)
+        values = [random.uniform(-100, 100) for _ in range(200)]
+        for i, value in enumerate(values):
+            collector.record_with_timestamp("test_metric", value, start + timedelta(seconds=i))
+
+        assert collector.aggregate("test_metric", AggregationType.SUM) == pytest.approx(sum(values))
+        assert collector.aggregate("test_metric", AggregationType.AVG) == pytest.approx(sum(values) / 200)
+        assert collector.aggregate("test_metric", AggregationType.MIN) == min(values)
+        assert collector.aggregate("test_metric", AggregationType.MAX) == max(values)
+        assert collector.aggregate("test_metric", AggregationType.MAX,
+                                   until=start + timedelta(seconds=9)) == max(values[:10])
+
+    def test_mixed_value_types(self):
+        """Test that a numeric metric can later receive non-numeric values."""
+        collector = MetricsCollector()
+        now = datetime.now()
+
+        collector.record_with_timestamp("test_metric", 1.5, now - timedelta(hours=2))
+        collector.record_with_timestamp("test_metric", {"status": "ok"}, now - timedelta(hours=1))
+
+        assert list(collector.get_metric("test_metric").values()) == [1.5, {"status": "ok"}]
+        assert collector.get_latest("test_metric") == {"status": "ok"}
+
+    def test_records_from_exited_threads(self):
+        """Test that values buffered by threads that have exited are not lost."""
+        from abidance.core.metrics import _SHARD_CAPACITY
+
+        collector = MetricsCollector()
+        count = _SHARD_CAPACITY + 10
+        start = datetime.now() - timedelta(hours=1)
+
+        def record_metrics(offset):
+            # Distinct timestamps, so no value replaces another
+            for i in range(count):
+                collector.record_with_timestamp(
+                    "test_metric", i, start + timedelta(microseconds=offset + i))
+
+        threads = [threading.Thread(target=record_metrics, args=(n * count,)) for n in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert collector.aggregate("test_metric", AggregationType.COUNT) == 3 * count
+        assert collector.get_metric_names() == ["test_metric"]
+        assert collector._shards == []
+
+    def test_to_arrow(self):
+        """Test exporting numeric metrics as an Arrow table."""
+        pa = pytest.importorskip("pyarrow")
+
+        collector = MetricsCollector()
+        now = datetime.now()
+        collector.record_with_timestamp("metric1", 1, now - timedelta(hours=1))
+        collector.record_with_timestamp("metric1", 2.5, now)
+        collector.record_with_timestamp("metric2", 3, now)
+        collector.record("orders", {"order_id": "1"})
+
+        table = collector.to_arrow()
+
+        assert table.schema.field("timestamp").type == pa.timestamp("ns")
+        assert table.num_rows == 3
+        assert table.column("metric").to_pylist() == ["metric1", "metric1", "metric2"]
+        assert table.column("value").to_pylist() == [1.0, 2.5, 3.0]
+        assert collector.to_arrow(["metric2"]).column("value").to_pylist() == [3.0]
+
 class TestPerformanceMetricsCollector:
     """Tests for the PerformanceMetricsCollector class."""
     
@@ -301,6 +442,16 @@ class TestTradingMetricsCollector:
         assert collector.get_latest("order_count.BTC/USD.buy") == 1
         assert collector.get_latest("order_volume.BTC/USD.buy") == 1.0
         assert collector.get_latest("order_value.BTC/USD.buy") == 50000.0
+
+    def test_record_order_shares_timestamp(self):
+        """Test that an order and its count metrics are recorded at the same instant."""
+        collector = TradingMetricsCollector()
+        collector.record_order("1", "BTC/USD", "buy", "market", 1.0, 50000.0)
+
+        order_ts, order_data = next(iter(collector.get_metric("order.BTC/USD.buy").items()))
+        assert order_data["timestamp"] == order_ts
+        assert list(collector.get_metric("order_count.BTC/USD.buy")) == [order_ts]
+        assert list(collector.get_metric("order_value.BTC/USD.buy")) == [order_ts]
     
     def test_record_trade(self):
         """Test recording a trade."""
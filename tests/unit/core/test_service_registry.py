@@ -152,4 +152,116 @@ class TestServiceRegistry:
         assert registry.has(TestService)
         
         registry.clear()
-        assert not registry.has(TestService) 
\ No newline at end of file
+        assert not registry.has(TestService)
+
+    def test_register_none_instance(self):
+        """Test that a service registered as None is still resolvable."""
+        from abidance.core.container import ServiceRegistry
+
+        registry = ServiceRegistry()
+        registry.register("optional_service", None)
+
+        assert registry.has("optional_service")
+        assert registry.get("optional_service") is None
+
+    def test_freeze_resolves_singletons(self):
+        """Test that freezing resolves singleton factories and blocks registration."""
+        from abidance.core.container import ServiceRegistry
+
+        registry = ServiceRegistry()
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return ConcreteTestService()
+
+        registry.register_factory(TestService, factory)
+        registry.freeze()
+
+        assert registry.frozen
+        assert len(calls) == 1
+        assert registry.get(TestService) is registry.get(TestService)
+        assert len(calls) == 1
+
+        with pytest.raises(KeyError):
+            registry.get(TestService, name="missing")
+        with pytest.raises(RuntimeError):
+            registry.register("late_service", object())
+
+        registry.clear()
+        assert not registry.frozen
+        registry.register("late_service", "value")
+        assert registry.get("late_service") == "value"
+
+    def test_freeze_with_singleton_depending_on_later_singleton(self):
+        """Test that freezing builds a singleton pulled in by an earlier factory only once."""
+        from abidance.core.container import ServiceRegistry
+
+        registry = ServiceRegistry()
+        calls = []
+
+        def dependency_factory():
+            calls.append("dependency")
+            return AnotherTestService()
+
+        def service_factory():
+            registry.get(AnotherTestService)
+            return ConcreteTestService()
+
+        # The dependency is registered after the singleton that resolves it
+        registry.register_factory(TestService, service_factory)
+        registry.register_factory(AnotherTestService, dependency_factory)
+        registry.freeze()
+
+        assert registry.frozen
+        assert calls == ["dependency"]
+        assert isinstance(registry.get(AnotherTestService), AnotherTestService)
+
+    def test_freeze_keeps_transient_factories(self):
+        """Test that non-singleton factories still create new instances after freezing."""
+        from abidance.core.container import ServiceRegistry
+
+        registry = ServiceRegistry()
+        registry.register_factory(TestService, ConcreteTestService, singleton=False)
+        registry.freeze()
+
+        assert registry.get(TestService) is not registry.get(TestService)
+
+    def test_singleton_factory_called_once_across_threads(self):
+        """Test that concurrent first resolution creates a singleton only once."""
+        import threading
+        import time
+        from abidance.core.container import ServiceRegistry
+
+        registry = ServiceRegistry()
+        calls = []
+
+        def slow_factory():
+            calls.append(1)
+            time.sleep(0.01)
+            return ConcreteTestService()
+
+        registry.register_factory(TestService, slow_factory)
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(registry.get(TestService)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+
+    def test_singleton_factory_can_resolve_dependencies(self):
+        """Test that a singleton factory may resolve other singletons."""
+        from abidance.core.container import ServiceRegistry
+
+        registry = ServiceRegistry()
+        registry.register_factory("dependency", ConcreteTestService)
+        registry.register_factory(TestService, lambda: registry.get("dependency"))
+
+        assert registry.get(TestService) is registry.get("dependency")
@@ -4,6 +4,8 @@ Tests for the validation framework.
 
 import pytest
 from decimal import Decimal
+
+import numpy as np
 from typing import List, Dict, Any
 
 from abidance.core.validation import ValidationError, Validator, ValidationContext
@@ -36,6 +38,14 @@ class TestValidationError:
         assert str(error) == "ValidationError(field='name', message='Name is required', code='required')"
 
 
+    def test_validation_error_slots(self):
+        """Test that ValidationError instances carry no per-instance __dict__."""
+        import sys
+
+        error = ValidationError(field="name", message="Required", code="required")
+        if sys.version_info >= (3, 10):
+            assert not hasattr(error, "__dict__")
+
 class TestValidator:
     """Tests for the Validator abstract base class."""
     
@@ -45,6 +55,15 @@ class TestValidator:
             Validator()
 
 
+    def test_builtin_validators_are_slotted(self):
+        """Test that the built-in validators carry no per-instance __dict__."""
+        validators = [RequiredValidator(), TypeValidator(str), RangeValidator(0, 1),
+                      LengthValidator(1, 2), PatternValidator(r'^a'), EmailValidator(),
+                      CustomValidator(bool, "falsy")]
+
+        for validator in validators:
+            assert not hasattr(validator, "__dict__"), type(validator).__name__
+
 class TestValidationContext:
     """Tests for the ValidationContext class."""
     
@@ -127,6 +146,90 @@ class TestValidationContext:
         assert not context.is_valid(data)
 
 
+    def test_validate_array_field(self):
+        """Test that array values are validated element-wise by batch validators."""
+        context = ValidationContext()
+        context.add_validator("price", RangeValidator(min_value=0))
+
+        assert context.is_valid({"price": np.array([1.0, 2.5, 0.0])})
+
+        errors = context.validate({"price": np.array([1.0, -2.0, 3.0, -4.0])})
+        assert [e.field for e in errors] == ["price[1]", "price[3]"]
+        assert all(e.code == "min_value" for e in errors)
+
+    def test_validate_caches_results(self):
+        """Test that repeated validation of the same values is served from the cache."""
+        calls = []
+
+        def is_positive(value):
+            calls.append(value)
+            return value > 0
+
+        context = ValidationContext(cache_size=2)
+        context.add_validator("qty", CustomValidator(is_positive, "Must be positive", pure=True))
+
+        errors = context.validate({"qty": -1})
+        errors[0].field = "changed"
+        assert context.validate({"qty": -1})[0].field == "qty"
+        assert context.validate({"qty": -1.0})[0].field == "qty"
+        assert calls == [-1, -1.0]
+
+        context.validate({"qty": 2})
+        context.validate({"qty": 3})
+        context.validate({"qty": -1})
+        assert calls == [-1, -1.0, 2, 3, -1]
+
+    def test_validate_skips_cache_for_impure_validators(self):
+        """Test that contexts with impure validators always rerun validation."""
+        calls = []
+        context = ValidationContext()
+        context.add_validator("qty", RangeValidator(min_value=0))
+        context.add_validator("qty", CustomValidator(lambda v: calls.append(v) is None, "never"))
+
+        context.validate({"qty": 1})
+        context.validate({"qty": 1})
+        assert calls == [1, 1]
+
+    def test_subclasses_are_impure_by_default(self):
+        """Test that a Validator subclass must opt in before its results are cached."""
+        calls = []
+
+        class CountingValidator(Validator):
+            def validate(self, value):
+                calls.append(value)
+                return []
+
+        assert not CountingValidator.pure
+        assert all(cls.pure for cls in (RequiredValidator, TypeValidator, RangeValidator,
+                                        LengthValidator, PatternValidator, EmailValidator))
+
+        context = ValidationContext()
+        context.add_validator("qty", CountingValidator())
+        context.validate({"qty": 1})
+        context.validate({"qty": 1})
+        assert calls == [1, 1]
+
+    def test_validators_share_empty_result(self):
+        """Test that passing validators return the shared empty result."""
+        from abidance.core.validation import _NO_ERRORS
+
+        for validator, value in ((RequiredValidator(), "x"), (TypeValidator(int), 1),
+                                 (RangeValidator(min_value=0), 1), (LengthValidator(max_length=3), "abc"),
+                                 (PatternValidator(r'^a'), "abc"), (CustomValidator(bool, "falsy"), 1)):
+            assert validator.validate(value) is _NO_ERRORS
+
+        assert ValidationContext().validate({"name": "x"}) == []
+
+    def test_validate_preserves_validator_order(self):
+        """Test that errors are reported in the order validators were added."""
+        context = ValidationContext()
+        context.add_validator("name", LengthValidator(min_length=5))
+        context.add_validator("name", PatternValidator(r'^[A-Z]'))
+        context.add_validator("qty", RangeValidator(min_value=1))
+
+        errors = context.validate({"name": "ab", "qty": 0})
+        assert [e.code for e in errors] == ["min_length", "pattern", "min_value"]
+
 class TestRequiredValidator:
     """Tests for the RequiredValidator class."""
     
@@ -262,6 +365,32 @@ class TestRangeValidator:
         assert not errors
 
 
+    def test_range_validator_fast_path(self):
+        """Test plain int/float values against plain and updated bounds."""
+        validator = RangeValidator(min_value=0, max_value=1.5)
+
+        assert not validator.validate(1)
+        assert not validator.validate(float("nan"))
+        assert validator.validate(2)[0].message == "Value must be at most 1.5"
+        assert validator.validate(-0.5)[0].code == "min_value"
+
+        validator.min_value = Decimal('0.5')
+        assert validator.validate(0.25)[0].message == "Value must be at least 0.5"
+        assert not validator.validate(1)
+
+    def test_range_validator_batch(self):
+        """Test RangeValidator.validate_batch against the scalar path."""
+        validator = RangeValidator(min_value=0, max_value=100)
+        values = np.array([-1, 0, 50, 100, 101])
+
+        mask = validator.validate_batch(values)
+        assert mask.tolist() == [not validator.validate(int(v)) for v in values]
+        assert validator.validate_batch(np.array([np.nan])).tolist() == [True]
+
+        decimal_validator = RangeValidator(min_value=Decimal('0.1'))
+        decimals = np.array([Decimal('0.05'), Decimal('0.5')], dtype=object)
+        assert decimal_validator.validate_batch(decimals).tolist() == [False, True]
+
 class TestLengthValidator:
     """Tests for the LengthValidator class."""
     
@@ -309,6 +438,13 @@ class TestLengthValidator:
         assert not errors
 
 
+    def test_length_validator_batch(self):
+        """Test LengthValidator.validate_batch on string and object arrays."""
+        validator = LengthValidator(min_length=3, max_length=5)
+
+        assert validator.validate_batch(np.array(["Jo", "John", "Johnny"])).tolist() == [False, True, False]
+        assert validator.validate_batch(np.array([[1, 2, 3], [1]], dtype=object)).tolist() == [True, False]
+
 class TestPatternValidator:
     """Tests for the PatternValidator class."""
     
@@ -351,6 +487,14 @@ class TestPatternValidator:
         assert not errors
 
 
+    def test_pattern_validator_batch(self):
+        """Test PatternValidator.validate_batch with repeated and non-string values."""
+        validator = PatternValidator(r'^[A-Z]+/[A-Z]+$')
+
+        symbols = ["BTC/USD", "eth/usd", "BTC/USD", "ETH/USD"]
+        assert validator.validate_batch(symbols).tolist() == [True, False, True, True]
+        assert validator.validate_batch(["BTC/USD", None, 42]).tolist() == [True, True, False]
+
 class TestEmailValidator:
     """Tests for the EmailValidator class."""
     
@@ -377,6 +521,34 @@ class TestEmailValidator:
         assert not errors
 
 
+    def test_email_validator_validate_many(self):
+        """Test EmailValidator.validate_many against the scalar path."""
+        validator = EmailValidator()
+        emails = ["john@example.com", "invalid-email", "", "jane.doe@mail.example.org",
+                  "john@example.com", "a@b.c"]
+
+        expected = [not validator.validate(email) for email in emails]
+        assert validator.validate_many(emails).tolist() == expected
+        assert validator.validate_many(["john@example.com\nx", None]).tolist() == [False, True]
+        assert validator.validate_many([]).tolist() == []
+
+    def test_validate_many_with_newline_spanning_pattern(self):
+        """Test that matches spanning joined lines are re-checked per value."""
+        validator = PatternValidator(r'a\s*b?')
+
+        values = ["a", "b", "ab", "x"]
+        assert validator.validate_many(values).tolist() == [True, False, True, False]
+
+    def test_validate_many_with_lookahead_pattern(self):
+        """Test that lookaheads cannot see the newline joining the values."""
+        for pattern in (r'\w+(?=\s)', r'\w+(?!x)\n?'):
+            validator = PatternValidator(pattern)
+            values = ["abc", "def"]
+
+            expected = [not validator.validate(value) for value in values]
+            assert validator.validate_many(values).tolist() == expected
+        assert PatternValidator(r'\w+(?=\s)').validate_many(["abc", "def"]).tolist() == [False, False]
+
 class TestCustomValidator:
     """Tests for the CustomValidator class."""
     
@@ -250,4 +250,98 @@ class TestBaseRepository:
         
         # Verify no trades were added (rollback occurred)
         final_count = len(repository.list())
-        assert final_count == initial_count 
\ No newline at end of file
+        assert final_count == initial_count
+
+    def test_add_many_commits_once(self, repository, session):
+        """
+        Feature: Adding several entities at once
+
+        Scenario: Adding a batch of entities
+          Given a repository instance
+          When several entities are added with add_many
+          Then all of them should be persisted with IDs
+          And the session should commit only once
+        """
+        trades = [
+            Trade(symbol="BTC/USD", side=OrderSide.BUY, amount=float(i),
+                  price=50000.0, timestamp=datetime.now(timezone.utc))
+            for i in range(1, 4)
+        ]
+
+        commits = []
+        original_commit = session.commit
+        session.commit = lambda: (commits.append(1), original_commit())
+
+        result = repository.add_many(t for t in trades)
+
+        assert result == trades
+        assert all(trade.id is not None for trade in trades)
+        assert len(commits) == 1
+        assert len(repository.list()) == 3
+
+    def test_bulk_insert_mappings(self, repository):
+        """
+        Feature: Bulk inserting plain rows
+
+        Scenario: Inserting rows from dictionaries
+          Given a repository instance
+          When rows are inserted with bulk_insert_mappings
+          Then the rows should be persisted with their derived columns
+        """
+        timestamp = datetime(2023, 1, 1)
+        rows = [
+            {"symbol": "BTC/USD", "side": OrderSide.SELL, "amount": 1.0,
+             "price": 50000.0 + i, "timestamp": timestamp}
+            for i in range(5)
+        ]
+
+        assert repository.bulk_insert_mappings(rows) == 5
+        assert repository.bulk_insert_mappings([]) == 0
+
+        trades = repository.list()
+        assert len(trades) == 5
+        assert {trade.price for trade in trades} == {50000.0 + i for i in range(5)}
+        assert all(trade.ts_epoch == 1672531200 for trade in trades)
+
+    def test_iter_all_streams_in_batches(self, repository):
+        """
+        Feature: Streaming entities
+
+        Scenario: Iterating over more entities than one batch holds
+          Given a repository with several entities
+          When iter_all is called with a small batch size
+          Then every entity should be yielded lazily
+        """
+        repository.add_many(
+            Trade(symbol="BTC/USD", side=OrderSide.BUY, amount=1.0,
+                  price=50000.0 + i, timestamp=datetime.now(timezone.utc))
+            for i in range(5)
+        )
+
+        iterator = repository.iter_all(batch_size=2)
+
+        assert not isinstance(iterator, list)
+        assert sorted(trade.price for trade in iterator) == [50000.0 + i for i in range(5)]
+        assert len(repository.list()) == 5
+
+    def test_get_by_ids(self, repository, session):
+        """
+        Feature: Retrieving several entities by ID
+
+        Scenario: Looking up a batch of IDs larger than one IN list
+          Given a repository with many entities
+          When get_by_ids is called with existing, duplicate and missing IDs
+          Then the found entities should be returned keyed by ID
+        """
+        trades = repository.add_many(
+            Trade(symbol="BTC/USD", side=OrderSide.BUY, amount=1.0,
+                  price=float(i), timestamp=datetime.now(timezone.utc))
+            for i in range(1000)
+        )
+        ids = [trade.id for trade in trades]
+
+        result = repository.get_by_ids(ids + ids[:10] + [10_000])
+
+        assert len(result) == 1000
+        assert all(result[trade.id] is trade for trade in trades)
+        assert repository.get_by_ids([]) == {}
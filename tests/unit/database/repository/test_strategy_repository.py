@@ -182,6 +182,27 @@ class TestStrategyRepository:
         assert "SMA Crossover" in strategy_names
         assert "RSI Strategy" in strategy_names
 
+    def test_get_strategies_with_trades_returns_each_strategy_once(self, repository, session,
+                                                                   sample_strategies):
+        """
+        Feature: Finding strategies with trades
+
+        Scenario: Retrieving a strategy that has many trades
+          Given a strategy with several trades
+          When strategies with trades are requested
+          Then the strategy should be returned only once
+        """
+        session.add_all([
+            Trade(symbol="BTC/USD", side=OrderSide.SELL, amount=1.0, price=100.0 + i,
+                  timestamp=datetime.now(timezone.utc), strategy_id=sample_strategies[0].id)
+            for i in range(5)
+        ])
+        session.commit()
+
+        strategies = repository.get_strategies_with_trades()
+
+        assert [strategy.id for strategy in strategies] == [sample_strategies[0].id]
+
     def test_get_strategies_by_parameter(self, repository, sample_strategies):
         """
         Feature: Finding strategies by parameter
@@ -209,4 +230,58 @@ class TestStrategyRepository:
         nonexistent_param_strategies = repository.get_strategies_by_parameter("nonexistent")
         
         # Verify no strategies were returned
-        assert len(nonexistent_param_strategies) == 0 
\ No newline at end of file
+        assert len(nonexistent_param_strategies) == 0
+
+    def test_get_strategies_by_parameter_returns_mapped_instances(self, repository, sample_strategies):
+        """
+        Feature: Finding strategies by parameter
+
+        Scenario: Looking up parameters with unusual names
+          Given a repository with strategies
+          When strategies are filtered by parameter name
+          Then the session's own instances should be returned
+          And the parameter name should never be interpreted as SQL
+        """
+        rsi_strategy = repository.get_by_name("RSI Strategy")
+
+        assert repository.get_strategies_by_parameter("oversold")[0] is rsi_strategy
+        assert repository.get_strategies_by_parameter("x') IS NULL OR ('1") == []
+
+    def test_get_strategies_by_parameter_with_null_value(self, repository, session):
+        """
+        Feature: Finding strategies by parameter
+
+        Scenario: Looking up a parameter whose value is null
+          Given a strategy with a parameter explicitly set to null
+          When strategies are filtered by that parameter name
+          Then the strategy should be returned
+        """
+        strategy = Strategy(name="Unset Stop", parameters={"stop_loss": None, "nested": {"a": 1}})
+        session.add(strategy)
+        session.commit()
+
+        assert repository.get_strategies_by_parameter("stop_loss") == [strategy]
+        assert repository.get_strategies_by_parameter("nested") == [strategy]
+
+    def test_get_strategies_with_trades_uses_covering_index(self, engine, repository, sample_strategies):
+        """
+        Feature: Finding strategies with trades
+
+        Scenario: Checking the query plan
+          Given the query optimization indexes
+          When strategies with trades are requested
+          Then the trades lookup should be answered from a covering index
+        """
+        from sqlalchemy import event, text
+        from abidance.database.indexes import create_indexes
+
+        create_indexes(engine)
+        statements = []
+        event.listen(engine, "before_cursor_execute",
+                     lambda conn, cursor, statement, *args: statements.append(statement))
+
+        repository.get_strategies_with_trades()
+
+        with engine.connect() as conn:
+            plan = conn.execute(text("EXPLAIN QUERY PLAN " + statements[-1])).fetchall()
+        assert any("COVERING INDEX idx_trade_strategy_cover" in row[-1] for row in plan)
@@ -211,4 +211,60 @@ class TestTradeRepository:
         latest_ltc_trade = repository.get_latest_trade_by_symbol("LTC/USD")
         
         # Verify no trade was returned
-        assert latest_ltc_trade is None 
\ No newline at end of file
+        assert latest_ltc_trade is None 
+
+    def test_get_latest_trades_by_symbols(self, repository, sample_trades):
+        """
+        Feature: Retrieving the latest trades for several symbols
+
+        Scenario: Getting the most recent trade for each requested symbol at once
+          Given a repository with trades for several symbols
+          When the latest trades are requested for a list of symbols
+          Then each symbol with trades should map to its most recent trade
+          And symbols without trades should be omitted
+        """
+        latest = repository.get_latest_trades_by_symbols(["BTC/USD", "ETH/USD", "LTC/USD", "BTC/USD"])
+
+        assert set(latest) == {"BTC/USD", "ETH/USD"}
+        assert latest["BTC/USD"].price == 50000.0
+        assert latest["ETH/USD"].price == 3000.0
+        assert repository.get_latest_trades_by_symbols([]) == {}
+
+    def test_iter_trades_by_date_range(self, repository, sample_trades):
+        """
+        Feature: Streaming trades within a date range
+
+        Scenario: Iterating over trades in small batches
+          Given a repository with trades at different times
+          When trades in a date range are iterated with a small batch size
+          Then the same trades as get_trades_by_date_range should be yielded
+        """
+        start_date = self.two_days_ago - timedelta(hours=1)
+        end_date = self.now + timedelta(hours=1)
+
+        streamed = list(repository.iter_trades_by_date_range(start_date, end_date, batch_size=1))
+
+        assert len(streamed) == 3
+        assert {t.id for t in streamed} == {t.id for t in repository.get_trades_by_date_range(start_date, end_date)}
+
+    def test_get_trade_array_by_symbol(self, repository, sample_trades):
+        """
+        Feature: Loading trade columns as arrays
+
+        Scenario: Getting a symbol's trades as a structured NumPy array
+          Given a repository with trades for a symbol
+          When the trade array is requested for that symbol
+          Then the rows should hold the numeric columns in timestamp order
+        """
+        from abidance.database.models import ORDER_SIDE_CODES
+        from abidance.database.repository.trade import TRADE_ARRAY_DTYPE
+
+        trades = repository.get_trade_array_by_symbol("BTC/USD")
+
+        assert trades.dtype == TRADE_ARRAY_DTYPE
+        assert trades['price'].tolist() == [51000.0, 50000.0]
+        assert trades['amount'].tolist() == [0.5, 1.0]
+        assert trades['side'].tolist() == [ORDER_SIDE_CODES[OrderSide.SELL], ORDER_SIDE_CODES[OrderSide.BUY]]
+        assert trades['ts_epoch'][0] < trades['ts_epoch'][1]
+        assert len(repository.get_trade_array_by_symbol("LTC/USD")) == 0
+
@@ -0,0 +1,64 @@
+"""
+Unit tests for database engine construction.
+
+This module tests that SQLite connections are opened with the tuned PRAGMAs.
+"""
+import threading
+
+from sqlalchemy import text
+from sqlalchemy.pool import StaticPool
+
+from abidance.database.engine import (
+    configure_sqlite_pragmas, create_database_engine, create_session_factory
+)
+
+
+class TestDatabaseEngine:
+    """Test suite for engine construction."""
+
+    def test_sqlite_pragmas_applied(self, tmp_path):
+        """Test that new SQLite connections use WAL and the tuned settings."""
+        engine = create_database_engine(f"sqlite:///{tmp_path / 'test.db'}")
+
+        with engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+            assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+            assert conn.execute(text("PRAGMA cache_size")).scalar() == -65536
+
+    def test_configure_is_idempotent(self, tmp_path):
+        """Test that configuring an engine twice registers the listener once."""
+        engine = create_database_engine(f"sqlite:///{tmp_path / 'test.db'}")
+
+        assert configure_sqlite_pragmas(engine) is engine
+
+        with engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+
+    def test_in_memory_database_is_shared(self):
+        """Test that sessions from one factory share a single in-memory database across threads."""
+        Session = create_session_factory("sqlite:///:memory:")
+        assert isinstance(Session.kw["bind"].pool, StaticPool)
+
+        with Session() as session:
+            session.execute(text("CREATE TABLE t (x INTEGER)"))
+            session.execute(text("INSERT INTO t VALUES (1)"))
+            session.commit()
+
+        counts = []
+
+        def count_rows():
+            with Session() as session:
+                counts.append(session.execute(text("SELECT COUNT(*) FROM t")).scalar())
+
+        thread = threading.Thread(target=count_rows)
+        thread.start()
+        thread.join()
+        assert counts == [1]
+
+    def test_explicit_pool_options_take_precedence(self):
+        """Test that caller-supplied engine options override the defaults."""
+        engine = create_database_engine("sqlite://", poolclass=None, connect_args={})
+
+        assert not isinstance(engine.pool, StaticPool)
+
@@ -0,0 +1,141 @@
+"""
+Unit tests for database index management.
+
+This module tests creating and dropping the query optimization indexes.
+"""
+import pytest
+from sqlalchemy import create_engine, event, inspect, text
+
+from abidance.database.models import Base
+from abidance.database.indexes import (
+    create_indexes, create_function_based_indexes, create_symbol_indexes, drop_indexes,
+    drop_symbol_indexes, symbol_index_name
+)
+
+
+def _index_names(engine, table):
+    return {idx['name'] for idx in inspect(engine).get_indexes(table)}
+
+
+class TestIndexes:
+    """Test suite for index creation and removal."""
+
+    @pytest.fixture
+    def engine(self):
+        """Create an in-memory SQLite database for testing."""
+        engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(engine)
+        return engine
+
+    def test_create_indexes(self, engine):
+        """Test that all custom indexes are created."""
+        create_indexes(engine)
+
+        assert {'idx_trade_symbol_timestamp', 'idx_trade_strategy_cover'} <= _index_names(engine, 'trades')
+        assert 'idx_ohlcv_timestamp' in _index_names(engine, 'ohlcv')
+        assert 'idx_strategy_name' in _index_names(engine, 'strategies')
+
+    def test_create_indexes_is_idempotent(self, engine):
+        """Test that existing indexes are looked up once and not recreated."""
+        create_indexes(engine)
+
+        statements = []
+        event.listen(engine, 'before_cursor_execute',
+                     lambda conn, cursor, statement, *args: statements.append(statement))
+        create_indexes(engine)
+
+        assert len(statements) == 1
+        assert not any('CREATE INDEX' in statement for statement in statements)
+
+    def test_drop_indexes(self, engine):
+        """Test that dropping removes the custom indexes and tolerates missing ones."""
+        create_indexes(engine)
+        drop_indexes(engine)
+        drop_indexes(engine)
+
+        names = set().union(*(_index_names(engine, table)
+                              for table in ('trades', 'ohlcv', 'strategies')))
+        assert not any(name.startswith('idx_') and name != 'idx_symbol_timestamp'
+                       for name in names)
+
+    def test_no_redundant_indexes(self, engine):
+        """Test that no index is a leading prefix of another index on the same table."""
+        create_indexes(engine)
+
+        for table in ('trades', 'ohlcv', 'strategies'):
+            columns = [tuple(idx['column_names']) for idx in inspect(engine).get_indexes(table)]
+            for cols in columns:
+                assert not any(other != cols and other[:len(cols)] == cols for other in columns), (table, cols)
+            assert len(columns) == len(set(columns)), table
+
+    def test_create_indexes_drops_superseded(self, engine):
+        """Test that indexes replaced by a wider index are dropped."""
+        with engine.begin() as conn:
+            conn.execute(text("CREATE INDEX idx_trade_strategy_timestamp ON trades (strategy_id, timestamp)"))
+
+        create_indexes(engine)
+
+        assert 'idx_trade_strategy_timestamp' not in _index_names(engine, 'trades')
+
+    def test_strategy_performance_uses_covering_index(self, engine):
+        """Test that per-strategy trade scans are answered from the covering index."""
+        create_indexes(engine)
+
+        with engine.connect() as conn:
+            plan = conn.execute(text(
+                "EXPLAIN QUERY PLAN SELECT side, price, amount FROM trades WHERE strategy_id = :id"
+            ), {'id': 1}).fetchall()
+
+        assert any('COVERING INDEX idx_trade_strategy_cover' in row[-1] for row in plan)
+
+    def test_create_function_based_indexes(self, engine):
+        """Test that integer bucket indexes replace the strftime() expression indexes."""
+        with engine.begin() as conn:
+            conn.execute(text("CREATE INDEX idx_ohlcv_date ON ohlcv(strftime('%Y-%m-%d', timestamp))"))
+
+        create_function_based_indexes(engine)
+        create_function_based_indexes(engine)
+
+        with engine.connect() as conn:
+            names = {row[0] for row in conn.execute(text(
+                "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='ohlcv'"
+            ))}
+        assert {'idx_ohlcv_day_bucket', 'idx_ohlcv_hour_bucket'} <= names
+        assert 'idx_ohlcv_date' not in names
+
+    def test_symbol_indexes(self, engine):
+        """Test that per-symbol partial indexes are created, used and dropped."""
+        with engine.begin() as conn:
+            for symbol in ("BTC/USDT", "BTC-USDT", "it's"):
+                conn.execute(text(
+                    "INSERT INTO ohlcv (symbol, timestamp, ts_epoch, open, high, low, close, volume) "
+                    "VALUES (:symbol, '2023-01-01 00:00:00', 1672531200, 1, 1, 1, 1, 1)"
+                ), {'symbol': symbol})
+
+        names = create_symbol_indexes(engine)
+        assert len(set(names)) == 3
+        assert symbol_index_name("BTC/USDT") != symbol_index_name("BTC-USDT")
+        assert create_symbol_indexes(engine, ["BTC/USDT"]) == [symbol_index_name("BTC/USDT")]
+
+        name = symbol_index_name("BTC/USDT")
+        with engine.connect() as conn:
+            plan = conn.execute(text(
+                f"EXPLAIN QUERY PLAN SELECT timestamp, open, high, low, close, volume "
+                f"FROM ohlcv INDEXED BY {name} WHERE symbol = 'BTC/USDT' ORDER BY timestamp"
+            )).fetchall()
+        assert any(f"COVERING INDEX {name}" in row[-1] for row in plan)
+        assert not any('TEMP B-TREE' in row[-1] for row in plan)
+
+        drop_symbol_indexes(engine)
+        assert not any(name.startswith('idx_ohlcv_ts_') for name in _index_names(engine, 'ohlcv'))
+
+    def test_latest_trade_by_symbol_uses_model_index(self, engine):
+        """Test that the model's (symbol, timestamp) index serves latest-trade lookups without sorting."""
+        with engine.connect() as conn:
+            plan = conn.execute(text(
+                "EXPLAIN QUERY PLAN SELECT * FROM trades WHERE symbol = :symbol "
+                "ORDER BY timestamp DESC LIMIT 1"
+            ), {'symbol': 'BTC/USDT'}).fetchall()
+
+        assert any('idx_trade_symbol_timestamp' in row[-1] for row in plan)
+        assert not any('TEMP B-TREE' in row[-1] for row in plan)
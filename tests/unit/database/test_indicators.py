@@ -0,0 +1,55 @@
+"""
+Unit tests for the OHLCV indicator kernels.
+
+This module checks the running-sum kernels against pandas rolling windows.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from abidance.database.indicators import sma_rsi
+
+
+def _reference(close, window):
+    """Compute the indicators with pandas rolling windows."""
+    close = pd.Series(close)
+    change = close.diff().fillna(0.0)
+    avg_gain = change.clip(lower=0.0).rolling(window, min_periods=1).mean()
+    avg_loss = (-change).clip(lower=0.0).rolling(window, min_periods=1).mean()
+    sma = close.rolling(window, min_periods=1).mean()
+    return sma.to_numpy(), (avg_gain / avg_loss.where(avg_loss > 1e-9)).to_numpy()
+
+
+class TestSmaRsi:
+    """Test suite for sma_rsi()."""
+
+    @pytest.mark.parametrize("window", [1, 3, 14, 500])
+    def test_matches_pandas_rolling(self, window):
+        """Test that the kernel matches pandas on a long random walk."""
+        rng = np.random.default_rng(42)
+        close = 50000.0 + np.cumsum(rng.normal(0, 50, 5000))
+
+        sma, rsi_ratio = sma_rsi(close, window)
+        expected_sma, expected_rsi = _reference(close, window)
+
+        np.testing.assert_allclose(sma, expected_sma, rtol=1e-9)
+        np.testing.assert_allclose(rsi_ratio, expected_rsi, rtol=1e-6)
+
+    def test_windows_without_losses_are_nan(self):
+        """Test that a window holding only gains has no ratio, even after losses leave it."""
+        close = np.array([10.0, 9.0, 10.0, 11.0, 12.0, 13.0])
+
+        _, rsi_ratio = sma_rsi(close, 3)
+
+        assert np.isnan(rsi_ratio[0])
+        assert rsi_ratio[1] == 0.0
+        assert rsi_ratio[2] == 1.0
+        assert np.isnan(rsi_ratio[4:]).all()
+
+    def test_empty_and_invalid_input(self):
+        """Test empty series and invalid windows."""
+        sma, rsi_ratio = sma_rsi(np.array([]), 14)
+        assert sma.size == 0 and rsi_ratio.size == 0
+
+        with pytest.raises(ValueError):
+            sma_rsi(np.array([1.0]), 0)
@@ -191,3 +191,73 @@ class TestDatabaseMigrations:
 
         # Clean up the temporary alembic.ini
         os.unlink(temp_alembic_ini)
+
+
+class TestMigrationManager:
+    """Test suite for the in-process migration manager."""
+
+    def test_upgrade_and_downgrade_in_process(self, tmp_path, capsys):
+        """Test that migrations run in-process against a configured database."""
+        from abidance.database.migrations.migration_manager import (
+            build_alembic_config, downgrade_database, show_current, upgrade_database
+        )
+
+        db_url = f"sqlite:///{tmp_path / 'migrations.db'}"
+        config = build_alembic_config(db_url)
+
+        assert upgrade_database(config=config)
+        tables = inspect(create_engine(db_url)).get_table_names()
+        assert {"trades", "strategies", "ohlcv", "alembic_version"} <= set(tables)
+
+        assert show_current(config=config)
+        assert "(head)" in capsys.readouterr().out
+
+        assert downgrade_database("base", config=config)
+        assert inspect(create_engine(db_url)).get_table_names() == ["alembic_version"]
+
+    def test_in_process_run_keeps_app_logging(self, tmp_path, capsys):
+        """Test that running migrations leaves the application's logging setup alone."""
+        import logging
+        from abidance.database.migrations.migration_manager import (
+            build_alembic_config, upgrade_database
+        )
+
+        root = logging.getLogger()
+        app_handler = logging.StreamHandler()
+        root_level, root_handlers = root.level, list(root.handlers)
+        root.addHandler(app_handler)
+        root.setLevel(logging.INFO)
+        try:
+            config = build_alembic_config(f"sqlite:///{tmp_path / 'migrations.db'}")
+            assert upgrade_database(config=config)
+
+            assert root.level == logging.INFO
+            assert app_handler in root.handlers
+        finally:
+            root.removeHandler(app_handler)
+            root.setLevel(root_level)
+            assert root.handlers == root_handlers
+
+        # Progress is logged by Alembic and captured into the reported output
+        assert "Running upgrade" in capsys.readouterr().out
+
+    def test_failed_command_reports_error(self, tmp_path, capsys):
+        """Test that a failing command returns False instead of raising."""
+        from abidance.database.migrations.migration_manager import (
+            build_alembic_config, upgrade_database
+        )
+
+        config = build_alembic_config(f"sqlite:///{tmp_path / 'migrations.db'}")
+
+        assert not upgrade_database("does_not_exist", config=config)
+        assert "Error upgrading database" in capsys.readouterr().out
+
+    def test_relative_sqlite_url_resolves_next_to_alembic_ini(self):
+        """Test that the default SQLite file is resolved like the alembic CLI resolves it."""
+        from abidance.database.migrations.migration_manager import (
+            build_alembic_config, get_alembic_config_path
+        )
+
+        url = build_alembic_config().get_main_option("sqlalchemy.url")
+
+        assert url == f"sqlite:///{get_alembic_config_path().parent / 'abidance.db'}"
@@ -6,11 +6,11 @@ correctly represent the domain entities and maintain data integrity.
 """
 import pytest
 from datetime import datetime, timezone
-from sqlalchemy import create_engine, select, inspect
+from sqlalchemy import create_engine, select, inspect, insert, text
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
-from abidance.database.models import Base, Trade, Strategy, OHLCV
+from abidance.database.models import Base, Trade, Strategy, OHLCV, ORDER_SIDE_CODES, epoch_seconds
 from abidance.trading.order import OrderSide, OrderType
 
 
@@ -129,6 +129,65 @@ class TestDatabaseModels:
         assert result.close == 50500.0
         assert result.volume == 100.0
         
+    def test_ts_epoch_matches_sqlite_strftime(self, session):
+        """
+        Feature: Integer epoch timestamps
+
+        Scenario: Saving rows through the ORM and through Core inserts
+          Given OHLCV and trade rows with timestamps
+          When they are saved
+          Then ts_epoch should equal SQLite's strftime('%s', timestamp)
+          And it should follow later timestamp changes
+        """
+        timestamp = datetime(2023, 1, 1, 12, 34, 56, 789000)
+        trade = Trade(symbol="BTC/USD", side=OrderSide.BUY, amount=1.0,
+                      price=50000.0, timestamp=timestamp)
+        session.add(trade)
+        session.execute(insert(OHLCV), [{
+            "symbol": "BTC/USD", "timestamp": timestamp, "open": 1.0,
+            "high": 1.0, "low": 1.0, "close": 1.0, "volume": 1.0
+        }])
+        session.commit()
+
+        for table in ("trades", "ohlcv"):
+            ts_epoch, expected = session.execute(text(
+                f"SELECT ts_epoch, CAST(strftime('%s', timestamp) AS INTEGER) FROM {table}"
+            )).one()
+            assert ts_epoch == expected == epoch_seconds(timestamp)
+
+        trade.timestamp = datetime(2023, 1, 2)
+        session.commit()
+        assert trade.ts_epoch == epoch_seconds(datetime(2023, 1, 2))
+
+    def test_trade_side_stored_as_small_integer(self, session):
+        """
+        Feature: Compact trade side storage
+
+        Scenario: Saving trades with each side
+          Given trades on both sides
+          When they are saved and reloaded
+          Then the side should be stored as 0/1 and loaded back as OrderSide
+          And other codes should be rejected by the CHECK constraint
+        """
+        for side in (OrderSide.BUY, OrderSide.SELL):
+            session.add(Trade(symbol="BTC/USD", side=side, amount=1.0,
+                              price=50000.0, timestamp=datetime(2023, 1, 1)))
+        session.commit()
+        session.expire_all()
+
+        stored = session.execute(text("SELECT side FROM trades ORDER BY id")).scalars().all()
+        assert stored == [ORDER_SIDE_CODES[OrderSide.BUY], ORDER_SIDE_CODES[OrderSide.SELL]] == [0, 1]
+        assert [t.side for t in session.execute(select(Trade).order_by(Trade.id)).scalars()] == [
+            OrderSide.BUY, OrderSide.SELL
+        ]
+
+        with pytest.raises(IntegrityError):
+            session.execute(text(
+                "INSERT INTO trades (symbol, side, amount, price, timestamp, ts_epoch) "
+                "VALUES ('BTC/USD', 2, 1.0, 1.0, '2023-01-01 00:00:00', 0)"
+            ))
+        session.rollback()
+
     def test_trade_strategy_relationship(self, session):
         """
         Feature: Trade-Strategy relationship
@@ -278,5 +337,8 @@ class TestDatabaseModels:
         
         # Check Trade indexes
         trade_indexes = inspector.get_indexes("trades")
-        assert any(idx["column_names"] == ["symbol"] for idx in trade_indexes)
-        assert any(idx["column_names"] == ["timestamp"] for idx in trade_indexes) 
\ No newline at end of file
+        # Symbol lookups are served by the composite idx_trade_symbol_timestamp
+        assert not any(idx["column_names"] == ["symbol"] for idx in trade_indexes)
+        assert any(idx["column_names"] == ["timestamp"] for idx in trade_indexes)
+        assert any(idx["name"] == "idx_trade_symbol_timestamp" for idx in trade_indexes)
+        assert any(idx["name"] == "idx_trade_strategy_cover" for idx in trade_indexes) 
\ No newline at end of file
@@ -8,9 +8,13 @@ from unittest.mock import MagicMock, patch
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from abidance.database.queries import QueryOptimizer
+from abidance.database.indexes import create_indexes
+from abidance.database.queries import (
+    QueryOptimizer, _OHLCV_SQL, _STRATEGY_PERFORMANCE_SQL, _TRADE_STATISTICS_SQL
+)
 from abidance.database.models import Trade, OHLCV, Strategy
 from abidance.trading.order import OrderSide
 
@@ -22,6 +26,10 @@ class TestQueryOptimizer(unittest.TestCase):
         """Set up test fixtures."""
         self.mock_session = MagicMock(spec=Session)
         self.query_optimizer = QueryOptimizer(self.mock_session)
+        # OHLCV queries load their results through pandas
+        patcher = patch('abidance.database.queries.pd.read_sql_query')
+        self.read_sql_query = patcher.start()
+        self.addCleanup(patcher.stop)
 
     def test_get_trade_statistics(self):
         """
@@ -80,7 +88,7 @@ class TestQueryOptimizer(unittest.TestCase):
             for i in range(20)
         ]
         
-        self.mock_session.execute.return_value.fetchall.return_value = mock_data
+        self.read_sql_query.return_value = pd.DataFrame(mock_data)
         
         # Act
         result = self.query_optimizer.get_ohlcv_with_indicators(symbol, window)
@@ -96,7 +104,7 @@ class TestQueryOptimizer(unittest.TestCase):
         self.assertTrue('volume' in result.columns)
         self.assertTrue('sma' in result.columns)
         self.assertTrue('rsi_ratio' in result.columns)
-        self.mock_session.execute.assert_called_once()
+        self.read_sql_query.assert_called_once()
         
     def test_get_strategy_performance(self):
         """
@@ -186,7 +194,7 @@ class TestQueryOptimizer(unittest.TestCase):
                 'rsi_ratio': 0.5
             })
         
-        self.mock_session.execute.return_value.fetchall.return_value = mock_data
+        self.read_sql_query.return_value = pd.DataFrame(mock_data)
         
         # Act
         result = self.query_optimizer.get_ohlcv_with_indicators(symbol, window)
@@ -228,7 +236,7 @@ class TestQueryOptimizer(unittest.TestCase):
             }
         ]
         
-        self.mock_session.execute.return_value.fetchall.return_value = mock_data
+        self.read_sql_query.return_value = pd.DataFrame(mock_data)
         
         # Act
         result = self.query_optimizer.get_aggregated_ohlcv(symbol, interval)
@@ -241,7 +249,216 @@ class TestQueryOptimizer(unittest.TestCase):
         self.assertEqual(result.iloc[0]['low'], 49500.0)
         self.assertEqual(result.iloc[0]['close'], 50500.0)
         self.assertEqual(result.iloc[0]['volume'], 10.5)
-        self.mock_session.execute.assert_called_once()
+        self.read_sql_query.assert_called_once()
+
+
+    def test_aggregated_ohlcv_buckets_on_epoch_seconds(self):
+        """
+        Test that fixed intervals are bucketed with integer arithmetic on ts_epoch.
+
+        Given fixed-length and calendar intervals
+        When get_aggregated_ohlcv is called
+        Then fixed intervals should group by ts_epoch and calendar ones by strftime
+        """
+        self.read_sql_query.return_value = pd.DataFrame()
+
+        self.query_optimizer.get_aggregated_ohlcv("BTC/USDT", "5m")
+        sql = str(self.read_sql_query.call_args[0][0])
+        self.assertIn("ts_epoch / 300", sql)
+        self.assertNotIn("strftime", sql)
+
+        self.query_optimizer.get_aggregated_ohlcv("BTC/USDT", "1M")
+        sql = str(self.read_sql_query.call_args[0][0])
+        self.assertIn("strftime('%Y-%m', timestamp)", sql)
+
+    def test_statements_are_reused(self):
+        """
+        Test that repeated calls execute the same prebuilt statement objects.
+
+        Given a query optimizer
+        When the same query is run twice
+        Then both calls should pass the identical statement object
+        """
+        self.query_optimizer.get_trade_statistics("BTC/USDT")
+        self.query_optimizer.get_trade_statistics("ETH/USDT")
+        first, second = (call[0][0] for call in self.mock_session.execute.call_args_list)
+        self.assertIs(first, second)
+
+        self.read_sql_query.return_value = pd.DataFrame()
+        self.query_optimizer.get_aggregated_ohlcv("BTC/USDT", "4h")
+        self.query_optimizer.get_aggregated_ohlcv("ETH/USDT", "4h")
+        first, second = (call[0][0] for call in self.read_sql_query.call_args_list)
+        self.assertIs(first, second)
+
+
+class TestQueryOptimizerSQLite(unittest.TestCase):
+    """Test cases for QueryOptimizer against an in-memory SQLite database."""
+
+    def setUp(self):
+        """Set up an in-memory database with OHLCV rows."""
+        from sqlalchemy import create_engine
+        from abidance.database.models import Base
+
+        engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(engine)
+        create_indexes(engine)
+        self.session = Session(engine)
+        self.addCleanup(self.session.close)
+        start = datetime(2023, 1, 1)
+        self.session.add_all([
+            OHLCV(symbol="BTC/USDT", timestamp=start + timedelta(minutes=i),
+                  open=100.0 + i, high=101.0 + i, low=99.0 + i, close=100.5 + i, volume=1.0)
+            for i in range(30)
+        ])
+        self.session.commit()
+        self.query_optimizer = QueryOptimizer(self.session)
+
+    def test_ohlcv_frames_are_typed(self):
+        """
+        Test that OHLCV results are loaded with numeric and datetime columns.
+
+        Given OHLCV rows in the database
+        When get_aggregated_ohlcv is called
+        Then price columns should be float64 and timestamps datetime64
+        """
+        result = self.query_optimizer.get_aggregated_ohlcv("BTC/USDT", "1m")
+
+        self.assertEqual(len(result), 30)
+        for column in ('open', 'high', 'low', 'close', 'volume'):
+            self.assertEqual(result[column].dtype, np.float64)
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(result['timestamp']))
+        self.assertEqual(result['close'].iloc[0], 100.5)
+
+    def test_aggregated_ohlcv_groups_candles(self):
+        """
+        Test that candles are rolled up into interval buckets.
+
+        Given one-minute OHLCV rows
+        When get_aggregated_ohlcv is called with a 5m interval
+        Then each bucket should take its first open, last close, extremes and total volume
+        """
+        result = self.query_optimizer.get_aggregated_ohlcv("BTC/USDT", "5m")
+
+        self.assertEqual(len(result), 6)
+        first = result.iloc[0]
+        self.assertEqual(first['timestamp'], pd.Timestamp(2023, 1, 1))
+        self.assertEqual(first['open'], 100.0)
+        self.assertEqual(first['high'], 105.0)
+        self.assertEqual(first['low'], 99.0)
+        self.assertEqual(first['close'], 104.5)
+        self.assertEqual(first['volume'], 5.0)
+        self.assertEqual(result['timestamp'].iloc[-1], pd.Timestamp(2023, 1, 1, 0, 25))
+        self.assertTrue(self.query_optimizer.get_aggregated_ohlcv("ETH/USDT", "5m").empty)
+
+    def test_indicators_match_sql_window_semantics(self):
+        """
+        Test that indicators are computed over partial leading windows.
+
+        Given OHLCV rows with rising and falling closes
+        When get_ohlcv_with_indicators is called
+        Then SMA and the gain/loss ratio should match a manual calculation
+        """
+        rows = self.session.execute(select(OHLCV).order_by(OHLCV.timestamp)).scalars().all()
+        rows[3].close = 90.0  # one falling candle among rising ones
+        self.session.commit()
+
+        result = self.query_optimizer.get_ohlcv_with_indicators("BTC/USDT", window=3)
+        closes = [row.close for row in rows]
+
+        for i in range(len(closes)):
+            window = closes[max(0, i - 2):i + 1]
+            self.assertAlmostEqual(result['sma'].iloc[i], sum(window) / len(window))
+
+            changes = [0.0 if j == 0 else closes[j] - closes[j - 1] for j in range(max(0, i - 2), i + 1)]
+            gains = sum(c for c in changes if c > 0) / len(changes)
+            losses = sum(-c for c in changes if c < 0) / len(changes)
+            if losses:
+                self.assertAlmostEqual(result['rsi_ratio'].iloc[i], gains / losses)
+            else:
+                self.assertTrue(np.isnan(result['rsi_ratio'].iloc[i]))
+
+    def test_indicator_window_is_validated(self):
+        """
+        Test that invalid indicator windows are rejected before querying.
+
+        Given windows that are not positive integers
+        When get_ohlcv_with_indicators is called
+        Then a ValueError should be raised
+        """
+        for window in (0, -3, 2.5, "14", True):
+            with self.assertRaises(ValueError):
+                self.query_optimizer.get_ohlcv_with_indicators("BTC/USDT", window=window)
+
+    def test_strategy_performance_single_pass(self):
+        """
+        Test strategy performance against stored trades.
+
+        Given winning and losing trades for a strategy
+        When get_strategy_performance is called
+        Then the aggregated metrics should match the trades
+        """
+        strategy = Strategy(name="Test", parameters={})
+        self.session.add(strategy)
+        self.session.flush()
+        now = datetime(2023, 1, 1)
+        self.session.add_all([
+            Trade(symbol="BTC/USDT", side=side, amount=amount, price=price,
+                  timestamp=now, strategy_id=strategy.id)
+            for side, amount, price in (
+                (OrderSide.SELL, 1.0, 300.0),
+                (OrderSide.SELL, 2.0, 100.0),
+                (OrderSide.BUY, 1.0, 100.0),
+            )
+        ])
+        self.session.commit()
+
+        result = self.query_optimizer.get_strategy_performance(strategy.id)
+
+        self.assertEqual(result['total_trades'], 3)
+        self.assertEqual(result['winning_trades'], 2)
+        self.assertEqual(result['losing_trades'], 1)
+        self.assertEqual(result['total_profit'], 500.0)
+        self.assertEqual(result['total_loss'], 100.0)
+        self.assertAlmostEqual(result['win_rate'], 2 / 3)
+        self.assertEqual(result['profit_factor'], 5.0)
+        self.assertEqual(self.query_optimizer.get_strategy_performance(strategy.id + 1)['total_trades'], 0)
+
+    def _assert_plan_uses(self, query, params, index):
+        plan = self.query_optimizer.explain(query, params)
+        self.assertTrue(any(f'USING {index}' in row.detail for row in plan),
+                        [row.detail for row in plan])
+        self.assertFalse(any(row.detail.startswith('SCAN') for row in plan),
+                         [row.detail for row in plan])
+
+    def test_queries_use_expected_indexes(self):
+        """
+        Test that the hand-written queries are answered from their indexes.
+
+        Given the query optimization indexes
+        When the query plans are explained
+        Then each query should search its index instead of scanning the table
+        """
+        self._assert_plan_uses(_TRADE_STATISTICS_SQL, {'symbol': 'BTC/USDT'},
+                               'INDEX idx_trade_symbol_timestamp')
+        self._assert_plan_uses(_STRATEGY_PERFORMANCE_SQL, {'strategy_id': 1},
+                               'COVERING INDEX idx_trade_strategy_cover')
+        self._assert_plan_uses(_OHLCV_SQL, {'symbol': 'BTC/USDT'},
+                               'INDEX idx_symbol_timestamp')
+
+    def test_explain_accepts_sql_strings(self):
+        """
+        Test that explain() takes plain SQL as well as text() statements.
+
+        Given a SQL string with bind parameters
+        When explain is called
+        Then the plan rows should be returned without running the query
+        """
+        plan = self.query_optimizer.explain(
+            "SELECT close FROM ohlcv WHERE symbol = :symbol", {'symbol': 'BTC/USDT'}
+        )
+
+        self.assertTrue(plan)
+        self.assertIn('idx_symbol_timestamp', plan[0].detail)
 
 
 if __name__ == '__main__':
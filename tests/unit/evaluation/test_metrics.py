@@ -1,12 +1,14 @@
 """
 Unit tests for the evaluation metrics module.
 """
+import warnings
+
 import pytest
 import pandas as pd
 import numpy as np
 from datetime import datetime
 
-from abidance.evaluation.metrics import PerformanceMetrics, StrategyEvaluator
+from abidance.evaluation.metrics import PerformanceMetrics, StrategyEvaluator, cumulative_returns, trade_returns
 
 
 class TestPerformanceMetrics:
@@ -200,4 +202,163 @@ class TestStrategyEvaluator:
         # Calculate actual max drawdown
         actual_drawdown = evaluator._calculate_max_drawdown(cumulative_returns)
         
-        assert np.isclose(actual_drawdown, expected_drawdown) 
\ No newline at end of file
+        assert np.isclose(actual_drawdown, expected_drawdown)
+
+    def test_metric_helpers_leave_inputs_unchanged(self, evaluator):
+        """
+        Test that the Sharpe and drawdown helpers do not modify their inputs.
+
+        Scenario: Reuse return arrays across metric calculations
+          Given I have arrays of returns and cumulative returns
+          When I calculate the Sharpe ratio and maximum drawdown
+          Then the arrays should keep their original values
+        """
+        returns = np.array([0.02, -0.01, 0.03, -0.02, 0.04])
+        cumulative_returns = (1 + returns).cumprod() - 1
+        returns_copy = returns.copy()
+        cumulative_copy = cumulative_returns.copy()
+
+        evaluator._calculate_sharpe_ratio(returns)
+        evaluator._calculate_max_drawdown(cumulative_returns)
+
+        np.testing.assert_array_equal(returns, returns_copy)
+        np.testing.assert_array_equal(cumulative_returns, cumulative_copy)
+
+    def test_calculate_metrics_is_cached(self, evaluator, sample_trades, monkeypatch):
+        """
+        Test that repeated evaluations of the same returns are served from the cache.
+
+        Scenario: Evaluate the same trade history twice
+          Given I have evaluated a trade history
+          When I evaluate an equal trade history again
+          Then the metrics should not be recomputed
+          And changing the returns or risk-free rate should recompute them
+        """
+        calls = []
+        compute = evaluator._compute_metrics
+
+        def counting_compute(returns, cumulative):
+            calls.append(len(returns))
+            return compute(returns, cumulative)
+
+        monkeypatch.setattr(evaluator, '_compute_metrics', counting_compute)
+
+        first = evaluator.calculate_metrics(sample_trades)
+        first.num_trades = -1
+        second = evaluator.calculate_metrics(sample_trades.copy())
+
+        assert len(calls) == 1
+        assert second.num_trades == 5
+
+        changed = sample_trades.assign(profit_pct=sample_trades['profit_pct'] * 2)
+        evaluator.calculate_metrics(changed)
+        evaluator.risk_free_rate = 0.05
+        evaluator.calculate_metrics(sample_trades)
+
+        assert len(calls) == 3
+
+    def test_calculate_metrics_with_curve(self, evaluator, sample_trades):
+        """
+        Test that metrics are returned with the cumulative returns behind them.
+
+        Scenario: Calculate metrics and the cumulative return curve together
+          Given I have a trade history
+          When I calculate the metrics with their curve
+          Then the curve should be the read-only compounded returns
+          And its last value should be the total return
+        """
+        metrics, cumulative = evaluator.calculate_metrics_with_curve(sample_trades)
+
+        expected = cumulative_returns(sample_trades['profit_pct'].to_numpy())
+        np.testing.assert_allclose(cumulative, expected)
+        assert not cumulative.flags.writeable
+        assert metrics.total_return == cumulative[-1]
+        assert evaluator.calculate_metrics_with_curve(sample_trades)[1] is cumulative
+
+    def test_metrics_cache_is_bounded(self, evaluator, monkeypatch):
+        """
+        Test that the metrics cache evicts the least recently used entries.
+
+        Scenario: Evaluate more distinct trade histories than the cache holds
+          Given the cache holds two entries
+          When I evaluate three distinct trade histories
+          Then only the two most recent should stay cached
+        """
+        import abidance.evaluation.metrics as metrics_module
+
+        monkeypatch.setattr(metrics_module, 'METRICS_CACHE_SIZE', 2)
+        histories = [pd.DataFrame({'profit_pct': [0.01 * i, -0.01]}) for i in range(1, 4)]
+        for trades in histories:
+            evaluator.calculate_metrics(trades)
+
+        assert len(evaluator._cache) == 2
+        assert evaluator._cache_key(histories[0]['profit_pct'].to_numpy()) not in evaluator._cache
+
+
+class TestReturnHelpers:
+    """Test suite for the return series helpers."""
+
+    def test_matches_compounded_product(self):
+        """
+        Test that cumulative returns match the running product of growth factors.
+
+        Scenario: Compound a series of returns
+          Given I have per-trade returns
+          When I calculate cumulative returns
+          Then each value should equal the compounded product minus one
+        """
+        returns = np.array([0.02, -0.01, 0.03, -0.02, 0.04])
+
+        np.testing.assert_allclose(cumulative_returns(returns), (1 + returns).cumprod() - 1)
+
+    def test_long_series_stays_finite(self):
+        """
+        Test that long series of small returns keep their precision.
+
+        Scenario: Compound many tiny returns
+          Given I have a long series of very small returns
+          When I calculate cumulative returns
+          Then the final value should match the closed-form compounded return
+        """
+        returns = np.full(100_000, 1e-9)
+
+        assert np.isclose(cumulative_returns(returns)[-1], np.expm1(100_000 * np.log1p(1e-9)),
+                          rtol=1e-9, atol=0)
+
+    def test_total_loss_stays_finite(self):
+        """
+        Test that losses of 100% or more compound like the running product.
+
+        Scenario: Compound a series with a loss beyond -100%
+          Given I have per-trade returns including -1.0 and -1.1
+          When I calculate cumulative returns
+          Then the values should be finite and match the compounded product
+          And no warning should be emitted
+        """
+        for returns in (np.array([0.1, -1.2, 0.05]), np.array([0.1, -1.0, 0.05])):
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                result = cumulative_returns(returns)
+
+            assert np.isfinite(result).all()
+            np.testing.assert_allclose(result, (1 + returns).cumprod() - 1)
+
+        metrics = StrategyEvaluator().calculate_metrics(pd.DataFrame({'profit_pct': [0.1, -1.2, 0.05]}))
+        assert metrics.total_return == pytest.approx(-1.231)
+        assert metrics.max_drawdown == pytest.approx(1.21)
+
+    def test_trade_returns_are_contiguous_float64(self):
+        """
+        Test that trade returns are extracted as a contiguous float64 array.
+
+        Scenario: Extract returns from an integer column
+          Given I have trades whose returns are stored as integers
+          When I extract the trade returns
+          Then I should get a C-contiguous float64 array
+        """
+        returns = trade_returns(pd.DataFrame({'profit_pct': [1, 0, -1]}))
+
+        assert returns.dtype == np.float64
+        assert returns.flags['C_CONTIGUOUS']
+        np.testing.assert_array_equal(returns, [1.0, 0.0, -1.0])
+
@@ -11,7 +11,7 @@ import matplotlib.pyplot as plt
 from pathlib import Path
 
 from abidance.evaluation.reporting import PerformanceReport
-from abidance.evaluation.metrics import PerformanceMetrics
+from abidance.evaluation.metrics import PerformanceMetrics, trade_returns
 
 
 class TestPerformanceReport:
@@ -138,6 +138,63 @@ class TestPerformanceReport:
         assert "metrics" in saved_data
         assert "equity_curve" in saved_data
     
+    def test_save_report_without_orjson(self, report_generator, sample_trades, monkeypatch):
+        """
+        Test saving reports with the standard library JSON encoder.
+
+        Scenario: Save performance report when orjson is not installed
+          Given I have generated a performance report
+          When I save the report without orjson available
+          Then the file should contain the same report data
+        """
+        import abidance.evaluation.reporting as reporting
+
+        report_data = report_generator.generate_report(
+            trades=sample_trades,
+            strategy_name="Test Strategy"
+        )
+        default_path = report_generator.save_report(report_data, filename="default.json")
+        monkeypatch.setattr(reporting, 'orjson', None)
+        fallback_path = report_generator.save_report(report_data, filename="fallback.json")
+
+        with open(default_path, 'r') as f:
+            default_data = json.load(f)
+        with open(fallback_path, 'r') as f:
+            fallback_data = json.load(f)
+
+        assert default_data == fallback_data
+        assert fallback_data["equity_curve"]["equity"]["1"] == pytest.approx(1.02)
+
+    def test_save_report_all_winning_trades(self, report_generator, monkeypatch):
+        """
+        Test that an infinite profit factor is saved the same way by both writers.
+
+        Scenario: Save a report for a strategy without losing trades
+          Given I have generated a report whose profit factor is infinite
+          When I save it with and without orjson available
+          Then both files should store the profit factor as Infinity
+        """
+        import abidance.evaluation.reporting as reporting
+
+        trades = pd.DataFrame({
+            'date': [datetime(2023, 1, 1), datetime(2023, 1, 2)],
+            'profit_pct': [0.02, 0.03]
+        })
+        report_data = report_generator.generate_report(trades=trades, strategy_name="Winner")
+        assert report_data["metrics"]["profit_factor"] == float('inf')
+
+        default_path = report_generator.save_report(report_data, filename="winner.json")
+        monkeypatch.setattr(reporting, 'orjson', None)
+        fallback_path = report_generator.save_report(report_data, filename="winner_json.json")
+
+        with open(default_path, 'r') as f:
+            default_data = json.load(f)
+        with open(fallback_path, 'r') as f:
+            fallback_data = json.load(f)
+
+        assert default_data["metrics"]["profit_factor"] == float('inf')
+        assert default_data == fallback_data
+
     def test_save_report_auto_filename(self, report_generator, sample_trades, test_output_dir):
         """
         Test automatic filename generation when saving reports.
@@ -238,4 +295,81 @@ class TestPerformanceReport:
         assert metrics_dict["win_rate"] == 0.6
         assert metrics_dict["profit_factor"] == 1.5
         assert metrics_dict["avg_trade"] == 0.02
-        assert metrics_dict["num_trades"] == 50 
\ No newline at end of file
+        assert metrics_dict["num_trades"] == 50
+
+    def test_make_serializable(self, report_generator):
+        """
+        Test conversion of report values to JSON-compatible types.
+
+        Scenario: Serialize NumPy and pandas values
+          Given I have report data with arrays, NumPy scalars and a DataFrame
+          When I make it serializable
+          Then every value should be a plain Python type
+        """
+        data = {
+            'array': np.array([1.5, 2.5]),
+            'scalars': (np.int32(3), np.float32(0.5), np.bool_(True)),
+            'frame': pd.DataFrame({'equity': [1.0, 1.1]}, index=[1, 2]),
+            'date': datetime(2023, 1, 1),
+        }
+
+        result = report_generator._make_serializable(data)
+
+        assert result['array'] == [1.5, 2.5]
+        assert result['scalars'] == [3, 0.5, True]
+        assert all(type(value) in (int, float, bool) for value in result['scalars'])
+        assert result['frame'] == {'index': [1, 2], 'columns': ['equity'], 'data': [[1.0], [1.1]]}
+        assert result['date'] == '2023-01-01T00:00:00'
+        json.dumps(result)
+
+    def test_equity_curve_sorts_unordered_trades(self, report_generator):
+        """
+        Test that precomputed returns are not reused for out-of-order trades.
+
+        Scenario: Generate an equity curve from trades out of date order
+          Given I have trades whose dates are not sorted
+          When I generate the equity curve with their returns precomputed
+          Then the curve should still compound the returns in date order
+        """
+        trades = pd.DataFrame({
+            'date': [datetime(2023, 1, 2), datetime(2023, 1, 1)],
+            'profit_pct': [0.5, -0.5]
+        })
+
+        curve = report_generator._generate_equity_curve(trades, returns=trade_returns(trades))
+
+        assert curve['equity'].tolist() == pytest.approx([0.5, 0.75])
+
+    def test_equity_curve_dtype(self, report_generator, sample_trades):
+        """
+        Test that the equity column can be stored in reduced precision.
+
+        Scenario: Generate an equity curve for plotting
+          Given I have a trade history
+          When I generate the equity curve as float32
+          Then it should match the float64 curve to float32 precision
+        """
+        full = report_generator._generate_equity_curve(sample_trades)
+        reduced = report_generator._generate_equity_curve(sample_trades, dtype=np.float32)
+
+        assert full['equity'].dtype == np.float64
+        assert reduced['equity'].dtype == np.float32
+        np.testing.assert_allclose(reduced['equity'], full['equity'], rtol=1e-6)
+
+    def test_calculate_drawdowns(self, report_generator):
+        """
+        Test drawdown calculation from an equity series.
+
+        Scenario: Calculate drawdowns below the running peak
+          Given I have an equity series that rises, falls and recovers
+          When I calculate the drawdowns
+          Then each value should be the fractional distance below the running peak
+        """
+        equity = pd.Series([1.0, 1.2, 0.9, 1.3], index=[1, 2, 3, 4], name='equity')
+
+        drawdowns = report_generator._calculate_drawdowns(equity)
+
+        pd.testing.assert_series_equal(
+            drawdowns, pd.Series([0.0, 0.0, -0.25, 0.0], index=[1, 2, 3, 4], name='equity')
+        )
+
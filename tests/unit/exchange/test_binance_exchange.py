@@ -0,0 +1,47 @@
+"""
+Tests for the BinanceExchange order translation.
+"""
+from abidance.exchange.binance import BinanceExchange
+from abidance.trading.order import Order, OrderSide, OrderType
+
+
+class TestBinancePlaceOrder:
+    """Tests for BinanceExchange.place_order."""
+
+    def test_place_order_translates_type_side_and_fee_currency(self):
+        """Test that order type, side and quote currency are mapped to Binance values."""
+        exchange = BinanceExchange(testnet=True)
+        order = Order(
+            symbol="ETH/USDT",
+            side=OrderSide.SELL,
+            order_type=OrderType.LIMIT,
+            quantity=2.0,
+            price=3000.0
+        )
+
+        result = exchange.place_order(order)
+
+        assert result["success"] is True
+        assert result["type"] == "LIMIT"
+        assert result["side"] == "SELL"
+        assert result["fee_currency"] == "USDT"
+
+    def test_place_order_without_quote_currency(self):
+        """Test that a symbol without a separator yields an empty fee currency."""
+        exchange = BinanceExchange(testnet=True)
+        order = Order(
+            symbol="BTCUSDT",
+            side=OrderSide.BUY,
+            order_type=OrderType.MARKET,
+            quantity=1.0
+        )
+
+        assert exchange.place_order(order)["fee_currency"] == ""
+
+    def test_instances_have_no_dict(self):
+        """Test that BinanceExchange stores its attributes in slots."""
+        exchange = BinanceExchange(api_key="key", testnet=True)
+
+        assert not hasattr(exchange, "__dict__")
+        assert exchange.api_key == "key"
+        assert exchange.exchange_id == "binance"
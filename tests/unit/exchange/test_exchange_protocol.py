@@ -5,6 +5,7 @@ import pytest
 from typing import Dict, Any
 
 from abidance.exchange.protocols import Exchange, ExchangeFactory
+from abidance.exchange.base import Exchange as ExchangeBase
 from abidance.exchange.binance import BinanceExchange
 from abidance.exchange.factory import create_exchange
 
@@ -90,4 +91,13 @@ class TestExchangeImplementations:
         assert callable(getattr(exchange, "place_order", None))
         assert callable(getattr(exchange, "cancel_order", None))
         assert callable(getattr(exchange, "get_order_status", None))
-        assert callable(getattr(exchange, "get_open_orders", None)) 
\ No newline at end of file
+        assert callable(getattr(exchange, "get_open_orders", None))
+
+    def test_base_class_methods_raise_not_implemented(self):
+        """Test that the Exchange base class leaves its methods to subclasses."""
+        exchange = ExchangeBase(testnet=True)
+
+        with pytest.raises(NotImplementedError):
+            exchange.get_ticker("BTC/USDT")
+        with pytest.raises(NotImplementedError):
+            exchange.get_open_orders()
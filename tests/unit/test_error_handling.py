@@ -2,6 +2,8 @@
 Tests for the error handling utilities in the Abidance exceptions module.
 """
 
+import importlib
+import logging
 import pytest
 import time
 from unittest.mock import MagicMock, patch
@@ -12,6 +14,11 @@ from abidance.exceptions import (
 )
 
 
+def _flaky_exchange_call():
+    """Module-level function for the shared circuit breaker test."""
+    raise ValueError("Test error")
+
+
 class TestErrorContext:
     """Tests for the ErrorContext class."""
     
@@ -92,6 +99,33 @@ class TestErrorContext:
         assert hasattr(enriched, 'operation')
         assert enriched.operation == "test_operation"
 
+    def test_slots_reject_unknown_attributes(self):
+        """Test that ErrorContext instances carry no per-instance __dict__."""
+        ctx = ErrorContext()
+        assert not hasattr(ctx, '__dict__')
+        with pytest.raises(AttributeError):
+            ctx.unknown = "value"
+
+    def test_stack_trace_capture_is_gated(self):
+        """Test that the stack trace is only formatted when enabled or forced."""
+        module = importlib.import_module('abidance.exceptions.error_context')
+
+        with patch.object(module, '_CAPTURE_STACK', False), \
+                patch.object(module.logger, 'isEnabledFor', return_value=False):
+            try:
+                raise ValueError("Test error")
+            except ValueError:
+                assert ErrorContext().capture_stack_trace().stack_trace is None
+                forced = ErrorContext().capture_stack_trace(force=True)
+
+        assert "ValueError: Test error" in forced.stack_trace
+
+        with patch.object(module, '_CAPTURE_STACK', True):
+            try:
+                raise ValueError("Test error")
+            except ValueError:
+                assert ErrorContext().capture_stack_trace().stack_trace is not None
+
 
 class TestErrorBoundary:
     """Tests for the error_boundary context manager."""
@@ -143,6 +177,19 @@ class TestErrorBoundary:
         
         assert "Transformed: " in str(excinfo.value)
     
+    def test_abidance_error_reraised_unchanged(self):
+        """Test that an AbidanceError with nothing to attach is re-raised as is."""
+        original = DataError("Original error")
+        original.context = {"inner": "value"}
+
+        with pytest.raises(DataError) as excinfo:
+            with error_boundary():
+                raise original
+
+        assert excinfo.value is original
+        assert excinfo.value.__cause__ is None
+        assert excinfo.value.context == {"inner": "value"}
+
     def test_no_reraise(self):
         """Test the context manager with reraise=False."""
         result = None
@@ -203,7 +250,7 @@ class TestRetryDecorator:
         mock_func = MagicMock(side_effect=[ValueError(), ValueError(), ValueError(), "success"])
         
         with patch('time.sleep', mock_sleep):
-            decorated = retry(max_attempts=4, delay=1.0, backoff_factor=2.0)(mock_func)
+            decorated = retry(max_attempts=4, delay=1.0, backoff_factor=2.0, jitter=0.0)(mock_func)
             try:
                 decorated()
             except ValueError:
@@ -214,6 +261,20 @@ class TestRetryDecorator:
         calls = mock_sleep.call_args_list
         assert calls[0][0][0] == 1.0
         assert calls[1][0][0] == 2.0  # Second delay should be 2x the first
+
+    def test_backoff_jitter_and_cap(self):
+        """Test that delays are capped at max_delay and spread by jitter."""
+        mock_sleep = MagicMock()
+        mock_func = MagicMock(side_effect=[ValueError()] * 4 + ["success"])
+
+        with patch('time.sleep', mock_sleep), patch('random.uniform', return_value=0.25) as mock_uniform:
+            decorated = retry(max_attempts=5, delay=1.0, backoff_factor=10.0,
+                              max_delay=30.0, jitter=0.5)(mock_func)
+            assert decorated() == "success"
+
+        mock_uniform.assert_called_with(-0.5, 0.5)
+        delays = [c[0][0] for c in mock_sleep.call_args_list]
+        assert delays == [1.25, 12.5, 37.5, 37.5]
     
     def test_should_retry_function(self):
         """Test the should_retry callback function."""
@@ -304,6 +365,20 @@ class TestFallbackDecorator:
         assert mock_log.called
 
 
+    @patch('logging.Logger.log')
+    def test_error_logging_skipped_when_level_disabled(self, mock_log):
+        """Test that nothing is formatted or logged when the level is disabled."""
+        mock_func = MagicMock(side_effect=ValueError("Test error"))
+        decorated = fallback(
+            default_value="default",
+            log_level=logging.DEBUG
+        )(mock_func)
+
+        with patch('logging.Logger.isEnabledFor', return_value=False):
+            assert decorated() == "default"
+        mock_log.assert_not_called()
+
+
 class TestCircuitBreaker:
     """Tests for the CircuitBreaker class."""
     
@@ -329,7 +404,7 @@ class TestCircuitBreaker:
     
     def test_circuit_opens_after_failures(self):
         """Test that circuit opens after reaching the failure threshold."""
-        with patch('time.time', return_value=100):
+        with patch('time.monotonic', return_value=100.0):
             circuit = CircuitBreaker(
                 failure_threshold=3,
                 recovery_timeout=60,
@@ -420,6 +495,90 @@ class TestCircuitBreaker:
         circuit.execute(mock_func)
         on_close.assert_called_once()
     
+    def test_spaced_out_failures_do_not_open(self):
+        """Test that failures slower than the refill rate keep the circuit closed."""
+        with patch('time.monotonic', return_value=0.0) as clock:
+            circuit = CircuitBreaker(
+                failure_threshold=2,
+                recovery_timeout=10,
+                fallback_value="fallback"
+            )
+            mock_func = MagicMock(side_effect=ValueError("Test error"))
+
+            # One failure per recovery_timeout never drains the bucket
+            for tick in range(5):
+                clock.return_value = tick * 10.0
+                with pytest.raises(ValueError):
+                    circuit.execute(mock_func)
+                assert circuit.state == CircuitBreaker.CLOSED
+
+            # A quick second failure does
+            assert circuit.execute(mock_func) == "fallback"
+            assert circuit.state == CircuitBreaker.OPEN
+
+    def test_zero_recovery_timeout(self):
+        """Test that a zero recovery timeout lets the next call probe straight away."""
+        with patch('time.monotonic', return_value=100.0) as clock:
+            circuit = CircuitBreaker(
+                failure_threshold=1,
+                recovery_timeout=0,
+                fallback_value="fallback"
+            )
+            mock_func = MagicMock(side_effect=[ValueError("Test error"), "success"])
+
+            assert circuit.execute(mock_func) == "fallback"
+            assert circuit.state == CircuitBreaker.OPEN
+
+            clock.return_value = 100.001
+            assert circuit.execute(mock_func) == "success"
+            assert circuit.state == CircuitBreaker.CLOSED
+
+    def test_error_types_normalized_to_tuple(self):
+        """Test that error_types is stored as a tuple for the except clause."""
+        assert CircuitBreaker(error_types=ValueError).error_types == (ValueError,)
+        assert CircuitBreaker(
+            error_types=[ValueError, KeyError]
+        ).error_types == (ValueError, KeyError)
+
+    def test_shared_breakers_share_state(self):
+        """Test that shared breakers decorating one function share state."""
+        module = importlib.import_module('abidance.exceptions.fallback')
+
+        with patch.dict(module._CB_REGISTRY, clear=True):
+            first = CircuitBreaker(failure_threshold=2, fallback_value="fallback", shared=True)
+            second = CircuitBreaker(failure_threshold=2, fallback_value="fallback", shared=True)
+            first_call = first(_flaky_exchange_call)
+            second_call = second(_flaky_exchange_call)
+
+            with pytest.raises(ValueError):
+                first_call()
+            # The second failure lands on the same breaker and opens it
+            assert second_call() == "fallback"
+            assert first.state == CircuitBreaker.OPEN
+
+    def test_breakers_are_independent_by_default(self):
+        """Test that breakers not marked shared keep their own state and settings."""
+        module = importlib.import_module('abidance.exceptions.fallback')
+
+        with patch.dict(module._CB_REGISTRY, clear=True):
+            CircuitBreaker(1, fallback_value="A")(_flaky_exchange_call)
+            circuit = CircuitBreaker(1, fallback_value="B", error_types=KeyError)
+
+            with pytest.raises(ValueError):
+                circuit(_flaky_exchange_call)()
+            assert circuit.state == CircuitBreaker.CLOSED
+            assert module._CB_REGISTRY == {}
+
+    def test_shared_breaker_config_mismatch(self):
+        """Test that sharing a function between differently configured breakers is refused."""
+        module = importlib.import_module('abidance.exceptions.fallback')
+
+        with patch.dict(module._CB_REGISTRY, clear=True):
+            CircuitBreaker(1, fallback_value="A", shared=True)(_flaky_exchange_call)
+
+            with pytest.raises(ValueError, match="different configuration"):
+                CircuitBreaker(1, fallback_value="B", shared=True)(_flaky_exchange_call)
+
     def test_circuit_open_error(self):
         """Test that CircuitOpenError is raised when no fallback is provided."""
         circuit = CircuitBreaker(failure_threshold=1)
@@ -429,4 +588,26 @@ class TestCircuitBreaker:
         # Fail to open the circuit
         with pytest.raises(CircuitOpenError):
             circuit.execute(mock_func)
-            circuit.execute(mock_func)  # This should raise CircuitOpenError 
\ No newline at end of file
+            circuit.execute(mock_func)  # This should raise CircuitOpenError
+
+
+class TestExceptionHierarchy:
+    """Tests for the exception classes exported by the exceptions module."""
+
+    def test_exports_are_unique_and_defined_once(self):
+        """Test that every exported exception is declared once and derives from AbidanceError."""
+        exceptions = importlib.import_module('abidance.exceptions')
+
+        assert len(exceptions.__all__) == len(set(exceptions.__all__))
+
+        classes = {}
+        for name in exceptions.__all__:
+            obj = getattr(exceptions, name)
+            if isinstance(obj, type) and issubclass(obj, BaseException):
+                assert issubclass(obj, AbidanceError), name
+                classes.setdefault(obj.__name__, set()).add(obj)
+
+        # Aliases such as ConfigurationError point at the same class object
+        assert all(len(objs) == 1 for objs in classes.values())
+        assert exceptions.ConfigurationError is exceptions.ConfigError
+